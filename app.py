@@ -12,16 +12,42 @@ NEW FEATURES:
 - Current date focus: Prioritizes today's signals but supports historical/future date trading
 - Regular channel runs: Automatically updates CSV files and runs channel code regularly
 """
+import io
 import os
+import re
+import csv
+import sys
 import json
+import array
 import time
+import zlib
 import asyncio
 import logging
-import pandas as pd
+import numpy as np
+from dataclasses import dataclass
+from functools import lru_cache
 from datetime import datetime, timedelta, timezone
-from typing import Dict, List, Any, Tuple
+from operator import itemgetter, mul
+from itertools import accumulate
+from typing import Dict, List, Any, Tuple, Callable, Awaitable
 from dotenv import load_dotenv
 
+# Optional: inotify-backed file watching so idle loops wake on CSV changes instead of polling
+try:
+    from watchdog.observers import Observer
+    from watchdog.events import FileSystemEventHandler
+except ImportError:
+    Observer = None
+    FileSystemEventHandler = object
+
+# Optional: Arrow's multithreaded CSV reader for signal files (pandas C parser is used otherwise)
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+    import pyarrow.compute as pc
+except ImportError:
+    pa = None
+
 # Import PocketOption API
 from pocketoptionapi_async import AsyncPocketOptionClient
 from pocketoptionapi_async.models import OrderDirection, OrderStatus
@@ -36,6 +62,15 @@ logger = logging.getLogger(__name__)
 # Global timezone setting - will be configured by user input
 USER_TIMEZONE = None
 
+# Signal CSV columns actually used by the trader, with explicit dtypes to skip type inference
+SIGNAL_CSV_DTYPES = {
+    'is_signal': 'category',
+    'asset': 'category',
+    'direction': 'category',
+    'signal_time': str,
+    'message_text': str,
+}
+
 def set_user_timezone(timezone_offset: float):
     """Set user timezone from offset (e.g., 6.0 for UTC+6, -5.0 for UTC-5)"""
     global USER_TIMEZONE
@@ -77,6 +112,32 @@ def format_time_remaining(current_time: datetime, signal_time: datetime) -> str:
     else:
         return f"{seconds}s"
 
+# Idle polling: wake shortly before the next signal (or on a CSV change), never sleep longer than the cap or shorter than the floor
+# (the floor is the poll interval inside the final lead window - tune it for firing precision vs wakeups)
+IDLE_POLL_MIN_SECONDS = 0.05
+IDLE_POLL_MAX_SECONDS = 30.0
+IDLE_POLL_LEAD_SECONDS = 0.2
+
+def idle_poll_delay(next_wait: float) -> float:
+    """Seconds to sleep while idle, given seconds until the next signal"""
+    return max(IDLE_POLL_MIN_SECONDS, min(next_wait - IDLE_POLL_LEAD_SECONDS, IDLE_POLL_MAX_SECONDS))
+
+# Pause between Option 2 martingale steps (0 = just yield to the event loop, no timer)
+MARTINGALE_STEP_DELAY_SECONDS = 0.0
+
+def martingale_amounts(base_amount: float, multiplier: float, n: int) -> List[float]:
+    """First n martingale amounts: base_amount, base_amount*multiplier, ... (one running product)"""
+    return list(accumulate([base_amount] + [multiplier] * (n - 1), mul))
+
+# Processed-signal keys remembered per trading loop (oldest are evicted first)
+PROCESSED_SIGNALS_MAX = 512
+
+def mark_processed(processed: Dict[Tuple, None], key: Tuple):
+    """Record key in an insertion-ordered processed-signal dict, evicting the oldest past the cap"""
+    processed[key] = None
+    if len(processed) > PROCESSED_SIGNALS_MAX:
+        del processed[next(iter(processed))]
+
 def get_timezone_name() -> str:
     """Get timezone name for display"""
     if USER_TIMEZONE is None:
@@ -84,21 +145,124 @@ def get_timezone_name() -> str:
     offset = USER_TIMEZONE.utcoffset(get_user_time()).total_seconds() / 3600
     return f"UTC{offset:+.1f}"
 
+@dataclass(slots=True)
+class Signal:
+    """Trading signal scheduled for execution (from CSV, or built ad hoc for a precise first step)"""
+    asset: str
+    direction: str
+    signal_datetime: datetime
+    trade_datetime: datetime
+    close_datetime: datetime
+    channel: str = None
+    duration: int = 300  # Fallback when the channel has no configured duration (5:00)
+    signal_time: str = ''
+    execute_ts: int = 0  # Epoch seconds of trade_datetime, for per-tick compares
+    timestamp: str = ''
+    message_text: str = ''
+    date_filter: str = ''
+    
+    @classmethod
+    def immediate(cls, asset: str, direction: str, duration: int, channel: str = None) -> 'Signal':
+        """Signal for a trade placed right now (one clock read shared by all its datetimes)"""
+        now = get_user_time()
+        return cls(
+            asset=asset,
+            direction=direction,
+            signal_datetime=now,
+            trade_datetime=now,
+            close_datetime=now + timedelta(seconds=duration),
+            channel=channel,
+            duration=duration
+        )
+
+@dataclass(slots=True)
+class GlobalCycleTracker:
+    """Option 2 global cycle state shared by all assets"""
+    base_amount: float
+    multiplier: float
+    cycle_1_last_amount: float
+    current_cycle: int = 1  # Global cycle: 1, 2, or 3
+    amounts: Tuple[Tuple[float, ...], ...] = ()  # Trade amount per [cycle - 1][step - 1]
+    generation: int = 0  # Bumped whenever every asset goes back to Step 1
+    
+    def __post_init__(self):
+        self.set_cycle_1_last_amount(self.cycle_1_last_amount)
+    
+    def set_cycle_1_last_amount(self, amount: float):
+        """Store Cycle 1's last amount and rebuild the step amount table from it"""
+        self.cycle_1_last_amount = amount
+        multiplier = self.multiplier
+        # Cycle 1: normal 3-step martingale; Cycles 2 and 3 continue from Cycle 1's last amount (capped risk)
+        cycle_1 = tuple(self.base_amount * (multiplier ** i) for i in range(3))
+        cycle_2_step1 = amount * multiplier
+        cycle_2 = tuple(cycle_2_step1 * (multiplier ** i) for i in range(3))
+        self.amounts = (cycle_1, cycle_2, cycle_2)
+    
+    def reset_asset_steps(self):
+        """Send every asset back to Step 1 (trackers catch up lazily on their next sync)"""
+        self.generation += 1
+
+@dataclass(slots=True)
+class AssetTracker:
+    """Option 2 per-asset step within the current global cycle"""
+    current_step: int = 1
+    generation: int = 0  # GlobalCycleTracker.generation this step belongs to
+    
+    def sync(self, generation: int):
+        """Restart at Step 1 if asset steps were reset globally since this tracker last ran"""
+        if self.generation != generation:
+            self.generation = generation
+            self.current_step = 1
+
+class _AssetState:
+    """Per-asset martingale state: current cycle/step and amounts used in the sequence"""
+    __slots__ = ('cycle', 'step', 'amounts', 'n')
+    
+    MAX_AMOUNTS = 3  # Only the first steps' amounts are ever read back
+    
+    def __init__(self, cycle: int = 1, step: int = 1):
+        self.cycle = cycle
+        self.step = step
+        self.amounts = array.array('d', (0.0,) * self.MAX_AMOUNTS)
+        self.n = 0  # Number of recorded amounts
+    
+    def record_amount(self, amount: float):
+        """Record amount used into the fixed-size buffer (extra amounts are dropped)"""
+        if self.n < self.MAX_AMOUNTS:
+            self.amounts[self.n] = amount
+            self.n += 1
+
+# Read-only state returned for assets that are not tracked yet (never mutate)
+_DEFAULT_ASSET_STATE = _AssetState()
+
 class MultiAssetMartingaleStrategy:
     """Multi-asset martingale strategy with immediate step progression"""
     
+    __slots__ = ('base_amount', 'multiplier', 'max_steps', 'asset_strategies',
+                 '_asset_idx', '_steps', '_asset_names', '_in_seq', '_amt', '_locks')
+    
     def __init__(self, base_amount: float, multiplier: float = 2.5):
         self.base_amount = base_amount
         self.multiplier = multiplier
         self.max_steps = 3
         
         # Track each asset separately
-        self.asset_strategies = {}  # {asset: {'step': 1, 'amounts': []}}
+        self.asset_strategies: Dict[str, _AssetState] = {}
+        
+        # Per-asset locks so concurrently running sequences never interleave on one asset
+        self._locks: Dict[str, asyncio.Lock] = {}
+        
+        # Structure-of-arrays mirror of asset steps for vectorized queries
+        self._asset_idx: Dict[str, int] = {}
+        self._steps = np.ones(0, dtype=np.int8)
+        self._asset_names = np.array([], dtype=object)
+        self._in_seq: Dict[str, None] = {}  # Insertion-ordered set of assets past Step 1
+        
+        # Step amount lookup table (1-indexed by step)
+        self._amt = (base_amount, base_amount, base_amount * multiplier, base_amount * multiplier * multiplier)
         
         # Calculate step amounts for display
-        step1 = base_amount
-        step2 = step1 * multiplier
-        step3 = step2 * multiplier
+        step1, step2, step3 = self._amt[1:]
         
         print(f"🎯 Multi-Asset Martingale Strategy")
         print(f"   Base Amount: ${base_amount}")
@@ -110,67 +274,83 @@ class MultiAssetMartingaleStrategy:
         print(f"     Step 3: ${step3:.2f} (${step2:.2f} × {multiplier})")
         print(f"   Strategy: Immediate step progression + parallel assets")
     
+    def asset_lock(self, asset: str) -> asyncio.Lock:
+        """Get the lock serializing martingale sequences on asset"""
+        lock = self._locks.get(asset)
+        if lock is None:
+            lock = self._locks[asset] = asyncio.Lock()
+        return lock
+    
+    def ensure_asset(self, asset: str) -> '_AssetState':
+        """Get tracking entry for asset, creating it and growing the step array if new"""
+        strategy = self.asset_strategies.get(asset)
+        if strategy is None:
+            asset = sys.intern(asset)
+            strategy = self.asset_strategies[asset] = _AssetState()
+            self._asset_idx[asset] = len(self._asset_idx)
+            self._steps = np.resize(self._steps, len(self._asset_idx))
+            self._steps[-1] = 1
+            self._asset_names = np.array(list(self._asset_idx), dtype=object)
+        return strategy
+    
+    def _sync_asset(self, asset: str):
+        """Mirror asset step into the step array and in-sequence set after a mutation"""
+        step = self.asset_strategies[asset].step
+        self._steps[self._asset_idx[asset]] = step
+        if step > 1:
+            self._in_seq[asset] = None
+        else:
+            self._in_seq.pop(asset, None)
+    
+    def _peek(self, asset: str) -> _AssetState:
+        """Get asset state without creating it - untracked assets read as Step 1"""
+        return self.asset_strategies.get(asset) or _DEFAULT_ASSET_STATE
+    
+    def reset_asset(self, asset: str):
+        """Reset asset back to Step 1"""
+        strategy = self.ensure_asset(asset)
+        strategy.step = 1
+        strategy.n = 0
+        self._sync_asset(asset)
+    
     def get_asset_step(self, asset: str) -> int:
         """Get current step for specific asset"""
-        if asset not in self.asset_strategies:
-            self.asset_strategies[asset] = {'step': 1, 'amounts': []}
-        return self.asset_strategies[asset]['step']
+        return self._peek(asset).step
     
     def get_current_amount(self, asset: str) -> float:
         """Get current trade amount for specific asset based on its step"""
-        if asset not in self.asset_strategies:
-            self.asset_strategies[asset] = {'step': 1, 'amounts': []}
-        
-        strategy = self.asset_strategies[asset]
-        step = strategy['step']
-        amounts = strategy['amounts']
-        
-        if step == 1:
-            return self.base_amount
-        elif step == 2:
-            # Step 2 = Step 1 amount × multiplier
-            if len(amounts) > 0:
-                return amounts[0] * self.multiplier
-            else:
-                return self.base_amount * self.multiplier
-        elif step == 3:
-            # Step 3 = Step 2 amount × multiplier
-            if len(amounts) > 1:
-                return amounts[1] * self.multiplier
-            else:
-                # If no Step 2 amount recorded, calculate: (Step 1 × multiplier) × multiplier
-                step2_amount = self.base_amount * self.multiplier
-                return step2_amount * self.multiplier
-        else:
-            return self.base_amount
+        strategy = self._peek(asset)
+        step = strategy.step
+        if step == 1 or step > self.max_steps:
+            return self.base_amount  # Step 1, or past max step falls back to base
+        
+        # Step N = recorded Step N-1 amount (else table amount) × multiplier - one index, one multiply
+        prev = step - 2
+        return (strategy.amounts[prev] if strategy.n > prev else self._amt[step - 1]) * self.multiplier
     
     def record_result(self, won: bool, asset: str, trade_amount: float) -> Dict[str, Any]:
         """Record trade result and return next action"""
-        if asset not in self.asset_strategies:
-            self.asset_strategies[asset] = {'step': 1, 'amounts': []}
-        
-        strategy = self.asset_strategies[asset]
+        strategy = self.ensure_asset(asset)
         
         # Record amount used
-        if len(strategy['amounts']) < strategy['step']:
-            strategy['amounts'].append(trade_amount)
+        if strategy.n < strategy.step:
+            strategy.record_amount(trade_amount)
         
         if won:
-            print(f"✅ {asset} WIN at Step {strategy['step']}! Resetting to Step 1")
-            strategy['step'] = 1
-            strategy['amounts'] = []
+            print(f"✅ {asset} WIN at Step {strategy.step}! Resetting to Step 1")
+            self.reset_asset(asset)
             return {'action': 'reset', 'asset': asset, 'next_step': 1}
         else:
-            print(f"❌ {asset} LOSS at Step {strategy['step']}! Moving to Step {strategy['step'] + 1}")
-            strategy['step'] += 1
+            print(f"❌ {asset} LOSS at Step {strategy.step}! Moving to Step {strategy.step + 1}")
+            strategy.step += 1
             
-            if strategy['step'] > self.max_steps:
+            if strategy.step > self.max_steps:
                 print(f"🚨 {asset} - All {self.max_steps} steps lost! Resetting to Step 1")
-                strategy['step'] = 1
-                strategy['amounts'] = []
+                self.reset_asset(asset)
                 return {'action': 'reset_after_max_loss', 'asset': asset, 'next_step': 1}
             else:
-                return {'action': 'continue', 'asset': asset, 'next_step': strategy['step']}
+                self._sync_asset(asset)
+                return {'action': 'continue', 'asset': asset, 'next_step': strategy.step}
     
     def get_status(self, asset: str) -> str:
         """Get current strategy status for specific asset"""
@@ -179,53 +359,41 @@ class MultiAssetMartingaleStrategy:
         
         strategy = self.asset_strategies[asset]
         current_amount = self.get_current_amount(asset)
-        return f"{asset}: Step {strategy['step']}/3 (${current_amount})"
+        return f"{asset}: Step {strategy.step}/3 (${current_amount})"
     
     def get_all_active_assets(self) -> List[str]:
         """Get all assets currently being tracked"""
-        return list(self.asset_strategies.keys())
+        return list(self.asset_strategies)
     
     def should_prioritize_existing_sequences(self) -> bool:
         """Check if any asset is in the middle of a martingale sequence (Step 2 or 3)"""
-        for asset, strategy in self.asset_strategies.items():
-            if strategy['step'] > 1:  # Asset is at Step 2 or 3
-                return True
-        return False
+        return len(self._in_seq) > 0
     
     def show_strategy_status(self):
         """Show current status of all assets"""
         if not self.asset_strategies:
             print("📊 No active asset strategies")
             return
-            
-        print("📊 Current Asset Strategy Status:")
+        
+        # Build the whole block and print it once instead of one print per asset
+        parts = ["📊 Current Asset Strategy Status:"]
         for asset, strategy in self.asset_strategies.items():
-            step = strategy['step']
-            amounts = strategy['amounts']
-            current_amount = self.get_current_amount(asset)
-            
-            if step == 1:
-                status = "✅ Ready for new signal"
-            else:
-                status = f"🔄 In martingale sequence"
-                
-            print(f"   {asset}: Step {step}/3 (${current_amount:.2f}) - {status}")
+            step = strategy.step
+            status = "✅ Ready for new signal" if step == 1 else "🔄 In martingale sequence"
+            parts.append(f"   {asset}: Step {step}/3 (${self.get_current_amount(asset):.2f}) - {status}")
+        print("\n".join(parts))
     
     def get_assets_in_sequence(self) -> List[str]:
         """Get assets that are currently in martingale sequence (Step 2 or 3)"""
-        assets_in_sequence = []
-        for asset, strategy in self.asset_strategies.items():
-            if strategy['step'] > 1:
-                assets_in_sequence.append(asset)
-        return assets_in_sequence
+        return list(self._in_seq)
+    
+    def is_in_sequence(self, asset: str) -> bool:
+        """Check if asset is in martingale sequence (Step 2 or 3) - O(1) lookup in the maintained set"""
+        return asset in self._in_seq
     
     def get_assets_at_step1(self) -> List[str]:
         """Get assets that are at Step 1 (ready for new signals)"""
-        assets_at_step1 = []
-        for asset, strategy in self.asset_strategies.items():
-            if strategy['step'] == 1:
-                assets_at_step1.append(asset)
-        return assets_at_step1
+        return self._asset_names[self._steps == 1].tolist()
 
 class TwoCycleTwoStepMartingaleStrategy:
     """2-Cycle 2-Step Martingale: Cycle progression across different assets"""
@@ -443,6 +611,9 @@ class TwoCycleTwoStepMartingaleStrategy:
 class TwoCycleThreeStepMartingaleStrategy:
     """2-Cycle 3-Step Martingale: 2 cycles with 3 steps, step 4 initial amount is sum of first 3 steps"""
     
+    __slots__ = ('base_amount', 'multiplier', 'max_cycles', 'max_steps_per_cycle', 'max_steps',
+                 'global_cycle', 'global_step', 'asset_strategies')
+    
     def __init__(self, base_amount: float, multiplier: float = 2.5):
         self.base_amount = base_amount
         self.multiplier = multiplier
@@ -681,6 +852,9 @@ class TwoCycleThreeStepMartingaleStrategy:
 class TwoStepMartingaleStrategy:
     """3-Cycle 2-Step Martingale: Cycle progression across different assets"""
     
+    __slots__ = ('base_amount', 'multiplier', 'max_cycles', 'max_steps_per_cycle', 'global_cycle', 'global_step',
+                 'asset_strategies', '_asset_idx', '_steps', '_cycles', '_asset_names', '_in_seq', '_amt')
+    
     def __init__(self, base_amount: float, multiplier: float = 2.5):
         self.base_amount = base_amount
         self.multiplier = multiplier
@@ -692,15 +866,23 @@ class TwoStepMartingaleStrategy:
         self.global_step = 1
         
         # Track each asset separately with cycle and step info
-        self.asset_strategies = {}  # {asset: {'cycle': 1, 'step': 1, 'amounts': []}}
+        self.asset_strategies: Dict[str, _AssetState] = {}
+        
+        # Structure-of-arrays mirror of asset cycle/step for vectorized queries
+        self._asset_idx: Dict[str, int] = {}
+        self._steps = np.ones(0, dtype=np.int8)
+        self._cycles = np.ones(0, dtype=np.int8)
+        self._asset_names = np.array([], dtype=object)
+        self._in_seq: Dict[str, None] = {}  # Insertion-ordered set of assets past C1S1
+        
+        # Amount lookup table indexed [cycle][step] (1-indexed): C{c}S{s} = base × mult^(2(c-1)+(s-1))
+        m = multiplier
+        self._amt = ((None, None, None),) + tuple(
+            (None, base_amount * m ** (2 * c), base_amount * m ** (2 * c + 1)) for c in range(self.max_cycles)
+        )
         
         # Calculate all amounts for display - CORRECTED
-        c1s1 = base_amount                                    # $1.00
-        c1s2 = base_amount * multiplier                       # $2.50
-        c2s1 = base_amount * (multiplier ** 2)               # $6.25
-        c2s2 = base_amount * (multiplier ** 3)               # $15.625
-        c3s1 = base_amount * (multiplier ** 4)               # $39.0625
-        c3s2 = base_amount * (multiplier ** 5)               # $97.65625
+        (_, c1s1, c1s2), (_, c2s1, c2s2), (_, c3s1, c3s2) = self._amt[1:]
         
         print(f"🎯 3-Cycle 2-Step Martingale Strategy (Cross-Asset Progression)")
         print(f"   Base Amount: ${base_amount}")
@@ -714,84 +896,67 @@ class TwoStepMartingaleStrategy:
         print(f"   Strategy: Cycle progression across different assets")
         print(f"   Logic: LOSS at Step 2 → Next asset starts at next cycle")
     
+    def ensure_asset(self, asset: str) -> '_AssetState':
+        """Get tracking entry for asset - new assets start at current global cycle and step"""
+        strategy = self.asset_strategies.get(asset)
+        if strategy is None:
+            asset = sys.intern(asset)
+            strategy = self.asset_strategies[asset] = _AssetState(self.global_cycle, self.global_step)
+            self._asset_idx[asset] = n = len(self._asset_idx)
+            self._steps = np.resize(self._steps, n + 1)
+            self._cycles = np.resize(self._cycles, n + 1)
+            self._asset_names = np.array(list(self._asset_idx), dtype=object)
+            self._sync_asset(asset)
+        return strategy
+    
+    def _sync_asset(self, asset: str):
+        """Mirror asset cycle/step into the arrays and in-sequence set after a mutation"""
+        strategy = self.asset_strategies[asset]
+        i = self._asset_idx[asset]
+        self._steps[i] = strategy.step
+        self._cycles[i] = strategy.cycle
+        if strategy.cycle > 1 or strategy.step > 1:
+            self._in_seq[asset] = None
+        else:
+            self._in_seq.pop(asset, None)
+    
+    def _peek(self, asset: str) -> Tuple[int, int]:
+        """Get (cycle, step) for asset without creating it - untracked assets project to global state"""
+        strategy = self.asset_strategies.get(asset)
+        if strategy is None:
+            return self.global_cycle, self.global_step
+        return strategy.cycle, strategy.step
+    
     def get_asset_step(self, asset: str) -> int:
         """Get current step for specific asset - uses global cycle state for new assets"""
-        if asset not in self.asset_strategies:
-            # New asset starts at current global cycle and step
-            self.asset_strategies[asset] = {
-                'cycle': self.global_cycle, 
-                'step': self.global_step, 
-                'amounts': []
-            }
-        return self.asset_strategies[asset]['step']
+        return self._peek(asset)[1]
     
     def get_asset_cycle(self, asset: str) -> int:
         """Get current cycle for specific asset - uses global cycle state for new assets"""
+        cycle, step = self._peek(asset)
         if asset not in self.asset_strategies:
-            # New asset starts at current global cycle and step
-            print(f"🔍 DEBUG: New asset {asset} starting at global C{self.global_cycle}S{self.global_step}")
-            self.asset_strategies[asset] = {
-                'cycle': self.global_cycle, 
-                'step': self.global_step, 
-                'amounts': []
-            }
+            print(f"🔍 DEBUG: New asset {asset} starting at global C{cycle}S{step}")
         else:
-            print(f"🔍 DEBUG: Existing asset {asset} at C{self.asset_strategies[asset]['cycle']}S{self.asset_strategies[asset]['step']} (global: C{self.global_cycle}S{self.global_step})")
-        return self.asset_strategies[asset]['cycle']
+            print(f"🔍 DEBUG: Existing asset {asset} at C{cycle}S{step} (global: C{self.global_cycle}S{self.global_step})")
+        return cycle
     
     def get_current_amount(self, asset: str) -> float:
         """Get current trade amount for specific asset based on cycle and step"""
-        if asset not in self.asset_strategies:
-            # New asset starts at current global cycle and step
-            self.asset_strategies[asset] = {
-                'cycle': self.global_cycle, 
-                'step': self.global_step, 
-                'amounts': []
-            }
+        cycle, step = self._peek(asset)
         
-        strategy = self.asset_strategies[asset]
-        cycle = strategy['cycle']
-        step = strategy['step']
-        amounts = strategy['amounts']
-        
-        # Calculate amount based on cycle and step - CORRECTED LOGIC
-        if cycle == 1:
-            if step == 1:
-                return self.base_amount  # C1S1: $1.00
-            else:  # step == 2
-                return self.base_amount * self.multiplier  # C1S2: $1.00 × 2.5 = $2.50
-        elif cycle == 2:
-            # C2S1 = C1S2 × multiplier = $2.50 × 2.5 = $6.25
-            # C2S2 = C2S1 × multiplier = $6.25 × 2.5 = $15.625
-            if step == 1:
-                return self.base_amount * (self.multiplier ** 2)  # C2S1: $1 × 2.5² = $6.25
-            else:  # step == 2
-                return self.base_amount * (self.multiplier ** 3)  # C2S2: $1 × 2.5³ = $15.625
-        elif cycle == 3:
-            # C3S1 = C2S2 × multiplier = $15.625 × 2.5 = $39.0625
-            # C3S2 = C3S1 × multiplier = $39.0625 × 2.5 = $97.65625
-            if step == 1:
-                return self.base_amount * (self.multiplier ** 4)  # C3S1: $1 × 2.5⁴ = $39.0625
-            else:  # step == 2
-                return self.base_amount * (self.multiplier ** 5)  # C3S2: $1 × 2.5⁵ = $97.65625
-        else:
-            return self.base_amount
+        # Calculate amount based on cycle and step from the precomputed table
+        if 1 <= cycle <= self.max_cycles:
+            return self._amt[cycle][step]
+        return self.base_amount
     
     def record_result(self, won: bool, asset: str, trade_amount: float) -> Dict[str, Any]:
         """Record trade result and return next action with cross-asset cycle progression"""
-        if asset not in self.asset_strategies:
-            self.asset_strategies[asset] = {
-                'cycle': self.global_cycle, 
-                'step': self.global_step, 
-                'amounts': []
-            }
-        
-        strategy = self.asset_strategies[asset]
-        cycle = strategy['cycle']
-        step = strategy['step']
+        strategy = self.ensure_asset(asset)
+        cycle = strategy.cycle
+        step = strategy.step
         
         # Record amount used
-        strategy['amounts'].append(trade_amount)
+        strategy.record_amount(trade_amount)
         
         if won:
             print(f"✅ {asset} WIN at C{cycle}S{step}! Resetting global state to C1S1")
@@ -801,18 +966,20 @@ class TwoStepMartingaleStrategy:
             self.global_step = 1
             print(f"🔍 DEBUG: After reset - Global: C{self.global_cycle}S{self.global_step}")
             # Reset this asset's strategy
-            strategy['cycle'] = 1
-            strategy['step'] = 1
-            strategy['amounts'] = []
+            strategy.cycle = 1
+            strategy.step = 1
+            strategy.n = 0
+            self._sync_asset(asset)
             return {'action': 'reset', 'asset': asset, 'next_cycle': 1, 'next_step': 1}
         else:
             print(f"❌ {asset} LOSS at C{cycle}S{step}!")
             
             if step < self.max_steps_per_cycle:
                 # Move to next step in same cycle (same asset)
-                strategy['step'] += 1
-                print(f"🔄 Moving to C{cycle}S{strategy['step']} for {asset}")
-                return {'action': 'continue', 'asset': asset, 'next_cycle': cycle, 'next_step': strategy['step']}
+                strategy.step += 1
+                self._sync_asset(asset)
+                print(f"🔄 Moving to C{cycle}S{strategy.step} for {asset}")
+                return {'action': 'continue', 'asset': asset, 'next_cycle': cycle, 'next_step': strategy.step}
             else:
                 # Step 2 of current cycle lost - advance GLOBAL cycle for NEXT assets
                 if cycle < self.max_cycles:
@@ -822,9 +989,10 @@ class TwoStepMartingaleStrategy:
                     print(f"🔄 {asset} C{cycle}S2 LOST! Next assets will start at C{self.global_cycle}S1")
                     
                     # Mark this asset as completed (no more trades for this asset)
-                    strategy['cycle'] = cycle + 1  # For status display
-                    strategy['step'] = 1
-                    strategy['amounts'] = []
+                    strategy.cycle = cycle + 1  # For status display
+                    strategy.step = 1
+                    strategy.n = 0
+                    self._sync_asset(asset)
                     return {'action': 'asset_completed', 'asset': asset, 'next_cycle': self.global_cycle, 'next_step': 1}
                 else:
                     # All 3 cycles completed - reset global state to C1S1
@@ -833,9 +1001,10 @@ class TwoStepMartingaleStrategy:
                     self.global_step = 1
                     
                     # Reset this asset's strategy
-                    strategy['cycle'] = 1
-                    strategy['step'] = 1
-                    strategy['amounts'] = []
+                    strategy.cycle = 1
+                    strategy.step = 1
+                    strategy.n = 0
+                    self._sync_asset(asset)
                     return {'action': 'reset_after_max_loss', 'asset': asset, 'next_cycle': 1, 'next_step': 1}
     
     def get_status(self, asset: str) -> str:
@@ -844,21 +1013,18 @@ class TwoStepMartingaleStrategy:
             return f"{asset}: C{self.global_cycle}S{self.global_step} (${self.get_current_amount(asset):.2f}) [NEW]"
         
         strategy = self.asset_strategies[asset]
-        cycle = strategy['cycle']
-        step = strategy['step']
+        cycle = strategy.cycle
+        step = strategy.step
         current_amount = self.get_current_amount(asset)
         return f"{asset}: C{cycle}S{step} (${current_amount:.2f})"
     
     def get_all_active_assets(self) -> List[str]:
         """Get all assets currently being tracked"""
-        return list(self.asset_strategies.keys())
+        return list(self.asset_strategies)
     
     def should_prioritize_existing_sequences(self) -> bool:
         """Check if any asset is in the middle of a cycle sequence"""
-        for asset, strategy in self.asset_strategies.items():
-            if strategy['cycle'] > 1 or strategy['step'] > 1:
-                return True
-        return False
+        return len(self._in_seq) > 0
     
     def show_global_status(self):
         """Show global cycle state"""
@@ -866,41 +1032,33 @@ class TwoStepMartingaleStrategy:
     
     def show_strategy_status(self):
         """Show current status of all assets and global cycle state"""
-        print("📊 Current Strategy Status:")
-        print(f"   🌍 Global Cycle State: C{self.global_cycle}S{self.global_step} (new assets start here)")
+        # Build the whole block and write it once instead of one print per line
+        parts = [
+            "📊 Current Strategy Status:",
+            f"   🌍 Global Cycle State: C{self.global_cycle}S{self.global_step} (new assets start here)"
+        ]
         
         if not self.asset_strategies:
-            print("   📊 No active assets")
-            return
-            
-        print("   📊 Asset Status:")
-        for asset, strategy in self.asset_strategies.items():
-            cycle = strategy['cycle']
-            step = strategy['step']
-            current_amount = self.get_current_amount(asset)
-            
-            if cycle == 1 and step == 1:
-                status = "✅ Ready for new signal"
-            else:
-                status = f"🔄 In cycle sequence"
-                
-            print(f"      {asset}: C{cycle}S{step} (${current_amount:.2f}) - {status}")
+            parts.append("   📊 No active assets")
+        else:
+            parts.append("   📊 Asset Status:")
+            amt = self._amt
+            for asset, strategy in self.asset_strategies.items():
+                cycle = strategy.cycle
+                step = strategy.step
+                status = "✅ Ready for new signal" if cycle == 1 and step == 1 else "🔄 In cycle sequence"
+                parts.append(f"      {asset}: C{cycle}S{step} (${amt[cycle][step]:.2f}) - {status}")
+        
+        sys.stdout.write("\n".join(parts) + "\n")
     
     def get_assets_in_sequence(self) -> List[str]:
         """Get assets that are currently in cycle sequence"""
-        assets_in_sequence = []
-        for asset, strategy in self.asset_strategies.items():
-            if strategy['cycle'] > 1 or strategy['step'] > 1:
-                assets_in_sequence.append(asset)
-        return assets_in_sequence
+        return list(self._in_seq)
     
     def get_assets_at_step1(self) -> List[str]:
         """Get assets that are at C1S1 (ready for new signals)"""
-        assets_at_step1 = []
-        for asset, strategy in self.asset_strategies.items():
-            if strategy['cycle'] == 1 and strategy['step'] == 1:
-                assets_at_step1.append(asset)
-        return assets_at_step1
+        # Cycle and step are both >= 1, so their bitwise OR is 1 only at C1S1 (one fused compare)
+        return self._asset_names[np.flatnonzero((self._cycles | self._steps) == 1)].tolist()
 
 class FourCycleMartingaleStrategy:
     """4-Cycle 2-Step Martingale: Extended cycle progression across different assets"""
@@ -1608,18 +1766,78 @@ class ThreeStepMartingaleStrategy:
                 assets_at_step1.append(asset)
         return assets_at_step1
 
+# Available assets - VERIFIED WORKING (75/78 assets tested and confirmed)
+# Updated: 2026-01-15 - Bulk tested with 96.2% success rate
+WORKING_ASSETS = frozenset({
+    # Major pairs (direct format) - All verified working
+    'EURUSD', 'GBPUSD', 'USDJPY', 'USDCHF', 'USDCAD', 'AUDUSD',
+    # Cross pairs (direct format) - All verified working
+    'AUDCAD', 'AUDCHF', 'AUDJPY', 'CADCHF', 'CADJPY', 'CHFJPY',
+    'EURAUD', 'EURCAD', 'EURCHF', 'EURGBP', 'EURJPY',
+    'GBPAUD', 'GBPCAD', 'GBPCHF', 'GBPJPY',
+    # OTC pairs - All verified working
+    'AEDCNY', 'AUDNZD', 'BHDCNY', 'CHFNOK', 'EURHUF', 'EURNZD', 'EURTRY',
+    'JODCNY', 'KESUSD', 'LBPUSD', 'MADUSD', 'NGNUSD', 'NZDJPY', 'NZDUSD',
+    'OMRCNY', 'QARCNY', 'SARCNY', 'TNDUSD', 'UAHUSD',
+    'USDARS', 'USDBDT', 'USDBRL', 'USDCLP', 'USDCNH', 'USDCOP',
+    'USDDZD', 'USDEGP', 'USDIDR', 'USDINR', 'USDMXN', 'USDMYR',
+    'USDPHP', 'USDPKR', 'USDRUB', 'USDSGD', 'USDTHB', 'ZARUSD'
+})
+
+# Assets that don't work (only 3 out of 78)
+UNSUPPORTED_ASSETS = frozenset({
+    'EURRUB',    # Russian Ruble - sanctioned/restricted
+    'YERUSD',    # Yemeni Rial - extremely low liquidity
+    'USDVND'     # Vietnamese Dong - limited availability
+})
+
+# Signal direction -> API direction (directions are lower-cased and validated when the CSV is parsed)
+_DIR_MAP = {'call': OrderDirection.CALL, 'put': OrderDirection.PUT}
+
+# Fallback (csv, duration, name) for channels without a configured entry
+_DEFAULT_CHANNEL = (None, 300, "Default")
+
+# API error classifiers - one case-insensitive scan instead of lower() plus a substring test per keyword
+_MARKET_CLOSED_RE = re.compile(r'incorrectopentime|market|closed', re.IGNORECASE)
+_PAYOUT_TOO_LOW_RE = re.compile(r'payout too low', re.IGNORECASE)
+_SKIP_ERROR_RE = re.compile(r'closed|market|incorrectopentime|not available|invalid asset|timeout', re.IGNORECASE)
+
+# Major pairs that should use regular format (no _otc) when given as -OTC in CSV
+_MAJOR_PAIRS = frozenset({
+    'EURUSD', 'GBPUSD', 'USDJPY', 'USDCHF', 'USDCAD', 'AUDUSD',
+    'EURJPY', 'EURGBP', 'GBPJPY', 'AUDJPY', 'NZDUSD'
+})
+# CSV-style OTC names: base is everything before the first '-', suffix -OTC/-OTCp in any case
+_DASH_OTC_RE = re.compile(r'([^-]*)-(?:.*-)?(?i:OTCP?)')
+
 class MultiAssetPreciseTrader:
     """Multi-asset trader with immediate step progression and stop loss/take profit"""
     
-    def __init__(self, stop_loss: float = None, take_profit: float = None):
+    __slots__ = (
+        'ssid', 'client', 'stop_loss', 'take_profit', 'session_profit', '_sl_bound', '_tp_bound',
+        'trade_offset_seconds',
+        'active_channel', 'po_advance_bot_duration', 'po_advance_bot_csv', 'current_csv_date', '_channel_config',
+        'trade_history', '_wins', '_losses', '_history_profit', 'pending_immediate_trades', 'executed_signals',
+        'min_payout_percentage', 'asset_payouts',
+        'api_failures', 'max_api_failures', 'last_successful_api_call_ns',
+        'WORKING_ASSETS', 'UNSUPPORTED_ASSETS', '_debug_shown', '_csv_cache', '_signal_cache',
+        '_csv_event', '_csv_observer', 'verbose'
+    )
+    
+    def __init__(self, stop_loss: float = None, take_profit: float = None, verbose: bool = True):
         self.ssid = os.getenv('SSID')
         self.client = None
+        self.verbose = verbose  # False hides the per-tick upcoming-signal and session-stat blocks
         
         # Stop Loss and Take Profit settings
         self.stop_loss = stop_loss  # Maximum loss in dollars before stopping
         self.take_profit = take_profit  # Target profit in dollars before stopping
         self.session_profit = 0.0  # Track session profit/loss
         
+        # Precomputed stop bounds (disabled limits become ±inf so the per-tick check needs no None tests)
+        self._sl_bound = -stop_loss if stop_loss is not None else float('-inf')
+        self._tp_bound = take_profit if take_profit is not None else float('inf')
+        
         # Load trade timing offset from config file
         self.trade_offset_seconds = 0  # Always execute exactly at signal time
         
@@ -1631,9 +1849,25 @@ class MultiAssetPreciseTrader:
         # Will be auto-updated to find latest available CSV
         self.po_advance_bot_csv = None
         self.current_csv_date = None
+        self._channel_config: Dict[str, Tuple[str, int, str]] = {}
         self._update_csv_filenames(show_info=True)
         
+        # Parsed signal rows per CSV path: (st_mtime_ns, st_size, rows, resume offset, CRC-32 of bytes before it, header line)
+        # Reused until the file changes; appends are parsed incrementally from the resume offset
+        self._csv_cache: Dict[str, Tuple[int, int, List[Tuple], int, int, bytes]] = {}
+        
+        # Today's deduplicated signals built from the cached rows:
+        # (rows, key, signals, epoch seconds per signal, signals keyed by execution second)
+        self._signal_cache = None
+        
+        # Signal file watcher (only used when watchdog is installed)
+        self._csv_event = None
+        self._csv_observer = None
+        
         self.trade_history = []
+        self._wins = 0  # Running win/loss counts and profit total for trade_history (kept in step with every append)
+        self._losses = 0
+        self._history_profit = 0.0
         self.pending_immediate_trades = []  # Queue for immediate next step trades
         self.executed_signals = set()  # Track executed signal combinations to prevent duplicates
         
@@ -1644,32 +1878,11 @@ class MultiAssetPreciseTrader:
         # API health tracking
         self.api_failures = 0
         self.max_api_failures = 3  # System will fail after 3 consecutive failures
-        self.last_successful_api_call = get_user_time()
-        
-        # Available assets - VERIFIED WORKING (75/78 assets tested and confirmed)
-        # Updated: 2026-01-15 - Bulk tested with 96.2% success rate
-        self.WORKING_ASSETS = {
-            # Major pairs (direct format) - All verified working
-            'EURUSD', 'GBPUSD', 'USDJPY', 'USDCHF', 'USDCAD', 'AUDUSD',
-            # Cross pairs (direct format) - All verified working
-            'AUDCAD', 'AUDCHF', 'AUDJPY', 'CADCHF', 'CADJPY', 'CHFJPY',
-            'EURAUD', 'EURCAD', 'EURCHF', 'EURGBP', 'EURJPY',
-            'GBPAUD', 'GBPCAD', 'GBPCHF', 'GBPJPY',
-            # OTC pairs - All verified working
-            'AEDCNY', 'AUDNZD', 'BHDCNY', 'CHFNOK', 'EURHUF', 'EURNZD', 'EURTRY',
-            'JODCNY', 'KESUSD', 'LBPUSD', 'MADUSD', 'NGNUSD', 'NZDJPY', 'NZDUSD',
-            'OMRCNY', 'QARCNY', 'SARCNY', 'TNDUSD', 'UAHUSD',
-            'USDARS', 'USDBDT', 'USDBRL', 'USDCLP', 'USDCNH', 'USDCOP',
-            'USDDZD', 'USDEGP', 'USDIDR', 'USDINR', 'USDMXN', 'USDMYR',
-            'USDPHP', 'USDPKR', 'USDRUB', 'USDSGD', 'USDTHB', 'ZARUSD'
-        }
+        self.last_successful_api_call_ns = time.monotonic_ns()
         
-        # Assets that don't work (only 3 out of 78)
-        self.UNSUPPORTED_ASSETS = {
-            'EURRUB',    # Russian Ruble - sanctioned/restricted
-            'YERUSD',    # Yemeni Rial - extremely low liquidity
-            'USDVND'     # Vietnamese Dong - limited availability
-        }
+        # Available assets - shared module-level constants
+        self.WORKING_ASSETS = WORKING_ASSETS
+        self.UNSUPPORTED_ASSETS = UNSUPPORTED_ASSETS
         
         print(f"📊 PO Advance Bot CSV: {self.po_advance_bot_csv}")
         print(f"⏰ Trade Duration: PO Advance Bot (1:00)")
@@ -1691,35 +1904,40 @@ class MultiAssetPreciseTrader:
     
     def _update_csv_filenames(self, show_info: bool = False):
         """Set fixed CSV filenames for the new channel (no date-based naming)"""
+        # Nothing to refresh within the same day (called on every signal poll)
+        today = datetime.now().strftime('%Y-%m-%d')
+        if not show_info and self.current_csv_date == today:
+            return
+        
         # Use FIXED CSV filename that matches simple_monitor.py exactly
         self.po_advance_bot_csv = "pocketoption_po_advance_bot.csv"
         
+        # Channel -> (csv file, trade duration, display name)
+        self._channel_config = {
+            "po_advance_bot": (self.po_advance_bot_csv, self.po_advance_bot_duration, "PO Advance Bot")
+        }
+        
         # Only show detailed info when requested (during initialization)
         if show_info:
             # Show only the selected channel's CSV file, not all channels
             if self.active_channel:
                 # Get the selected channel's CSV file and details
-                if self.active_channel == "po_advance_bot":
-                    selected_csv = self.po_advance_bot_csv
-                    selected_name = "PO Advance Bot"
-                else:
-                    selected_csv = None
-                    selected_name = "Unknown"
+                selected_csv, _, selected_name = self._channel_config.get(self.active_channel, (None, 0, "Unknown"))
                 
                 if selected_csv:
                     print(f"📊 Using CSV file for selected channel:")
-                    if os.path.exists(selected_csv):
-                        # Get file size and modification time
-                        file_size = os.path.getsize(selected_csv)
-                        mod_time = datetime.fromtimestamp(os.path.getmtime(selected_csv)).strftime('%Y-%m-%d %H:%M:%S')
-                        print(f"   ✅ {selected_name}: {selected_csv} ({file_size} bytes, modified: {mod_time})")
-                    else:
+                    try:
+                        # Get file size and modification time with a single stat call
+                        st = os.stat(selected_csv)
+                        mod_time = datetime.fromtimestamp(st.st_mtime).strftime('%Y-%m-%d %H:%M:%S')
+                        print(f"   ✅ {selected_name}: {selected_csv} ({st.st_size} bytes, modified: {mod_time})")
+                    except OSError:
                         print(f"   ❌ {selected_name}: {selected_csv} (file not found)")
             else:
                 print(f"📊 No channel selected - CSV files available but not loaded")
         
         # Set current date for tracking (but don't use in filenames)
-        self.current_csv_date = datetime.now().strftime('%Y-%m-%d')
+        self.current_csv_date = today
     
     def _validate_duration(self, duration: int, channel: str = None) -> int:
         """Simple duration validation - return as-is"""
@@ -1727,10 +1945,7 @@ class MultiAssetPreciseTrader:
     
     def get_channel_duration(self, channel: str) -> int:
         """Get duration in seconds for specific channel"""
-        if channel == "po_advance_bot":
-            return self.po_advance_bot_duration
-        else:
-            return 300  # Default fallback (5:00)
+        return self._channel_config.get(channel, _DEFAULT_CHANNEL)[1]  # Default fallback (5:00)
     
     def should_use_api(self, asset: str) -> bool:
         """Check if API is available and connected"""
@@ -1742,10 +1957,16 @@ class MultiAssetPreciseTrader:
         
         return True
     
+    @property
+    def last_successful_api_call(self) -> datetime:
+        """Time of last successful API call in user timezone (converted from monotonic clock on demand)"""
+        elapsed = (time.monotonic_ns() - self.last_successful_api_call_ns) / 1e9
+        return get_user_time() - timedelta(seconds=elapsed)
+    
     def record_api_success(self):
         """Record successful API call"""
         self.api_failures = 0
-        self.last_successful_api_call = get_user_time()
+        self.last_successful_api_call_ns = time.monotonic_ns()
     
     def record_api_failure(self):
         """Record API failure with improved handling"""
@@ -1770,11 +1991,11 @@ class MultiAssetPreciseTrader:
     def should_stop_trading(self) -> Tuple[bool, str]:
         """Check if trading should stop due to stop loss or take profit"""
         # Check stop loss
-        if self.stop_loss is not None and self.session_profit <= -self.stop_loss:
+        if self.session_profit <= self._sl_bound:
             return True, f"🛑 STOP LOSS REACHED: ${self.session_profit:+.2f} (limit: -${self.stop_loss:.2f})"
         
         # Check take profit
-        if self.take_profit is not None and self.session_profit >= self.take_profit:
+        if self.session_profit >= self._tp_bound:
             return True, f"🎯 TAKE PROFIT REACHED: ${self.session_profit:+.2f} (target: +${self.take_profit:.2f})"
         
         return False, ""
@@ -1799,9 +2020,10 @@ class MultiAssetPreciseTrader:
             asset_symbol = payout_info.get('symbol', '')
             payout = payout_info.get('payout', 0)
             
-            # Normalize asset symbol (remove # prefix if present)
+            # Normalize asset symbol (remove # prefix if present) and intern it as a shared dict key
             if asset_symbol.startswith('#'):
                 asset_symbol = asset_symbol[1:]
+            asset_symbol = sys.intern(asset_symbol)
             
             # Store payout information with multiple variations
             self.asset_payouts[asset_symbol] = payout
@@ -1819,6 +2041,25 @@ class MultiAssetPreciseTrader:
         except Exception as e:
             print(f"⚠️ Error processing payout update: {e}")
     
+    async def _wait_for_order_result(self, order_id: str, max_wait: float) -> Dict[str, Any]:
+        """Wait for an order to complete on the client's result future (single wakeup, no polling)"""
+        try:
+            async with asyncio.timeout(max_wait):
+                result = await self.client.register_result_future(order_id)
+        except TimeoutError:
+            return {'result': 'timeout', 'order_id': order_id, 'completed': False, 'timeout': True}
+        finally:
+            # Timed out, cancelled or resolved - don't leave the future registered on the client
+            self.client.discard_result_future(order_id)
+        
+        return {
+            'result': 'win' if result.status == OrderStatus.WIN else 'loss' if result.status == OrderStatus.LOSE else 'draw',
+            'profit': result.profit if result.profit is not None else 0,
+            'order_id': order_id,
+            'completed': True,
+            'status': result.status.value
+        }
+    
     def _on_json_data(self, data: Any):
         """Handle JSON data messages that contain asset information"""
         try:
@@ -1831,9 +2072,10 @@ class MultiAssetPreciseTrader:
                         asset_symbol = asset_info[1]
                         payout = asset_info[5]
                         
-                        # Normalize asset symbol (remove # prefix if present)
+                        # Normalize asset symbol (remove # prefix if present) and intern it as a shared dict key
                         if asset_symbol.startswith('#'):
                             asset_symbol = asset_symbol[1:]
+                        asset_symbol = sys.intern(asset_symbol)
                         
                         # Store payout information with ALL possible variations
                         # Store as-is
@@ -1885,6 +2127,22 @@ class MultiAssetPreciseTrader:
         else:
             return False, payout
     
+    def _require_payout(self, asset: str):
+        """Raise if asset is below the minimum payout (shared by precise and immediate trades)"""
+        payout_ok, payout = self.check_payout_requirement(asset)
+        if not payout_ok:
+            print(f"⚠️ SKIPPING {asset}: Payout {payout:.1f}% < {self.min_payout_percentage}% minimum")
+            raise Exception(f"Payout too low: {payout:.1f}% < {self.min_payout_percentage}%")
+        
+        print(f"✅ Payout check passed: {asset} = {payout:.1f}%")
+    
+    @staticmethod
+    def _result_wait_limit(duration: int) -> float:
+        """Max seconds to wait for a trade result given its duration"""
+        if duration >= 300:  # 5:00 trades
+            return min(330.0, duration + 30.0)  # Max 330 seconds for 5:00 trades
+        return min(80.0, duration + 20.0)  # Max 80 seconds for 1:00 trades
+    
     def show_payout_status(self):
         """Show current payout data for debugging"""
         if not self.asset_payouts:
@@ -1940,8 +2198,10 @@ class MultiAssetPreciseTrader:
                 )
                 
                 try:
-                    await asyncio.wait_for(self.client.connect(), timeout=15.0)
-                    balance = await asyncio.wait_for(self.client.get_balance(), timeout=10.0)
+                    async with asyncio.timeout(15.0):
+                        await self.client.connect()
+                    async with asyncio.timeout(10.0):
+                        balance = await self.client.get_balance()
                     
                     print(f"✅ Connected! {'DEMO' if is_demo else 'REAL'} Account")
                     print(f"💰 Balance: ${balance.balance:.2f}")
@@ -1981,143 +2241,278 @@ class MultiAssetPreciseTrader:
             self.client = None
             raise Exception(f"Connection error: {e}")
     
-    def get_signals_from_csv(self, target_date: str = None) -> List[Dict[str, Any]]:
+    def _parse_signal_rows(self, csv_file: str) -> List[Tuple]:
+        """Parse valid signal rows from CSV as (asset, direction, signal_time, hour, minute, second, message_text), cached until the file changes"""
+        st = os.stat(csv_file)
+        cached = self._csv_cache.get(csv_file)
+        if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+            return cached[2]
+        
+        with open(csv_file, 'rb') as f:
+            content = f.read()
+        
+        # Appended to since the last parse: parse only the new bytes if every byte before them is unchanged
+        # (simple_monitor.py also rewrites the file in place, which an end-of-file check alone would miss)
+        prior_rows, offset, checksum = [], 0, 0
+        if cached is not None and cached[3] is not None and len(content) > cached[3]:
+            _, _, rows, resume_at, prefix_crc, header = cached
+            if zlib.crc32(memoryview(content)[:resume_at]) == prefix_crc:
+                prior_rows, offset, checksum = rows, resume_at, prefix_crc
+        if offset == 0:
+            header = content[:content.find(b'\n') + 1]  # First parse or rewritten - parse from scratch
+        data = content[offset:]
+        
+        # New rows are parsed behind the cached header line
+        new_rows = self._rows_from_frame(self._load_signals(io.BytesIO(data if offset == 0 else header + data)))
+        rows = prior_rows + new_rows
+        
+        # Order by time of day once per file version (stable, so CSV order breaks ties)
+        rows.sort(key=itemgetter(3, 4, 5))
+        
+        # Resume from the end next time only if it is a record boundary (ends a line with balanced quotes)
+        resume_at = len(content) if data.endswith(b'\n') and data.count(b'"') % 2 == 0 else None
+        
+        self._csv_cache[csv_file] = (st.st_mtime_ns, st.st_size, rows, resume_at, zlib.crc32(data, checksum), header)
+        return rows
+    
+    def _rows_from_frame(self, df: 'pd.DataFrame') -> List[Tuple]:
+        """Convert a signal frame to validated (asset, direction, signal_time, hour, minute, second, message_text) rows"""
+        import pandas as pd  # Already loaded by _load_signals
+        
+        if 'is_signal' in df.columns:
+            df = df[df['is_signal'] == 'Yes']
+        
+        if df.empty or 'asset' not in df.columns or 'direction' not in df.columns or 'signal_time' not in df.columns:
+            rows = []
+        else:
+            assets = df['asset'].astype(str).fillna('nan').str.strip()
+            directions = df['direction'].astype(str).fillna('nan').str.strip().str.lower()
+            times = df['signal_time'].astype(str).fillna('nan').str.strip()
+            
+            valid = (assets != '') & directions.isin(('call', 'put')) & (times != '') & (times != 'nan')
+            assets, directions, times = assets[valid], directions[valid], times[valid]
+            
+            # Accept HH:MM:SS, HH:MM and HH.MM - unparseable times come back as NaT
+            normalized = times.where(times.str.contains(':', regex=False), times.str.replace('.', ':', regex=False))
+            parsed = pd.to_datetime(normalized, format='%H:%M:%S', errors='coerce')
+            short = parsed.isna()
+            if short.any():
+                # Only the rows HH:MM:SS rejected get the HH:MM pass (not the whole column again)
+                parsed[short] = pd.to_datetime(normalized[short], format='%H:%M', errors='coerce')
+            for asset, signal_time_str in zip(assets[parsed.isna()], times[parsed.isna()]):
+                print(f"⚠️ Invalid signal time format: {signal_time_str} for {asset}")
+            
+            ok = parsed.notna()
+            parsed = parsed[ok]
+            if 'message_text' in df.columns:
+                messages = df['message_text'].loc[parsed.index].astype(str).fillna('nan').str.slice(0, 100)
+            else:
+                messages = pd.Series('', index=parsed.index)
+            
+            # Use EXACT asset name from CSV - no modifications
+            # Interned so repeated assets/directions/times share one object (identity-fast dict keys and compares)
+            rows = list(zip(
+                map(sys.intern, assets[ok]), map(sys.intern, directions[ok]), map(sys.intern, times[ok]),
+                parsed.dt.hour.tolist(), parsed.dt.minute.tolist(), parsed.dt.second.tolist(),
+                messages
+            ))
+        
+        return rows
+    
+    def _build_signals(self, rows: List[Tuple], current_time: datetime, trade_duration: int) -> Tuple[List[Signal], np.ndarray, Dict[int, List[Signal]]]:
+        """Build today's unique signals (in execution order) from parsed rows, with their epoch seconds and per-second lookup"""
+        built_at = current_time.isoformat()
+        
+        # Signals always fall on today's date - unpack it once instead of per row (no per-row date checks needed)
+        filter_date_str = current_time.strftime('%Y-%m-%d')
+        year, month, day = current_time.year, current_time.month, current_time.day
+        
+        # Use channel-specific duration
+        duration_seconds = trade_duration
+        
+        signals = []
+        signal_epochs = []
+        signals_by_ts: Dict[int, List[Signal]] = {}
+        seen_combinations = set()
+        # Signals sharing a time reuse the same (signal datetime, epoch seconds, close datetime)
+        time_cache: Dict[Tuple[int, int, int], Tuple[datetime, float, datetime]] = {}
+        
+        for trading_asset, direction, signal_time_str, hour, minute, second, message_text in rows:
+            # Remove duplicate signals (same asset+direction+time) to prevent multiple executions
+            signal_key = (trading_asset, direction, hour, minute, second)
+            if signal_key in seen_combinations:
+                continue
+            seen_combinations.add(signal_key)
+            
+            cached_times = time_cache.get((hour, minute, second))
+            if cached_times is None:
+                # Create signal datetime for the target date in the user timezone
+                signal_datetime = datetime(year, month, day, hour, minute, second, tzinfo=USER_TIMEZONE)
+                cached_times = time_cache[(hour, minute, second)] = (
+                    signal_datetime, signal_datetime.timestamp(), signal_datetime + timedelta(seconds=duration_seconds)
+                )
+            signal_datetime, signal_ts, close_datetime = cached_times
+            
+            signal = Signal(
+                asset=trading_asset,
+                direction=direction,
+                signal_time=signal_time_str,
+                signal_datetime=signal_datetime,
+                trade_datetime=signal_datetime,  # Execute exactly at signal time (no offset)
+                execute_ts=int(signal_ts),  # epoch seconds for tick compares
+                close_datetime=close_datetime,  # channel-specific duration
+                timestamp=built_at,
+                message_text=message_text,
+                channel=self.active_channel,
+                duration=duration_seconds,  # Channel-specific duration
+                date_filter=filter_date_str
+            )
+            signals.append(signal)
+            signal_epochs.append(signal.execute_ts)
+            signals_by_ts.setdefault(signal.execute_ts, []).append(signal)
+        
+        # Already in trade execution order - rows are pre-sorted by time and USER_TIMEZONE is a fixed offset
+        # Epoch seconds as one int64 column, so per-tick windows are vectorized searches
+        return signals, np.array(signal_epochs, dtype=np.int64), signals_by_ts
+    
+    def get_signals_from_csv(self, target_date: str = None) -> List[Signal]:
         """Get trading signals from selected channel CSV file with date filtering and current time focus"""
         try:
             # Update CSV filenames in case date has changed
             self._update_csv_filenames()
             
             # Determine which CSV file to use based on active channel
-            if self.active_channel == "po_advance_bot":
-                csv_file = self.po_advance_bot_csv
-                trade_duration = self.po_advance_bot_duration
-                channel_name = "PO Advance Bot"
-            else:
+            csv_file, trade_duration, channel_name = self._channel_config.get(self.active_channel, _DEFAULT_CHANNEL)
+            if csv_file is None:
                 return []
             
-            if not os.path.exists(csv_file):
+            # The cache check's stat doubles as the existence check (one syscall per poll)
+            try:
+                rows = self._parse_signal_rows(csv_file)
+            except FileNotFoundError:
                 return []
-            
-            df = pd.read_csv(csv_file, on_bad_lines='skip')
-            
-            if 'is_signal' in df.columns:
-                signals_df = df[df['is_signal'] == 'Yes'].copy()
-            else:
-                signals_df = df.copy()
-            
-            if signals_df.empty:
+            if not rows:
                 return []
             
-            # Get current time for filtering
             current_time = get_user_time()
-            current_date_str = current_time.strftime('%Y-%m-%d')
             
-            # Use current date for signal filtering
-            filter_date_str = current_date_str
+            # Rebuild only when the rows, day, channel or timezone change - otherwise just slice off past signals
+            key = (current_time.strftime('%Y-%m-%d'), self.active_channel, USER_TIMEZONE, trade_duration)
+            cached = self._signal_cache
+            if cached is None or cached[0] is not rows or cached[1] != key:
+                signals, signal_epochs, signals_by_ts = self._build_signals(rows, current_time, trade_duration)
+                self._signal_cache = cached = (rows, key, signals, signal_epochs, signals_by_ts)
             
-            signals = []
-            
-            for _, row in signals_df.iterrows():
-                try:
-                    asset = str(row.get('asset', '')).strip()
-                    direction = str(row.get('direction', '')).strip().lower()
-                    signal_time_str = str(row.get('signal_time', '')).strip()
-                    
-                    if not asset or not direction or not signal_time_str or signal_time_str == 'nan':
-                        continue
-                    
-                    # Use EXACT asset name from CSV - no modifications
-                    trading_asset = asset
-                    
-                    if direction not in ['call', 'put']:
-                        continue
-                    
-                    # Parse signal time
-                    try:
-                        if signal_time_str.count(':') == 2:
-                            signal_time = datetime.strptime(signal_time_str, '%H:%M:%S')
-                        elif signal_time_str.count(':') == 1:
-                            signal_time = datetime.strptime(signal_time_str, '%H:%M')
-                        elif '.' in signal_time_str:
-                            signal_time = datetime.strptime(signal_time_str.replace('.', ':'), '%H:%M')
-                        else:
-                            # If signal_time is invalid, skip this signal
-                            print(f"⚠️ Invalid signal time format: {signal_time_str} for {asset}")
-                            continue
-                        
-                        # Create signal datetime for the target date
-                        signal_date = datetime.strptime(filter_date_str, '%Y-%m-%d').date()
-                        signal_datetime = datetime.combine(signal_date, datetime.min.time().replace(
-                            hour=signal_time.hour,
-                            minute=signal_time.minute,
-                            second=signal_time.second if signal_time_str.count(':') == 2 else 0
-                        ))
-                        
-                        # Convert to user timezone
-                        if USER_TIMEZONE:
-                            signal_datetime = signal_datetime.replace(tzinfo=USER_TIMEZONE)
-                        
-                        # Only include upcoming signals (future or current time)
-                        time_until_signal = (signal_datetime - current_time).total_seconds()
-                        if time_until_signal < -60:  # Signal was more than 1 minute ago - skip it
-                            continue
-                        
-                        # Execute exactly at signal time (no offset)
-                        trade_datetime = signal_datetime
-                        
-                        # Use channel-specific duration
-                        duration_seconds = trade_duration
-                        
-                        close_datetime = trade_datetime + timedelta(seconds=duration_seconds)
-                        
-                    except ValueError as e:
-                        print(f"⚠️ Signal time parsing error for {asset}: {signal_time_str} - {e}")
-                        continue
-                    
-                    signal = {
-                        'asset': trading_asset,
-                        'direction': direction,
-                        'signal_time': signal_time_str,
-                        'signal_datetime': signal_datetime,
-                        'trade_datetime': trade_datetime,  # exactly at signal time
-                        'close_datetime': close_datetime,  # channel-specific duration
-                        'timestamp': get_user_time().isoformat(),
-                        'message_text': str(row.get('message_text', ''))[:100],
-                        'channel': self.active_channel,
-                        'duration': duration_seconds,  # Channel-specific duration
-                        'date_filter': filter_date_str
-                    }
-                    
-                    # Add all valid signals (will be filtered by readiness in main loop)
-                    signals.append(signal)
-                    
-                except Exception:
-                    continue
-            
-            # Sort by trade execution time
-            signals.sort(key=lambda x: x['trade_datetime'])
-            
-            # Remove duplicate signals (same asset+direction+time) to prevent multiple executions
-            unique_signals = []
-            seen_combinations = set()
-            for signal in signals:
-                signal_key = f"{signal['asset']}_{signal['direction']}_{signal['signal_datetime'].strftime('%H:%M:%S')}"
-                if signal_key not in seen_combinations:
-                    unique_signals.append(signal)
-                    seen_combinations.add(signal_key)
-            
-            # Return unique signals only
-            return unique_signals
+            # Only include upcoming signals (drop those more than 1 minute ago) - list is in execution order
+            return cached[2][int(np.searchsorted(cached[3], current_time.timestamp() - 60)):]
             
         except Exception as e:
             logger.error(f"Error reading CSV: {e}")
             return []
     
-    def _map_asset_name(self, csv_asset: str) -> str:
+    def get_signals_due(self, current_ts: int) -> List[Signal]:
+        """Get signals from the last CSV read that execute at exactly this epoch second"""
+        cached = self._signal_cache
+        if cached is None:
+            return []
+        return list(cached[4].get(current_ts, ()))
+    
+    def split_signals(self, current_ts: int) -> Tuple[List[Signal], List[Signal], List[Signal]]:
+        """Split the last CSV read's recent signals into (missed, due this second, upcoming) with one searchsorted"""
+        cached = self._signal_cache
+        if cached is None:
+            return [], [], []
+        signals = cached[2]
+        start, due, upcoming = np.searchsorted(cached[3], (current_ts - 60, current_ts, current_ts + 1)).tolist()
+        return signals[start:due], signals[due:upcoming], signals[upcoming:]
+    
+    def _load_signals(self, source: io.BytesIO) -> 'pd.DataFrame':
+        """Read only the signal columns from CSV bytes - via pyarrow when installed, else the pandas C parser"""
+        if pa is not None:
+            header = next(csv.reader([source.readline().decode('utf-8')]), [])
+            source.seek(0)
+            columns = [column for column in header if column in SIGNAL_CSV_DTYPES]
+            table = pacsv.read_csv(
+                source,
+                parse_options=pacsv.ParseOptions(invalid_row_handler=lambda row: 'skip'),
+                convert_options=pacsv.ConvertOptions(
+                    include_columns=columns,
+                    column_types={column: pa.string() for column in columns},
+                    strings_can_be_null=True
+                )
+            )
+            if 'is_signal' in columns:
+                # Already filtered - drop the column so callers don't mask (and copy) the frame again
+                table = table.filter(pc.equal(table['is_signal'], 'Yes')).drop_columns(['is_signal'])
+            return table.to_pandas()
+        
+        import pandas as pd  # Imported lazily - only needed once a CSV is actually parsed
+        return pd.read_csv(
+            source,
+            usecols=lambda column: column in SIGNAL_CSV_DTYPES,
+            dtype=SIGNAL_CSV_DTYPES,
+            engine='c',
+            on_bad_lines='skip'
+        )
+    
+    def _start_csv_watch(self):
+        """Start a watchdog observer that sets _csv_event whenever a CSV in the signal directory changes"""
+        loop = asyncio.get_running_loop()
+        self._csv_event = asyncio.Event()
+        event = self._csv_event
+        
+        class _CsvChangeHandler(FileSystemEventHandler):
+            def on_modified(self, fs_event):
+                if fs_event.src_path.endswith('.csv'):
+                    loop.call_soon_threadsafe(event.set)
+            on_created = on_modified
+        
+        self._csv_observer = Observer()
+        self._csv_observer.daemon = True
+        self._csv_observer.schedule(_CsvChangeHandler(), os.path.dirname(os.path.abspath(self.po_advance_bot_csv)))
+        self._csv_observer.start()
+    
+    async def _wait_for_csv_change(self, timeout: float = 1.0):
+        """Idle until the signal CSV changes or timeout expires (falls back to a 10ms poll without watchdog)"""
+        if Observer is None:
+            await asyncio.sleep(0.01)
+            return
+        
+        if self._csv_observer is None:
+            self._start_csv_watch()
+        
+        try:
+            async with asyncio.timeout(timeout):
+                await self._csv_event.wait()
+        except asyncio.TimeoutError:
+            pass
+        self._csv_event.clear()
+    
+    async def _wait_for_next_signal(self, next_wait: float):
+        """Idle until just before the next signal, waking on CSV change (re-reads at least every second without watchdog)"""
+        delay = idle_poll_delay(next_wait)
+        if Observer is None:
+            await asyncio.sleep(min(delay, 1.0))  # Appended signals may be due sooner than the one waited for
+        else:
+            await self._wait_for_csv_change(timeout=delay)
+    
+    async def _wait_for_next_second(self):
+        """Idle until the next whole second, when the next signal can fire (wakes early on CSV change with watchdog)"""
+        # Signals execute on whole epoch seconds, so nothing can match before the next boundary
+        delay = 1.0 - time.time() % 1.0
+        if Observer is None:
+            await asyncio.sleep(delay)
+        else:
+            await self._wait_for_csv_change(timeout=delay)
+    
+    @staticmethod
+    @lru_cache(maxsize=128)
+    def _map_asset_name(csv_asset: str) -> str:
         """
         Convert exact asset names from CSV to PocketOption API format.
         Input: EURJPY, EURJPY-OTC, AUDCAD-OTC, AUDCAD_otc, etc.
         Output: EURJPY, EURJPY, AUDCAD_otc, AUDCAD_otc, etc.
+        Memoized - the mapping depends only on the name and the asset set is small.
         """
         asset = csv_asset.strip()
         
@@ -2126,16 +2521,11 @@ class MultiAssetPreciseTrader:
             return asset  # Return AUDCAD_otc as-is
         
         # If asset has -OTC or -OTCp suffix, remove it and decide format
-        if asset.endswith('-OTC') or asset.endswith('-OTCp'):
-            base_asset = asset.split('-')[0]  # Get EURJPY from EURJPY-OTC
-            
-            # Major pairs that should use regular format (no _otc)
-            MAJOR_PAIRS = {
-                'EURUSD', 'GBPUSD', 'USDJPY', 'USDCHF', 'USDCAD', 'AUDUSD',
-                'EURJPY', 'EURGBP', 'GBPJPY', 'AUDJPY', 'NZDUSD'
-            }
+        match = _DASH_OTC_RE.fullmatch(asset)
+        if match:
+            base_asset = match.group(1)  # Get EURJPY from EURJPY-OTC
             
-            if base_asset in MAJOR_PAIRS:
+            if base_asset in _MAJOR_PAIRS:
                 return base_asset  # Return EURJPY (regular format)
             else:
                 return f"{base_asset}_otc"  # Return AUDCAD_otc (OTC format)
@@ -2157,15 +2547,9 @@ class MultiAssetPreciseTrader:
             if current_step == 1:
                 # For Step 1, use precise timing with channel-specific duration
                 duration_seconds = self.get_channel_duration(channel or self.active_channel)
-                won, profit = await self.execute_precise_trade({
-                    'asset': asset,
-                    'direction': direction,
-                    'trade_datetime': get_user_time(),
-                    'signal_datetime': get_user_time(),
-                    'close_datetime': get_user_time() + timedelta(seconds=duration_seconds),
-                    'channel': channel or self.active_channel,
-                    'duration': duration_seconds
-                }, step_amount)
+                won, profit = await self.execute_precise_trade(
+                    Signal.immediate(asset, direction, duration_seconds, channel or self.active_channel), step_amount
+                )
             else:
                 # For Step 2, execute immediately
                 won, profit = await self.execute_immediate_trade(asset, direction, step_amount, channel or self.active_channel)
@@ -2215,15 +2599,9 @@ class MultiAssetPreciseTrader:
             if current_step == 1:
                 # For Step 1, use precise timing with channel-specific duration
                 duration_seconds = self.get_channel_duration(channel or self.active_channel)
-                won, profit = await self.execute_precise_trade({
-                    'asset': asset,
-                    'direction': direction,
-                    'trade_datetime': get_user_time(),
-                    'signal_datetime': get_user_time(),
-                    'close_datetime': get_user_time() + timedelta(seconds=duration_seconds),
-                    'channel': channel or self.active_channel,
-                    'duration': duration_seconds
-                }, step_amount)
+                won, profit = await self.execute_precise_trade(
+                    Signal.immediate(asset, direction, duration_seconds, channel or self.active_channel), step_amount
+                )
             else:
                 # For Step 2, execute immediately
                 won, profit = await self.execute_immediate_trade(asset, direction, step_amount, channel or self.active_channel)
@@ -2261,6 +2639,8 @@ class MultiAssetPreciseTrader:
 
     async def execute_single_2step_trade(self, asset: str, direction: str, base_amount: float, strategy: 'TwoStepMartingaleStrategy', channel: str = None) -> Tuple[bool, float, str]:
         """Execute a single trade in the 2-step sequence and return next action"""
+        # Pin asset to the current global cycle before the trade so concurrent losses don't shift it
+        strategy.ensure_asset(asset)
         current_cycle = strategy.get_asset_cycle(asset)
         current_step = strategy.get_asset_step(asset)
         step_amount = strategy.get_current_amount(asset)
@@ -2272,15 +2652,9 @@ class MultiAssetPreciseTrader:
             # Execute trade based on step
             if current_step == 1:
                 # For Step 1, use precise timing
-                won, profit = await self.execute_precise_trade({
-                    'asset': asset,
-                    'direction': direction,
-                    'trade_datetime': get_user_time(),
-                    'signal_datetime': get_user_time(),
-                    'close_datetime': get_user_time() + timedelta(seconds=60),
-                    'channel': channel or self.active_channel,
-                    'duration': 60
-                }, step_amount)
+                won, profit = await self.execute_precise_trade(
+                    Signal.immediate(asset, direction, 60, channel or self.active_channel), step_amount
+                )
             else:
                 # For Step 2, execute immediately
                 won, profit = await self.execute_immediate_trade(asset, direction, step_amount, channel or self.active_channel)
@@ -2329,15 +2703,9 @@ class MultiAssetPreciseTrader:
             # Execute trade based on step
             if current_step == 1:
                 # For Step 1, use precise timing
-                won, profit = await self.execute_precise_trade({
-                    'asset': asset,
-                    'direction': direction,
-                    'trade_datetime': get_user_time(),
-                    'signal_datetime': get_user_time(),
-                    'close_datetime': get_user_time() + timedelta(seconds=60),
-                    'channel': channel or self.active_channel,
-                    'duration': 60
-                }, step_amount)
+                won, profit = await self.execute_precise_trade(
+                    Signal.immediate(asset, direction, 60, channel or self.active_channel), step_amount
+                )
             else:
                 # For Step 2 and 3, execute immediately
                 won, profit = await self.execute_immediate_trade(asset, direction, step_amount, channel or self.active_channel)
@@ -2386,15 +2754,9 @@ class MultiAssetPreciseTrader:
             # Execute trade based on step
             if current_step == 1:
                 # For Step 1, use precise timing
-                won, profit = await self.execute_precise_trade({
-                    'asset': asset,
-                    'direction': direction,
-                    'trade_datetime': get_user_time(),
-                    'signal_datetime': get_user_time(),
-                    'close_datetime': get_user_time() + timedelta(seconds=60),
-                    'channel': channel or self.active_channel,
-                    'duration': 60
-                }, step_amount)
+                won, profit = await self.execute_precise_trade(
+                    Signal.immediate(asset, direction, 60, channel or self.active_channel), step_amount
+                )
             else:
                 # For Step 2, execute immediately
                 won, profit = await self.execute_immediate_trade(asset, direction, step_amount, channel or self.active_channel)
@@ -2451,15 +2813,9 @@ class MultiAssetPreciseTrader:
             # Execute trade based on step
             if current_step == 1:
                 # For Step 1, use precise timing
-                won, profit = await self.execute_precise_trade({
-                    'asset': asset,
-                    'direction': direction,
-                    'trade_datetime': get_user_time(),
-                    'signal_datetime': get_user_time(),
-                    'close_datetime': get_user_time() + timedelta(seconds=60),
-                    'channel': channel or self.active_channel,
-                    'duration': 60
-                }, step_amount)
+                won, profit = await self.execute_precise_trade(
+                    Signal.immediate(asset, direction, 60, channel or self.active_channel), step_amount
+                )
             else:
                 # For Step 2 and 3, execute immediately
                 won, profit = await self.execute_immediate_trade(asset, direction, step_amount, channel or self.active_channel)
@@ -2490,10 +2846,9 @@ class MultiAssetPreciseTrader:
                     return False, profit, 'completed'
                     
         except Exception as e:
-            error_msg = str(e).lower()
+            error_msg = str(e)
             # Check if broker closed the asset, market unavailable, or invalid asset
-            if ('closed' in error_msg or 'market' in error_msg or 'incorrectopentime' in error_msg or 
-                'not available' in error_msg or 'invalid asset' in error_msg or 'timeout' in error_msg):
+            if _SKIP_ERROR_RE.search(error_msg):
                 print(f"⚠️ {asset} SKIPPED - Broker closed, invalid, or unavailable")
                 print(f"🔄 Staying at C{current_cycle}S{current_step} - waiting for next signal")
                 # DO NOT record result - keep current step for next asset
@@ -2504,11 +2859,11 @@ class MultiAssetPreciseTrader:
                 strategy.record_result(False, asset, step_amount)
                 return False, -step_amount, 'error'
     
-    async def execute_single_2cycle_3step_trade_with_signal(self, signal: Dict, base_amount: float, strategy: 'TwoCycleThreeStepMartingaleStrategy') -> Tuple[bool, float, str]:
+    async def execute_single_2cycle_3step_trade_with_signal(self, signal: Signal, base_amount: float, strategy: 'TwoCycleThreeStepMartingaleStrategy') -> Tuple[bool, float, str]:
         """Execute a single trade in the 2-cycle 3-step sequence using signal data"""
-        asset = signal['asset']
-        direction = signal['direction']
-        channel = signal.get('channel', self.active_channel)
+        asset = signal.asset
+        direction = signal.direction
+        channel = (signal.channel or self.active_channel)
         
         current_cycle = strategy.get_asset_cycle(asset)
         current_step = strategy.get_asset_step(asset)
@@ -2560,15 +2915,14 @@ class MultiAssetPreciseTrader:
                     return False, profit, 'completed'
                     
         except Exception as e:
-            error_msg = str(e).lower()
+            error_msg = str(e)
             # Check if payout is too low
-            if 'payout too low' in error_msg:
+            if _PAYOUT_TOO_LOW_RE.search(error_msg):
                 print(f"⚠️ {asset} SKIPPED - Payout below 80% minimum")
                 print(f"🔄 Staying at C{current_cycle}S{current_step} - waiting for better payout")
                 return False, 0.0, 'skipped'
             # Check if broker closed the asset, market unavailable, or invalid asset
-            elif ('closed' in error_msg or 'market' in error_msg or 'incorrectopentime' in error_msg or 
-                'not available' in error_msg or 'invalid asset' in error_msg or 'timeout' in error_msg):
+            elif _SKIP_ERROR_RE.search(error_msg):
                 print(f"⚠️ {asset} SKIPPED - Broker closed, invalid, or unavailable")
                 print(f"🔄 Staying at C{current_cycle}S{current_step} - waiting for next signal")
                 return False, 0.0, 'skipped'
@@ -2580,6 +2934,8 @@ class MultiAssetPreciseTrader:
     
     async def execute_single_3cycle_2step_trade(self, asset: str, direction: str, base_amount: float, strategy: 'TwoStepMartingaleStrategy', channel: str = None) -> Tuple[bool, float, str]:
         """Execute a single trade in the 3-cycle 2-step sequence and return next action"""
+        # Pin asset to the current global cycle before the trade so concurrent losses don't shift it
+        strategy.ensure_asset(asset)
         current_cycle = strategy.get_asset_cycle(asset)
         current_step = strategy.get_asset_step(asset)
         step_amount = strategy.get_current_amount(asset)
@@ -2591,15 +2947,9 @@ class MultiAssetPreciseTrader:
             # Execute trade based on step
             if current_step == 1:
                 # For Step 1, use precise timing
-                won, profit = await self.execute_precise_trade({
-                    'asset': asset,
-                    'direction': direction,
-                    'trade_datetime': get_user_time(),
-                    'signal_datetime': get_user_time(),
-                    'close_datetime': get_user_time() + timedelta(seconds=60),
-                    'channel': channel or self.active_channel,
-                    'duration': 60
-                }, step_amount)
+                won, profit = await self.execute_precise_trade(
+                    Signal.immediate(asset, direction, 60, channel or self.active_channel), step_amount
+                )
             else:
                 # For Step 2, execute immediately
                 won, profit = await self.execute_immediate_trade(asset, direction, step_amount, channel or self.active_channel)
@@ -2630,15 +2980,14 @@ class MultiAssetPreciseTrader:
                     return False, profit, 'completed'
                     
         except Exception as e:
-            error_msg = str(e).lower()
+            error_msg = str(e)
             # Check if payout is too low
-            if 'payout too low' in error_msg:
+            if _PAYOUT_TOO_LOW_RE.search(error_msg):
                 print(f"⚠️ {asset} SKIPPED - Payout below 80% minimum")
                 print(f"🔄 Staying at C{current_cycle}S{current_step} - waiting for better payout")
                 return False, 0.0, 'skipped'
             # Check if broker closed the asset, market unavailable, or invalid asset
-            elif ('closed' in error_msg or 'market' in error_msg or 'incorrectopentime' in error_msg or 
-                'not available' in error_msg or 'invalid asset' in error_msg or 'timeout' in error_msg):
+            elif _SKIP_ERROR_RE.search(error_msg):
                 print(f"⚠️ {asset} SKIPPED - Broker closed, invalid, or unavailable")
                 print(f"🔄 Staying at C{current_cycle}S{current_step} - waiting for next signal")
                 return False, 0.0, 'skipped'
@@ -2665,15 +3014,9 @@ class MultiAssetPreciseTrader:
                 if current_step == 1:
                     # For Step 1, use the signal's scheduled time (if available) or execute immediately
                     duration_seconds = self.get_channel_duration(channel or self.active_channel)
-                    won, profit = await self.execute_precise_trade({
-                        'asset': asset,
-                        'direction': direction,
-                        'trade_datetime': get_user_time(),
-                        'signal_datetime': get_user_time(),
-                        'close_datetime': get_user_time() + timedelta(seconds=duration_seconds),
-                        'channel': channel or self.active_channel,
-                        'duration': duration_seconds
-                    }, step_amount)
+                    won, profit = await self.execute_precise_trade(
+                        Signal.immediate(asset, direction, duration_seconds, channel or self.active_channel), step_amount
+                    )
                 else:
                     # For Steps 2 and 3, execute immediately with channel-specific duration
                     won, profit = await self.execute_immediate_trade(asset, direction, step_amount, channel or self.active_channel)
@@ -2735,26 +3078,14 @@ class MultiAssetPreciseTrader:
             execution_time = get_user_time()
             
             # Check payout requirement (80% minimum)
-            payout_ok, payout = self.check_payout_requirement(asset)
-            if not payout_ok:
-                print(f"⚠️ SKIPPING {asset}: Payout {payout:.1f}% < {self.min_payout_percentage}% minimum")
-                raise Exception(f"Payout too low: {payout:.1f}% < {self.min_payout_percentage}%")
-            
-            print(f"✅ Payout check passed: {asset} = {payout:.1f}%")
+            self._require_payout(asset)
             
             # Use channel-specific duration
             dynamic_duration = self.get_channel_duration(channel or self.active_channel)
             target_close_time = execution_time + timedelta(seconds=dynamic_duration)
             
-            # Determine channel name for display
-            if channel == "po_advance_bot":
-                channel_name = "PO Advance Bot"
-            else:
-                # Use active channel if not specified
-                if self.active_channel == "po_advance_bot":
-                    channel_name = "PO Advance Bot"
-                else:
-                    channel_name = "Default"
+            # Determine channel name for display (active channel if not specified)
+            channel_name = self._channel_config.get(channel or self.active_channel, _DEFAULT_CHANNEL)[2]
             
             print(f"⚡ IMMEDIATE ({channel_name}): {asset} {direction.upper()} ${amount} (60s)")
             print(f"⏱️  Executing at: {get_user_time_str()}")
@@ -2766,7 +3097,7 @@ class MultiAssetPreciseTrader:
             
             try:
                 asset_name = self._map_asset_name(asset)
-                order_direction = OrderDirection.CALL if direction.lower() == 'call' else OrderDirection.PUT
+                order_direction = _DIR_MAP[direction]
                 
                 order_result = await self.client.place_order(
                     asset=asset_name,
@@ -2781,48 +3112,14 @@ class MultiAssetPreciseTrader:
                     
                     # Improved result checking with appropriate timeout based on duration
                     try:
-                        # Use appropriate timeout based on trade duration, but consistent check intervals
-                        if dynamic_duration >= 300:  # LC Trader (5:00) and James Martin (5:00)
-                            max_wait = min(330.0, dynamic_duration + 30.0)  # Max 330 seconds for 5:00 trades
-                        else:  # PO ADVANCE BOT and others (1:00)
-                            max_wait = min(80.0, dynamic_duration + 20.0)  # Max 80 seconds for 1:00 trades
-                        
-                        # Use consistent check interval for both channels
-                        check_interval = 0.01  # 10ms check interval for both channels
+                        # Use appropriate timeout based on trade duration
+                        max_wait = self._result_wait_limit(dynamic_duration)
                         
-                        print(f"⏳ Monitoring immediate result (max {max_wait:.0f}s, check every 10ms)...")
+                        print(f"⏳ Monitoring immediate result (max {max_wait:.0f}s, event-driven)...")
                         
-                        start_time = get_user_time()
-                        win_result = None
-                        
-                        # Use consistent polling intervals for both channels
-                        while (get_user_time() - start_time).total_seconds() < max_wait:
-                            try:
-                                win_result = await asyncio.wait_for(
-                                    self.client.check_win(order_result.order_id, max_wait_time=5.0),
-                                    timeout=5.0
-                                )
-                                
-                                if win_result and win_result.get('completed', False):
-                                    break
-                                
-                                elapsed = (get_user_time() - start_time).total_seconds()
-                                remaining = max_wait - elapsed
-                                if remaining > check_interval:
-                                    await asyncio.sleep(check_interval)
-                                else:
-                                    break
-                                    
-                            except asyncio.TimeoutError:
-                                elapsed = (get_user_time() - start_time).total_seconds()
-                                remaining = max_wait - elapsed
-                                if remaining > check_interval:
-                                    await asyncio.sleep(check_interval)
-                                else:
-                                    break
-                            except Exception as check_error:
-                                print(f"⚠️ Check error: {check_error}")
-                                await asyncio.sleep(check_interval)
+                        loop = asyncio.get_running_loop()
+                        start_time = loop.time()  # Monotonic - only used for the elapsed display
+                        win_result = await self._wait_for_order_result(order_result.order_id, max_wait)
                         
                         if win_result and win_result.get('completed', False):
                             result_type = win_result.get('result', 'unknown')
@@ -2832,7 +3129,7 @@ class MultiAssetPreciseTrader:
                             self.record_api_success()
                             return won, profit
                         else:
-                            elapsed = (get_user_time() - start_time).total_seconds()
+                            elapsed = loop.time() - start_time
                             print(f"⚠️ Immediate trade timeout after {elapsed:.0f}s - assuming loss")
                             # Don't fail the system, just assume loss and continue
                             return False, -amount
@@ -2847,8 +3144,7 @@ class MultiAssetPreciseTrader:
                     raise Exception("Immediate trade failed")
                     
             except Exception as api_error:
-                error_msg = str(api_error).lower()
-                if 'incorrectopentime' in error_msg or 'market' in error_msg or 'closed' in error_msg:
+                if _MARKET_CLOSED_RE.search(str(api_error)):
                     raise Exception(f"Market closed for {asset} - trade during market hours")
                 else:
                     print(f"❌ Immediate API Error: {api_error}")
@@ -2859,28 +3155,22 @@ class MultiAssetPreciseTrader:
             print(f"❌ Immediate trade error: {e}")
             raise Exception(f"Immediate trade failed: {e}")
     
-    async def execute_precise_trade(self, signal: Dict, amount: float) -> Tuple[bool, float]:
+    async def execute_precise_trade(self, signal: Signal, amount: float) -> Tuple[bool, float]:
         """Execute trade with precise UTC+6 timing - wait for exact signal time and execute within 10ms"""
         try:
-            asset = signal['asset']
-            direction = signal['direction']
-            signal_time = signal['signal_datetime']
-            channel = signal.get('channel', self.active_channel)
+            asset = signal.asset
+            direction = signal.direction
+            signal_time = signal.signal_datetime
+            channel = (signal.channel or self.active_channel)
             
             # Check payout requirement (80% minimum)
-            payout_ok, payout = self.check_payout_requirement(asset)
-            if not payout_ok:
-                print(f"⚠️ SKIPPING {asset}: Payout {payout:.1f}% < {self.min_payout_percentage}% minimum")
-                raise Exception(f"Payout too low: {payout:.1f}% < {self.min_payout_percentage}%")
-            
-            print(f"✅ Payout check passed: {asset} = {payout:.1f}%")
+            self._require_payout(asset)
             
             # Get channel-specific duration
-            if channel == "po_advance_bot":
-                dynamic_duration = self.po_advance_bot_duration
-                channel_name = "PO Advance Bot"
+            if channel in self._channel_config:
+                _, dynamic_duration, channel_name = self._channel_config[channel]
             else:
-                dynamic_duration = signal.get('duration', 300)  # Use signal duration or default to 5:00
+                dynamic_duration = signal.duration  # Use signal duration or default to 5:00
                 channel_name = "Default"
             
             duration_display = f"{dynamic_duration}s" if dynamic_duration < 60 else f"{dynamic_duration//60}:{dynamic_duration%60:02d}"
@@ -2893,23 +3183,23 @@ class MultiAssetPreciseTrader:
             target_signal_time = signal_time.replace(second=0, microsecond=0)  # Exact :00 seconds
             print(f"🎯 Waiting for EXACT time: {format_time_hmsms(target_signal_time)}")
             
-            # Precision timing loop - wait for exact second match
+            # Precision timing loop - wait for exact second match (plain epoch floats, no datetimes per iteration)
+            target_ts = target_signal_time.timestamp()
+            target_hms = target_signal_time.strftime('%H:%M:%S')
             while True:
-                current_time = get_user_time()
-                current_hms = current_time.strftime('%H:%M:%S')
-                target_hms = target_signal_time.strftime('%H:%M:%S')
+                # Calculate time until target
+                time_diff = target_ts - time.time()
                 
-                if current_hms == target_hms:
+                if -1.0 < time_diff <= 0.0:  # Within the target second (target is at .000)
                     # EXACT TIME MATCH! Wait 10ms then execute
                     await asyncio.sleep(0.01)  # Wait 10ms
                     execution_time = get_user_time()
                     print(f"✅ EXACT TIME MATCH! Executing at {format_time_hmsms(execution_time)} (10ms after match)")
                     break
                 else:
-                    # Calculate time until target
-                    time_diff = (target_signal_time - current_time).total_seconds()
                     if time_diff < 0:
                         # Signal time has passed
+                        current_hms = get_user_time().strftime('%H:%M:%S')
                         print(f"❌ Signal time {target_hms} has passed (current: {current_hms})")
                         raise Exception(f"Signal time {target_hms} has passed")
                     elif time_diff > 60:
@@ -2944,7 +3234,7 @@ class MultiAssetPreciseTrader:
             try:
                 # Real API execution with optimized asset format selection
                 asset_name = self._map_asset_name(asset)
-                order_direction = OrderDirection.CALL if direction.lower() == 'call' else OrderDirection.PUT
+                order_direction = _DIR_MAP[direction]
                 
                 print(f"🔄 Using API format: {asset_name}")
                 order_result = await self.client.place_order(
@@ -2961,47 +3251,14 @@ class MultiAssetPreciseTrader:
                     
                     # Monitor trade result with appropriate timeout based on duration
                     try:
-                        # Use appropriate timeout based on trade duration, but consistent check intervals
-                        if trade_duration >= 300:  # LC Trader (5:00) and James Martin (5:00)
-                            max_wait = min(330.0, trade_duration + 30.0)  # Max 330 seconds for 5:00 trades
-                        else:  # PO ADVANCE BOT and others (1:00)
-                            max_wait = min(80.0, trade_duration + 20.0)  # Max 80 seconds for 1:00 trades
-                        
-                        # Use consistent check interval for both channels
-                        check_interval = 0.01  # 10ms check interval for both channels
+                        # Use appropriate timeout based on trade duration
+                        max_wait = self._result_wait_limit(trade_duration)
                         
-                        print(f"⏳ Monitoring result (max {max_wait:.0f}s, check every 10ms)...")
+                        print(f"⏳ Monitoring result (max {max_wait:.0f}s, event-driven)...")
                         
-                        start_time = get_user_time()
-                        win_result = None
-                        
-                        while (get_user_time() - start_time).total_seconds() < max_wait:
-                            try:
-                                win_result = await asyncio.wait_for(
-                                    self.client.check_win(order_result.order_id, max_wait_time=5.0),
-                                    timeout=5.0
-                                )
-                                
-                                if win_result and win_result.get('completed', False):
-                                    break
-                                
-                                elapsed = (get_user_time() - start_time).total_seconds()
-                                remaining = max_wait - elapsed
-                                if remaining > check_interval:
-                                    await asyncio.sleep(check_interval)
-                                else:
-                                    break
-                                    
-                            except asyncio.TimeoutError:
-                                elapsed = (get_user_time() - start_time).total_seconds()
-                                remaining = max_wait - elapsed
-                                if remaining > check_interval:
-                                    await asyncio.sleep(check_interval)
-                                else:
-                                    break
-                            except Exception as check_error:
-                                print(f"⚠️ Check error: {check_error}")
-                                await asyncio.sleep(check_interval)
+                        loop = asyncio.get_running_loop()
+                        start_time = loop.time()  # Monotonic - only used for the elapsed display
+                        win_result = await self._wait_for_order_result(order_result.order_id, max_wait)
                         
                         # Process result
                         if win_result and win_result.get('completed', False):
@@ -3023,7 +3280,7 @@ class MultiAssetPreciseTrader:
                             
                             self.record_api_success()
                         else:
-                            elapsed = (get_user_time() - start_time).total_seconds()
+                            elapsed = loop.time() - start_time
                             print(f"❌ Result timeout after {elapsed:.0f}s - API connection failed")
                             self.record_api_failure()
                             raise Exception(f"API result timeout after {elapsed:.0f}s")
@@ -3038,8 +3295,7 @@ class MultiAssetPreciseTrader:
                     raise Exception(f"Trade placement failed")
                     
             except Exception as api_error:
-                error_msg = str(api_error).lower()
-                if 'incorrectopentime' in error_msg or 'market' in error_msg or 'closed' in error_msg:
+                if _MARKET_CLOSED_RE.search(str(api_error)):
                     raise Exception(f"Market closed for {asset} - trade during market hours")
                 else:
                     print(f"❌ API Error: {api_error}")
@@ -3051,21 +3307,27 @@ class MultiAssetPreciseTrader:
             
             # Record trade
             result_status = 'win' if won else ('draw' if profit == 0 else 'loss')
+            # Times are kept as datetimes - history is only read in-process, format them when displaying
             trade_record = {
                 'asset': asset,
                 'direction': direction,
                 'amount': amount,
                 'result': result_status,
                 'profit_loss': profit,
-                'execution_time': execution_time.isoformat(),
-                'signal_time': signal_time.isoformat(),
-                'close_time': actual_close_time.isoformat(),
-                'target_close_time': target_close_time.isoformat(),
+                'execution_time': execution_time,
+                'signal_time': signal_time,
+                'close_time': actual_close_time,
+                'target_close_time': target_close_time,
                 'duration_seconds': trade_duration,
                 'timing_strategy': 'precise_user_timezone_10ms_window',
                 'mode': 'real'
             }
             self.trade_history.append(trade_record)
+            self._history_profit += profit
+            if result_status == 'win':
+                self._wins += 1
+            elif result_status == 'loss':
+                self._losses += 1
             
             return won, profit
             
@@ -3097,15 +3359,9 @@ class MultiAssetPreciseTrader:
                 # Execute trade based on step
                 if current_step == 1 and step_count == 0:
                     # For first Step 1, use precise timing
-                    won, profit = await self.execute_precise_trade({
-                        'asset': asset,
-                        'direction': direction,
-                        'trade_datetime': get_user_time(),
-                        'signal_datetime': get_user_time(),
-                        'close_datetime': get_user_time() + timedelta(seconds=60),
-                        'channel': channel or self.active_channel,
-                        'duration': 60
-                    }, step_amount)
+                    won, profit = await self.execute_precise_trade(
+                        Signal.immediate(asset, direction, 60, channel or self.active_channel), step_amount
+                    )
                 else:
                     # For all other steps, execute immediately
                     won, profit = await self.execute_immediate_trade(asset, direction, step_amount, channel or self.active_channel)
@@ -3170,41 +3426,36 @@ class MultiAssetPreciseTrader:
                     # Show minimal status line
                     current_time_str = get_user_time_str()
                     print(f"\r⏰ Current: {current_time_str} | No signals | Scanning...", end="", flush=True)
-                    await asyncio.sleep(1)
+                    await self._wait_for_next_second()
                     continue
                 
                 # Find next upcoming signal and ready signals
                 current_time = get_user_time()
+                now = current_time.timestamp()
+                current_ts = int(now)
                 ready_signals = []
                 next_signal = None
                 
                 for signal in signals:
-                    current_hms = current_time.strftime('%H:%M:%S')
-                    signal_hms = signal['signal_datetime'].strftime('%H:%M:%S')
-                    
-                    # Check for EXACT time match (current time = signal time)
-                    if current_hms == signal_hms:
+                    # Check for EXACT time match (same epoch second) - plain integer compares, no strftime/timedelta
+                    if signal.execute_ts == current_ts:
                         ready_signals.append(signal)
-                    else:
-                        # Calculate time until signal
-                        time_until_signal = (signal['signal_datetime'] - current_time).total_seconds()
-                        if time_until_signal > 0 and next_signal is None:
-                            next_signal = signal
+                    elif next_signal is None and signal.execute_ts > now:
+                        next_signal = signal
                 
                 # Show clean status line
                 current_time_str = get_user_time_str()
                 if next_signal:
-                    next_time = next_signal['signal_datetime'].strftime('%H:%M:00')
-                    time_until = (next_signal['signal_datetime'] - current_time).total_seconds()
-                    wait_min = int(time_until // 60)
-                    wait_sec = int(time_until % 60)
+                    next_time = next_signal.signal_datetime.strftime('%H:%M:00')
+                    time_until = next_signal.execute_ts - now
+                    wait_min, wait_sec = divmod(int(time_until), 60)
                     
                     if ready_signals:
                         if len(ready_signals) == 1:
                             executing_signal = ready_signals[0]
-                            print(f"\r⏰ Current: {current_time_str} | EXECUTING: {executing_signal['asset']} {executing_signal['direction'].upper()} | Next: {next_time}", end="", flush=True)
+                            print(f"\r⏰ Current: {current_time_str} | EXECUTING: {executing_signal.asset} {executing_signal.direction.upper()} | Next: {next_time}", end="", flush=True)
                         else:
-                            assets_list = [f"{s['asset']} {s['direction'].upper()}" for s in ready_signals]
+                            assets_list = [f"{s.asset} {s.direction.upper()}" for s in ready_signals]
                             print(f"\r⏰ Current: {current_time_str} | EXECUTING {len(ready_signals)} ASSETS: {', '.join(assets_list[:2])}{'...' if len(assets_list) > 2 else ''} | Next: {next_time}", end="", flush=True)
                     else:
                         print(f"\r⏰ Current: {current_time_str} | Next: {next_time} in {wait_min}m{wait_sec}s", end="", flush=True)
@@ -3212,14 +3463,15 @@ class MultiAssetPreciseTrader:
                     if ready_signals:
                         if len(ready_signals) == 1:
                             executing_signal = ready_signals[0]
-                            print(f"\r⏰ Current: {current_time_str} | EXECUTING: {executing_signal['asset']} {executing_signal['direction'].upper()}", end="", flush=True)
+                            print(f"\r⏰ Current: {current_time_str} | EXECUTING: {executing_signal.asset} {executing_signal.direction.upper()}", end="", flush=True)
                         else:
                             print(f"\r⏰ Current: {current_time_str} | EXECUTING {len(ready_signals)} ASSETS SIMULTANEOUSLY", end="", flush=True)
                     else:
                         print(f"\r⏰ Current: {current_time_str} | No upcoming signals", end="", flush=True)
                 
                 if not ready_signals:
-                    await asyncio.sleep(1)
+                    # Redraw once per second on the boundary - fixed 1s sleeps drift and can skip a signal's second
+                    await self._wait_for_next_second()
                     continue
                 
                 # Process ready signals - handle multiple assets at same time
@@ -3227,8 +3479,8 @@ class MultiAssetPreciseTrader:
                     if len(ready_signals) == 1:
                         # Single signal - execute normally
                         signal = ready_signals[0]
-                        asset = signal['asset']
-                        direction = signal['direction']
+                        asset = signal.asset
+                        direction = signal.direction
                         current_step = strategy.get_asset_step(asset)
                         
                         print(f"\n🚀 EXECUTING: {asset} {direction.upper()} - Step {current_step}")
@@ -3248,7 +3500,7 @@ class MultiAssetPreciseTrader:
                             
                         except Exception as sequence_error:
                             print(f"❌ Error for {asset}: {sequence_error}")
-                            strategy.asset_strategies[asset] = {'step': 1, 'amounts': []}
+                            strategy.reset_asset(asset)
                     
                     else:
                         # Multiple signals at same time - execute concurrently
@@ -3257,8 +3509,8 @@ class MultiAssetPreciseTrader:
                         # Create concurrent tasks for all ready signals
                         tasks = []
                         for signal in ready_signals:
-                            asset = signal['asset']
-                            direction = signal['direction']
+                            asset = signal.asset
+                            direction = signal.direction
                             current_step = strategy.get_asset_step(asset)
                             
                             print(f"   📊 {asset} {direction.upper()} - Step {current_step}")
@@ -3280,7 +3532,7 @@ class MultiAssetPreciseTrader:
                             
                             if isinstance(result, Exception):
                                 print(f"❌ {asset} Error: {result}")
-                                strategy.asset_strategies[asset] = {'step': 1, 'amounts': []}
+                                strategy.reset_asset(asset)
                                 continue
                             
                             final_won, total_profit = result
@@ -3341,11 +3593,10 @@ class MultiAssetPreciseTrader:
                 print(f"✅ Found {len(initial_signals)} signals in CSV:")
                 current_time = get_user_time()
                 for i, signal in enumerate(initial_signals[:5]):  # Show first 5
-                    time_until = (signal['trade_datetime'] - current_time).total_seconds()
-                    wait_minutes = int(time_until // 60)
-                    wait_seconds = int(time_until % 60)
+                    time_until = signal.execute_ts - current_time.timestamp()  # Epoch seconds, no timedelta
+                    wait_minutes, wait_seconds = divmod(int(time_until), 60)
                     status = "Ready!" if time_until <= 5 else f"in {wait_minutes}m {wait_seconds}s"
-                    print(f"   {i+1}. {signal['asset']} {signal['direction'].upper()} at {signal['signal_time']} ({status})")
+                    print(f"   {i+1}. {signal.asset} {signal.direction.upper()} at {signal.signal_time} ({status})")
                 if len(initial_signals) > 5:
                     print(f"   ... and {len(initial_signals) - 5} more signals")
             else:
@@ -3368,36 +3619,29 @@ class MultiAssetPreciseTrader:
                 if self.pending_immediate_trades:
                     print(f"\n⚡ PROCESSING {len(self.pending_immediate_trades)} IMMEDIATE TRADES")
                     
-                    immediate_tasks = []
-                    for immediate_trade in self.pending_immediate_trades:
-                        asset = immediate_trade['asset']
-                        direction = immediate_trade['direction']
-                        amount = immediate_trade['amount']
-                        step = immediate_trade['step']
-                        
-                        print(f"⚡ IMMEDIATE Step {step}: {asset} {direction.upper()} ${amount}")
-                        
-                        # Execute immediate trade
-                        task = asyncio.create_task(
-                            self.execute_immediate_trade(asset, direction, amount)
-                        )
-                        immediate_tasks.append((task, asset, direction, amount, step))
-                    
-                    # Clear pending trades
-                    self.pending_immediate_trades.clear()
+                    # Take the queued batch; follow-up steps queued below go into a fresh list
+                    immediate_batch = self.pending_immediate_trades
+                    self.pending_immediate_trades = []
+                    for immediate_trade in immediate_batch:
+                        print(f"⚡ IMMEDIATE Step {immediate_trade['step']}: {immediate_trade['asset']} {immediate_trade['direction'].upper()} ${immediate_trade['amount']}")
                     
-                    # Wait for all immediate trades to complete
-                    if immediate_tasks:
-                        results = await asyncio.gather(*[task for task, _, _, _, _ in immediate_tasks], return_exceptions=True)
+                    # Wait for all immediate trades to complete - a failed trade must not cancel the others
+                    if immediate_batch:
+                        results = await asyncio.gather(
+                            *(self.execute_immediate_trade(t['asset'], t['direction'], t['amount']) for t in immediate_batch),
+                            return_exceptions=True
+                        )
                         
-                        # Process immediate trade results
-                        for i, result in enumerate(results):
+                        # Process immediate trade results (same order as the batch)
+                        for i, (immediate_trade, result) in enumerate(zip(immediate_batch, results)):
                             if isinstance(result, Exception):
                                 print(f"❌ Immediate trade {i+1} failed: {result}")
                                 continue
                             
                             won, profit = result
-                            _, asset, direction, amount, step = immediate_tasks[i]
+                            asset = immediate_trade['asset']
+                            direction = immediate_trade['direction']
+                            amount = immediate_trade['amount']
                             
                             # Update session profit using class method
                             self.update_session_profit(profit)
@@ -3422,8 +3666,8 @@ class MultiAssetPreciseTrader:
                                 print(f"🔄 {asset} strategy reset - ready for new signals")
                         
                         # Show session stats after immediate trades
-                        wins = len([t for t in self.trade_history if t['result'] == 'win'])
-                        losses = len([t for t in self.trade_history if t['result'] == 'loss'])
+                        wins = self._wins
+                        losses = self._losses
                         
                         print(f"📊 {self.get_session_status()} | Trades: {session_trades}")
                         print(f"🏆 Results: {wins}W/{losses}L")
@@ -3453,45 +3697,46 @@ class MultiAssetPreciseTrader:
                 if signals:
                     current_time = get_user_time()
                     current_time_str = get_user_time_str()
-                    ready_signals = []
-                    future_signals = []
                     
                     print(f"⏰ CURRENT TIME (UTC+6): {current_time_str}")
                     
-                    for signal in signals:
-                        current_time_hms = current_time.strftime('%H:%M:%S')
-                        signal_time_hms = signal['signal_datetime'].strftime('%H:%M:%S')
-                        
-                        # Check for EXACT time match (current time = signal time)
-                        if current_time_hms == signal_time_hms:
-                            print(f"🎯 EXACT TIME MATCH: {signal['asset']} {signal['direction'].upper()}")
-                            print(f"   Current: {current_time_hms} = Signal: {signal_time_hms} ✅")
-                            ready_signals.append(signal)
-                        else:
-                            # Calculate time difference
-                            time_until_signal = (signal['signal_datetime'] - current_time).total_seconds()
-                            if time_until_signal > 0:
-                                future_signals.append((signal, time_until_signal))
-                            else:
-                                # Signal time has passed
-                                print(f"⏰ MISSED: {signal['asset']} {signal['direction'].upper()} at {signal_time_hms}")
-                                continue
+                    current_time_hms = current_time.strftime('%H:%M:%S')
+                    now = current_time.timestamp()
+                    current_ts = int(now)
                     
-                    if future_signals:
-                        print(f"📅 UPCOMING SIGNALS:")
-                        for signal, wait_time in sorted(future_signals, key=lambda x: x[1])[:5]:  # Show next 5
-                            wait_minutes = int(wait_time // 60)
-                            wait_seconds = int(wait_time % 60)
-                            signal_time_display = signal['signal_time'] if 'signal_time' in signal else signal['signal_datetime'].strftime('%H:%M')
-                            print(f"   {signal['asset']} {signal['direction'].upper()} at {signal_time_display} (in {wait_minutes}m {wait_seconds}s)")
+                    # Vectorized split on the epoch column instead of a Python compare per signal
+                    missed_signals, ready_signals, upcoming_signals = self.split_signals(current_ts)
+                    
+                    for signal in missed_signals:
+                        # Signal time has passed
+                        print(f"⏰ MISSED: {signal.asset} {signal.direction.upper()} at {signal.signal_datetime.strftime('%H:%M:%S')}")
+                    
+                    for signal in ready_signals:
+                        # EXACT time match (current second = signal second)
+                        print(f"🎯 EXACT TIME MATCH: {signal.asset} {signal.direction.upper()}")
+                        print(f"   Current: {current_time_hms} = Signal: {current_time_hms} ✅")
+                    
+                    # Wait times only for the signals shown (epoch seconds - no timedelta per signal)
+                    future_signals = [(signal, signal.execute_ts - now) for signal in upcoming_signals[:5]]
+                    
+                    if future_signals and self.verbose:
+                        out = ["📅 UPCOMING SIGNALS:"]  # Buffered: one write per tick instead of a print per signal
+                        # Signals arrive in execution order, so future_signals is already sorted by wait time
+                        for signal, wait_time in future_signals:  # Show next 5
+                            wait_minutes, wait_seconds = divmod(int(wait_time), 60)
+                            signal_time_display = signal.signal_time or signal.signal_datetime.strftime('%H:%M')
+                            out.append(f"   {signal.asset} {signal.direction.upper()} at {signal_time_display} (in {wait_minutes}m {wait_seconds}s)")
+                        sys.stdout.write("\n".join(out) + "\n")
                     
                     if not ready_signals:
                         if future_signals:
-                            next_signal, next_wait = min(future_signals, key=lambda x: x[1])
-                            wait_minutes = int(next_wait // 60)
-                            wait_seconds = int(next_wait % 60)
-                            print(f"⏰ Next signal: {next_signal['asset']} {next_signal['direction'].upper()} in {wait_minutes}m {wait_seconds}s")
-                        await asyncio.sleep(1)  # Wait 1 seconds and check again
+                            next_signal, next_wait = future_signals[0]
+                            wait_minutes, wait_seconds = divmod(int(next_wait), 60)
+                            print(f"⏰ Next signal: {next_signal.asset} {next_signal.direction.upper()} in {wait_minutes}m {wait_seconds}s")
+                            # Sleep until just before the next signal (or a CSV change), then poll tightly into its second
+                            await self._wait_for_next_signal(next_wait)
+                        else:
+                            await asyncio.sleep(1)
                         continue
                     
                     # Process only ready signals
@@ -3511,13 +3756,13 @@ class MultiAssetPreciseTrader:
                         blocked_signals = []
                         
                         for signal in signals:
-                            if signal['asset'] in assets_in_sequence:
+                            if strategy.is_in_sequence(signal.asset):
                                 priority_signals.append(signal)
                             else:
                                 blocked_signals.append(signal)
                         
                         if blocked_signals:
-                            blocked_assets = [s['asset'] for s in blocked_signals]
+                            blocked_assets = [s.asset for s in blocked_signals]
                             print(f"⏸️  Blocking new assets: {', '.join(blocked_assets)} (waiting for sequences to complete)")
                         
                         # Process only priority signals (assets in sequence)
@@ -3530,67 +3775,88 @@ class MultiAssetPreciseTrader:
                     if signals_to_process:
                         print("=" * 50)
                         
-                        # Create tasks for selected signals - but execute martingale sequences sequentially
+                        async def run_sequence(signal: Signal) -> Tuple[Signal, Any]:
+                            # Sequences on different assets run concurrently; same-asset signals queue on its lock
+                            async with strategy.asset_lock(signal.asset):
+                                try:
+                                    return signal, await self.execute_martingale_sequence(
+                                        signal.asset, signal.direction, base_amount, strategy, self.active_channel
+                                    )
+                                except Exception as e:
+                                    return signal, e
+                        
+                        # Launch one martingale sequence task per selected signal
                         for signal in signals_to_process:
-                            asset = signal['asset']
-                            direction = signal['direction']
-                            
-                            # Each asset gets its own independent step progression
-                            current_step = strategy.get_asset_step(asset)
-                            
-                            print(f"📊 {asset} {direction.upper()} - {strategy.get_status(asset)}")
-                            print(f"⏰ Signal: {signal['signal_time']} | Trade: {signal['trade_datetime'].strftime('%H:%M:%S')}")
-                            
-                            # Execute complete martingale sequence for this asset
-                            try:
-                                print(f"🚀 EXECUTING MARTINGALE SEQUENCE FOR {asset}")
-                                
-                                # Execute the complete sequence and wait for final result
-                                final_won, total_profit = await self.execute_martingale_sequence(
-                                    asset, direction, base_amount, strategy, self.active_channel
-                                )
+                            print(f"📊 {signal.asset} {signal.direction.upper()} - {strategy.get_status(signal.asset)}")
+                            print(f"⏰ Signal: {signal.signal_time} | Trade: {signal.trade_datetime.strftime('%H:%M:%S')}")
+                            print(f"🚀 EXECUTING MARTINGALE SEQUENCE FOR {signal.asset}")
+                        
+                        tasks = [asyncio.create_task(run_sequence(signal)) for signal in signals_to_process]
+                        try:
+                            # Handle each sequence as soon as it finishes so the stop check sees every result
+                            for next_done in asyncio.as_completed(tasks):
+                                signal, result = await next_done
+                                asset = signal.asset
                                 
-                                # Update session profit using class method
-                                self.update_session_profit(total_profit)
-                                session_trades += 1  # Count as one sequence
+                                # Result of the complete martingale sequence for this asset
+                                try:
+                                    if isinstance(result, Exception):
+                                        raise result
+                                    final_won, total_profit = result
                                 
-                                if final_won:
-                                    print(f"🎉 {asset} SEQUENCE WIN! Total profit: ${total_profit:+.2f}")
-                                else:
-                                    print(f"💔 {asset} SEQUENCE LOSS! Total loss: ${total_profit:+.2f}")
+                                    # Update session profit using class method
+                                    self.update_session_profit(total_profit)
+                                    session_trades += 1  # Count as one sequence
                                 
-                            except Exception as sequence_error:
-                                print(f"❌ Martingale sequence error for {asset}: {sequence_error}")
-                                # Reset the asset strategy on error
-                                strategy.asset_strategies[asset] = {'step': 1, 'amounts': []}
-                            
-                            # Show session stats after each sequence
-                            wins = len([t for t in self.trade_history if t['result'] == 'win'])
-                            losses = len([t for t in self.trade_history if t['result'] == 'loss'])
-                            
-                            print(f"\n📊 TRADING SESSION:")
-                            print(f"   💰 {self.get_session_status()}")
-                            print(f"   📈 Total Trades: {session_trades}")
-                            print(f"   🏆 Results: {wins}W/{losses}L")
-                            
-                            # Check stop conditions after each sequence
-                            should_stop, stop_reason = self.should_stop_trading()
-                            if should_stop:
-                                print(f"\n{stop_reason}")
-                                print(f"🏁 Trading session ended")
-                                return  # Exit the trading method
-                            
-                            # Show current status of all active assets
-                            active_assets = strategy.get_all_active_assets()
-                            if active_assets:
-                                print(f"   📊 Asset Status:")
-                                for asset_name in active_assets:
-                                    status = strategy.get_status(asset_name)
-                                    step = strategy.get_asset_step(asset_name)
-                                    if step > 1:
-                                        print(f"      🎯 {status} (IN SEQUENCE)")
+                                    if final_won:
+                                        print(f"🎉 {asset} SEQUENCE WIN! Total profit: ${total_profit:+.2f}")
                                     else:
-                                        print(f"      ✅ {status} (READY)")
+                                        print(f"💔 {asset} SEQUENCE LOSS! Total loss: ${total_profit:+.2f}")
+                                
+                                except Exception as sequence_error:
+                                    print(f"❌ Martingale sequence error for {asset}: {sequence_error}")
+                                    # Reset the asset strategy on error
+                                    strategy.reset_asset(asset)
+                                
+                                # Show session stats after each sequence
+                                wins = self._wins
+                                losses = self._losses
+                                
+                                if self.verbose:
+                                    # One buffered write for the whole block instead of a print per line
+                                    sys.stdout.write("\n".join((
+                                        "\n📊 TRADING SESSION:",
+                                        f"   💰 {self.get_session_status()}",
+                                        f"   📈 Total Trades: {session_trades}",
+                                        f"   🏆 Results: {wins}W/{losses}L",
+                                    )) + "\n")
+                                
+                                # Check stop conditions after each sequence
+                                should_stop, stop_reason = self.should_stop_trading()
+                                if should_stop:
+                                    print(f"\n{stop_reason}")
+                                    print(f"🏁 Trading session ended")
+                                    return  # Exit the trading method
+                                
+                                # Show current status of all active assets
+                                active_assets = strategy.get_all_active_assets()
+                                if active_assets:
+                                    print(f"   📊 Asset Status:")
+                                    for asset_name in active_assets:
+                                        status = strategy.get_status(asset_name)
+                                        step = strategy.get_asset_step(asset_name)
+                                        if step > 1:
+                                            print(f"      🎯 {status} (IN SEQUENCE)")
+                                        else:
+                                            print(f"      ✅ {status} (READY)")
+                        finally:
+                            # Once a limit is hit (or on interrupt) sequences still running must not open more steps
+                            pending = [task for task in tasks if not task.done()]
+                            for task in pending:
+                                task.cancel()
+                            if pending:
+                                print(f"⏹️  Cancelling {len(pending)} running sequence(s)")
+                                await asyncio.gather(*pending, return_exceptions=True)
                 
                 await asyncio.sleep(1)  # 1s check interval
                 
@@ -3601,9 +3867,9 @@ class MultiAssetPreciseTrader:
         
         # Final stats
         total_trades = len(self.trade_history)
-        total_wins = len([t for t in self.trade_history if t['result'] == 'win'])
-        total_losses = len([t for t in self.trade_history if t['result'] == 'loss'])
-        total_profit = sum([t['profit_loss'] for t in self.trade_history])
+        total_wins = self._wins
+        total_losses = self._losses
+        total_profit = self._history_profit
         
         print(f"\n📊 FINAL STATISTICS:")
         print(f"   💰 {self.get_session_status()}")
@@ -3650,7 +3916,7 @@ class MultiAssetPreciseTrader:
         print("=" * 60)
         
         session_trades = 0
-        processed_signals = set()  # Track processed signals to avoid duplicates
+        processed_signals: Dict[Tuple, None] = {}  # Processed signals in insertion order (bounded, avoids duplicates)
         
         try:
             # Show initial signal overview
@@ -3660,11 +3926,10 @@ class MultiAssetPreciseTrader:
                 print(f"✅ Found {len(initial_signals)} signals in CSV:")
                 current_time = get_user_time()
                 for i, signal in enumerate(initial_signals[:5]):  # Show first 5
-                    time_until = (signal['trade_datetime'] - current_time).total_seconds()
-                    wait_minutes = int(time_until // 60)
-                    wait_seconds = int(time_until % 60)
+                    time_until = signal.execute_ts - current_time.timestamp()  # Epoch seconds, no timedelta
+                    wait_minutes, wait_seconds = divmod(int(time_until), 60)
                     status = "Ready!" if time_until <= 5 else f"in {wait_minutes}m {wait_seconds}s"
-                    print(f"   {i+1}. {signal['asset']} {signal['direction'].upper()} at {signal['signal_time']} ({status})")
+                    print(f"   {i+1}. {signal.asset} {signal.direction.upper()} at {signal.signal_time} ({status})")
                 if len(initial_signals) > 5:
                     print(f"   ... and {len(initial_signals) - 5} more signals")
             else:
@@ -3687,9 +3952,8 @@ class MultiAssetPreciseTrader:
                 signals = self.get_signals_from_csv()
                 
                 if not signals:
-                    # Show current time and status
-                    current_time_display = get_user_time().strftime('%H:%M:%S')
-                    print(f"\n🔄 [{current_time_display}] No signals ready - scanning for upcoming trades...")
+                    # Show current time and status (already formatted for this tick)
+                    print(f"\n🔄 [{current_time_str}] No signals ready - scanning for upcoming trades...")
                     await asyncio.sleep(1)  # Check every 1 seconds
                     continue
                 
@@ -3697,48 +3961,48 @@ class MultiAssetPreciseTrader:
                 if signals:
                     current_time = get_user_time()
                     current_time_str = current_time.strftime('%H:%M:%S')
+                    now = current_time.timestamp()
+                    current_ts = int(now)
                     ready_signals = []
-                    future_signals = []
                     
                     print(f"⏰ CURRENT TIME: {current_time_str}")
                     
-                    for signal in signals:
-                        # Create unique signal ID
-                        signal_id = f"{signal['asset']}_{signal['direction']}_{signal['signal_time']}"
+                    # Vectorized split on the epoch column; only due signals can already be processed
+                    _, due_signals, upcoming_signals = self.split_signals(current_ts)
+                    
+                    for signal in due_signals:
+                        # Create unique signal ID (tuple key - hashed directly, no string formatting per tick)
+                        signal_id = (signal.asset, signal.direction, signal.signal_time)
                         
                         # Skip if already processed
                         if signal_id in processed_signals:
                             continue
                         
-                        current_time_hms = current_time.strftime('%H:%M:%S')
-                        signal_time_hms = signal['signal_datetime'].strftime('%H:%M:%S')
-                        
-                        # Check for EXACT time match
-                        if current_time_hms == signal_time_hms:
-                            print(f"🎯 EXACT TIME MATCH: {signal['asset']} {signal['direction'].upper()}")
-                            print(f"   Current: {current_time_hms} = Signal: {signal_time_hms} ✅")
-                            ready_signals.append(signal)
-                        else:
-                            # Calculate time difference
-                            time_until_signal = (signal['signal_datetime'] - current_time).total_seconds()
-                            if time_until_signal > 0:
-                                future_signals.append((signal, time_until_signal))
+                        # EXACT time match
+                        print(f"🎯 EXACT TIME MATCH: {signal.asset} {signal.direction.upper()}")
+                        print(f"   Current: {current_time_str} = Signal: {current_time_str} ✅")
+                        ready_signals.append(signal)
                     
-                    if future_signals:
-                        print(f"📅 UPCOMING SIGNALS:")
-                        for signal, wait_time in sorted(future_signals, key=lambda x: x[1])[:5]:
-                            wait_minutes = int(wait_time // 60)
-                            wait_seconds = int(wait_time % 60)
-                            signal_time_display = signal['signal_time'] if 'signal_time' in signal else signal['signal_datetime'].strftime('%H:%M')
-                            print(f"   {signal['asset']} {signal['direction'].upper()} at {signal_time_display} (in {wait_minutes}m {wait_seconds}s)")
+                    # Wait times only for the signals shown (epoch seconds - no timedelta per signal)
+                    future_signals = [(signal, signal.execute_ts - now) for signal in upcoming_signals[:5]]
+                    
+                    if future_signals and self.verbose:
+                        out = ["📅 UPCOMING SIGNALS:"]  # Buffered: one write per tick instead of a print per signal
+                        for signal, wait_time in future_signals:  # Already in wait-time order
+                            wait_minutes, wait_seconds = divmod(int(wait_time), 60)
+                            signal_time_display = signal.signal_time or signal.signal_datetime.strftime('%H:%M')
+                            out.append(f"   {signal.asset} {signal.direction.upper()} at {signal_time_display} (in {wait_minutes}m {wait_seconds}s)")
+                        sys.stdout.write("\n".join(out) + "\n")
                     
                     if not ready_signals:
                         if future_signals:
-                            next_signal, next_wait = min(future_signals, key=lambda x: x[1])
-                            wait_minutes = int(next_wait // 60)
-                            wait_seconds = int(next_wait % 60)
-                            print(f"⏰ Next signal: {next_signal['asset']} {next_signal['direction'].upper()} in {wait_minutes}m {wait_seconds}s")
-                        await asyncio.sleep(1)
+                            next_signal, next_wait = future_signals[0]
+                            wait_minutes, wait_seconds = divmod(int(next_wait), 60)
+                            print(f"⏰ Next signal: {next_signal.asset} {next_signal.direction.upper()} in {wait_minutes}m {wait_seconds}s")
+                            # Sleep until just before the next signal (or a CSV change), then poll tightly into its second
+                            await self._wait_for_next_signal(next_wait)
+                        else:
+                            await asyncio.sleep(1)
                         continue
                     
                     # Process ready signals
@@ -3750,17 +4014,17 @@ class MultiAssetPreciseTrader:
                     print("=" * 50)
                     
                     for signal in signals:
-                        asset = signal['asset']
-                        direction = signal['direction']
+                        asset = signal.asset
+                        direction = signal.direction
                         
                         # Create unique signal ID
-                        signal_id = f"{asset}_{direction}_{signal['signal_time']}"
+                        signal_id = (asset, direction, signal.signal_time)
                         
                         # Mark as processed
-                        processed_signals.add(signal_id)
+                        mark_processed(processed_signals, signal_id)
                         
                         print(f"📊 {asset} {direction.upper()} - Single Trade")
-                        print(f"⏰ Signal: {signal['signal_time']} | Trade: {signal['trade_datetime'].strftime('%H:%M:%S')}")
+                        print(f"⏰ Signal: {signal.signal_time} | Trade: {signal.trade_datetime.strftime('%H:%M:%S')}")
                         
                         # Execute single trade
                         try:
@@ -3784,13 +4048,17 @@ class MultiAssetPreciseTrader:
                             print(f"❌ Trade error for {asset}: {trade_error}")
                         
                         # Show session stats
-                        wins = len([t for t in self.trade_history if t['result'] == 'win'])
-                        losses = len([t for t in self.trade_history if t['result'] == 'loss'])
+                        wins = self._wins
+                        losses = self._losses
                         
-                        print(f"\n📊 TRADING SESSION:")
-                        print(f"   💰 {self.get_session_status()}")
-                        print(f"   📈 Total Trades: {session_trades}")
-                        print(f"   🏆 Results: {wins}W/{losses}L")
+                        if self.verbose:
+                            # One buffered write for the whole block instead of a print per line
+                            sys.stdout.write("\n".join((
+                                "\n📊 TRADING SESSION:",
+                                f"   💰 {self.get_session_status()}",
+                                f"   📈 Total Trades: {session_trades}",
+                                f"   🏆 Results: {wins}W/{losses}L",
+                            )) + "\n")
                         
                         # Check stop conditions
                         should_stop, stop_reason = self.should_stop_trading()
@@ -3808,9 +4076,9 @@ class MultiAssetPreciseTrader:
         
         # Final stats
         total_trades = len(self.trade_history)
-        total_wins = len([t for t in self.trade_history if t['result'] == 'win'])
-        total_losses = len([t for t in self.trade_history if t['result'] == 'loss'])
-        total_profit = sum([t['profit_loss'] for t in self.trade_history])
+        total_wins = self._wins
+        total_losses = self._losses
+        total_profit = self._history_profit
         
         print(f"\n📊 FINAL STATISTICS:")
         print(f"   💰 {self.get_session_status()}")
@@ -3862,14 +4130,14 @@ class MultiAssetPreciseTrader:
         print("=" * 60)
         
         # GLOBAL cycle tracker (applies to ALL assets)
-        global_cycle_tracker = {
-            'current_cycle': 1,  # Global cycle: 1, 2, or 3
-            'cycle_1_last_amount': base_amount * (multiplier ** 2),
-            'config': {'base_amount': base_amount, 'multiplier': multiplier}
-        }
+        global_cycle_tracker = GlobalCycleTracker(
+            base_amount=base_amount,
+            multiplier=multiplier,
+            cycle_1_last_amount=base_amount * (multiplier ** 2)
+        )
         
         # Per-asset step tracker (each asset has its own step within the global cycle)
-        asset_step_trackers = {}  # {asset: {'current_step': 1}}
+        asset_step_trackers: Dict[str, AssetTracker] = {}
         
         session_trades = 0
         
@@ -3881,11 +4149,10 @@ class MultiAssetPreciseTrader:
                 print(f"✅ Found {len(initial_signals)} signals in CSV:")
                 current_time = get_user_time()
                 for i, signal in enumerate(initial_signals[:5]):
-                    time_until = (signal['trade_datetime'] - current_time).total_seconds()
-                    wait_minutes = int(time_until // 60)
-                    wait_seconds = int(time_until % 60)
+                    time_until = signal.execute_ts - current_time.timestamp()  # Epoch seconds, no timedelta
+                    wait_minutes, wait_seconds = divmod(int(time_until), 60)
                     status = "Ready!" if time_until <= 5 else f"in {wait_minutes}m {wait_seconds}s"
-                    print(f"   {i+1}. {signal['asset']} {signal['direction'].upper()} at {signal['signal_time']} ({status})")
+                    print(f"   {i+1}. {signal.asset} {signal.direction.upper()} at {signal.signal_time} ({status})")
                 if len(initial_signals) > 5:
                     print(f"   ... and {len(initial_signals) - 5} more signals")
             else:
@@ -3912,38 +4179,42 @@ class MultiAssetPreciseTrader:
                 # Check for exact time match
                 current_time = get_user_time()
                 current_time_str = current_time.strftime('%H:%M:%S')
-                ready_signals = []
                 
                 print(f"⏰ CURRENT TIME: {current_time_str}")
                 
-                for signal in signals:
-                    signal_time_hms = signal['signal_datetime'].strftime('%H:%M:%S')
-                    if current_time_str == signal_time_hms:
-                        print(f"🎯 EXACT TIME MATCH: {signal['asset']} {signal['direction'].upper()}")
-                        ready_signals.append(signal)
+                # Signals are bucketed by execution second - look up this tick's bucket directly
+                current_ts = int(current_time.timestamp())
+                ready_signals = self.get_signals_due(current_ts)
+                for signal in ready_signals:
+                    print(f"🎯 EXACT TIME MATCH: {signal.asset} {signal.direction.upper()}")
                 
                 if not ready_signals:
-                    await asyncio.sleep(1)
+                    # Signals are in execution order - sleep until just before the first upcoming one
+                    next_ts = next((signal.execute_ts for signal in signals if signal.execute_ts > current_ts), None)
+                    if next_ts is not None:
+                        await self._wait_for_next_signal(next_ts - current_time.timestamp())
+                    else:
+                        await asyncio.sleep(1)
                     continue
                 
                 # Process ready signals
-                current_global_cycle = global_cycle_tracker['current_cycle']
+                current_global_cycle = global_cycle_tracker.current_cycle
                 print(f"\n📊 PROCESSING {len(ready_signals)} SIGNALS (GLOBAL CYCLE {current_global_cycle}):")
                 print("=" * 50)
                 
                 for signal in ready_signals:
-                    asset = signal['asset']
-                    direction = signal['direction']
+                    asset = signal.asset
+                    direction = signal.direction
                     
                     # Initialize step tracker for this asset if not exists
-                    if asset not in asset_step_trackers:
-                        asset_step_trackers[asset] = {'current_step': 1}
-                    
-                    asset_tracker = asset_step_trackers[asset]
-                    current_step = asset_tracker['current_step']
+                    asset_tracker = asset_step_trackers.get(asset)
+                    if asset_tracker is None:
+                        asset_tracker = asset_step_trackers[asset] = AssetTracker(generation=global_cycle_tracker.generation)
+                    asset_tracker.sync(global_cycle_tracker.generation)
+                    current_step = asset_tracker.current_step
                     
                     print(f"📊 {asset} {direction.upper()} - Global Cycle {current_global_cycle}, Step {current_step}")
-                    print(f"⏰ Signal: {signal['signal_time']}")
+                    print(f"⏰ Signal: {signal.signal_time}")
                     
                     # Execute sequence for this asset using global cycle
                     try:
@@ -3962,35 +4233,37 @@ class MultiAssetPreciseTrader:
                             print(f"🎉 {asset} WIN! Profit: ${total_profit:+.2f}")
                             print(f"🔄 GLOBAL RESET: All assets return to Cycle 1")
                             # Reset global cycle to 1
-                            global_cycle_tracker['current_cycle'] = 1
-                            # Reset all asset steps
-                            for a in asset_step_trackers:
-                                asset_step_trackers[a]['current_step'] = 1
+                            global_cycle_tracker.current_cycle = 1
+                            # Reset all asset steps (O(1) - no per-asset loop)
+                            global_cycle_tracker.reset_asset_steps()
                         else:
                             print(f"💔 {asset} SEQUENCE COMPLETE! P&L: ${total_profit:+.2f}")
                             # Check if we need to advance global cycle
-                            if asset_tracker['current_step'] > 3:
+                            if asset_tracker.current_step > 3:
                                 # This asset completed all 3 steps - advance global cycle
                                 if current_global_cycle < 3:
-                                    global_cycle_tracker['current_cycle'] += 1
-                                    print(f"🔄 GLOBAL CYCLE ADVANCED: Cycle {current_global_cycle} → Cycle {global_cycle_tracker['current_cycle']}")
-                                    print(f"   All upcoming assets will start at Cycle {global_cycle_tracker['current_cycle']}")
-                                    # Reset all asset steps for new cycle
-                                    for a in asset_step_trackers:
-                                        asset_step_trackers[a]['current_step'] = 1
+                                    global_cycle_tracker.current_cycle += 1
+                                    print(f"🔄 GLOBAL CYCLE ADVANCED: Cycle {current_global_cycle} → Cycle {global_cycle_tracker.current_cycle}")
+                                    print(f"   All upcoming assets will start at Cycle {global_cycle_tracker.current_cycle}")
+                                    # Reset all asset steps for new cycle (O(1) - no per-asset loop)
+                                    global_cycle_tracker.reset_asset_steps()
                         
                     except Exception as sequence_error:
                         print(f"❌ Sequence error for {asset}: {sequence_error}")
                     
                     # Show session stats
-                    wins = len([t for t in self.trade_history if t['result'] == 'win'])
-                    losses = len([t for t in self.trade_history if t['result'] == 'loss'])
+                    wins = self._wins
+                    losses = self._losses
                     
-                    print(f"\n📊 TRADING SESSION:")
-                    print(f"   💰 {self.get_session_status()}")
-                    print(f"   🌍 Global Cycle: {global_cycle_tracker['current_cycle']}")
-                    print(f"   📈 Total Sequences: {session_trades}")
-                    print(f"   🏆 Results: {wins}W/{losses}L")
+                    if self.verbose:
+                        # One buffered write for the whole block instead of a print per line
+                        sys.stdout.write("\n".join((
+                            "\n📊 TRADING SESSION:",
+                            f"   💰 {self.get_session_status()}",
+                            f"   🌍 Global Cycle: {global_cycle_tracker.current_cycle}",
+                            f"   📈 Total Sequences: {session_trades}",
+                            f"   🏆 Results: {wins}W/{losses}L",
+                        )) + "\n")
                     
                     # Check stop conditions
                     should_stop, stop_reason = self.should_stop_trading()
@@ -4007,43 +4280,32 @@ class MultiAssetPreciseTrader:
             print(f"❌ Trading error: {e}")
         
         # Final stats
-        total_wins = len([t for t in self.trade_history if t['result'] == 'win'])
-        total_losses = len([t for t in self.trade_history if t['result'] == 'loss'])
-        total_profit = sum([t['profit_loss'] for t in self.trade_history])
+        total_wins = self._wins
+        total_losses = self._losses
+        total_profit = self._history_profit
         
         print(f"\n📊 FINAL STATISTICS:")
         print(f"   💰 {self.get_session_status()}")
-        print(f"   🌍 Final Global Cycle: {global_cycle_tracker['current_cycle']}")
+        print(f"   🌍 Final Global Cycle: {global_cycle_tracker.current_cycle}")
         print(f"   📈 Total Sequences: {session_trades}")
         print(f"   🏆 Results: {total_wins}W/{total_losses}L")
         print(f"   💵 Total P&L: ${total_profit:.2f}")
 
-    async def execute_option2_global_sequence(self, asset: str, direction: str, global_tracker: Dict[str, Any], 
-                                             asset_tracker: Dict[str, Any], channel: str) -> Tuple[bool, float]:
+    async def execute_option2_global_sequence(self, asset: str, direction: str, global_tracker: GlobalCycleTracker, 
+                                             asset_tracker: AssetTracker, channel: str) -> Tuple[bool, float]:
         """Execute Option 2 sequence with GLOBAL cycle system"""
-        current_global_cycle = global_tracker['current_cycle']
-        current_step = asset_tracker['current_step']
-        config = global_tracker['config']
+        current_global_cycle = global_tracker.current_cycle
+        current_step = asset_tracker.current_step
         total_profit = 0.0
         
         print(f"🔄 Starting sequence: Global Cycle {current_global_cycle}, Step {current_step}")
         
+        # Step amounts for this GLOBAL cycle (cycles past 3 use Cycle 3's amounts)
+        cycle_amounts = global_tracker.amounts[min(current_global_cycle, 3) - 1]
+        
         # Execute steps within current global cycle
         while current_step <= 3:
-            # Calculate amount based on GLOBAL cycle and current step
-            if current_global_cycle == 1:
-                # Cycle 1: Normal 3-step martingale
-                amount = config['base_amount'] * (config['multiplier'] ** (current_step - 1))
-            elif current_global_cycle == 2:
-                # Cycle 2: Continues from Cycle 1's last amount
-                cycle_1_last = global_tracker['cycle_1_last_amount']
-                cycle_2_step1 = cycle_1_last * config['multiplier']
-                amount = cycle_2_step1 * (config['multiplier'] ** (current_step - 1))
-            else:  # Cycle 3
-                # Cycle 3: Same amounts as Cycle 2 (capped risk)
-                cycle_1_last = global_tracker['cycle_1_last_amount']
-                cycle_2_step1 = cycle_1_last * config['multiplier']
-                amount = cycle_2_step1 * (config['multiplier'] ** (current_step - 1))
+            amount = cycle_amounts[current_step - 1]
             
             print(f"🔄 Global C{current_global_cycle}S{current_step}: ${amount:.2f} | {asset} {direction.upper()}")
             
@@ -4062,17 +4324,17 @@ class MultiAssetPreciseTrader:
                     # Move to next step
                     if current_step < 3:
                         current_step += 1
-                        asset_tracker['current_step'] = current_step
-                        await asyncio.sleep(0.01)  # 10ms delay
+                        asset_tracker.current_step = current_step
+                        await asyncio.sleep(MARTINGALE_STEP_DELAY_SECONDS)
                         continue
                     else:
                         # Completed all 3 steps in this global cycle
-                        asset_tracker['current_step'] = 4  # Mark as completed
+                        asset_tracker.current_step = 4  # Mark as completed
                         print(f"🔄 Completed all 3 steps in Global Cycle {current_global_cycle}")
                         
                         # Store Cycle 1 last amount if we're in Cycle 1
                         if current_global_cycle == 1:
-                            global_tracker['cycle_1_last_amount'] = amount
+                            global_tracker.set_cycle_1_last_amount(amount)
                         
                         return False, total_profit
             
@@ -4084,89 +4346,17 @@ class MultiAssetPreciseTrader:
                 # Move to next step
                 if current_step < 3:
                     current_step += 1
-                    asset_tracker['current_step'] = current_step
-                    await asyncio.sleep(0.01)
+                    asset_tracker.current_step = current_step
+                    await asyncio.sleep(MARTINGALE_STEP_DELAY_SECONDS)
                     continue
                 else:
                     # Completed all steps (with errors)
-                    asset_tracker['current_step'] = 4
+                    asset_tracker.current_step = 4
                     if current_global_cycle == 1:
-                        global_tracker['cycle_1_last_amount'] = amount
+                        global_tracker.set_cycle_1_last_amount(amount)
                     return False, total_profit
         
         return False, total_profit
-        """Execute Option 2: 3-Cycle Progressive Martingale sequence"""
-        current_cycle = tracker['current_cycle']
-        current_step = tracker['current_step']
-        config = tracker['config']
-        total_profit = 0.0
-        
-        print(f"🔄 Starting Option 2 sequence: C{current_cycle}S{current_step}")
-        
-        # Continue until WIN or max cycles/steps reached
-        while current_cycle <= 3:
-            while current_step <= 3:
-                # Calculate amount based on cycle and step
-                if current_cycle == 1:
-                    amount = config['base_amount'] * (config['multiplier'] ** (current_step - 1))
-                elif current_cycle == 2:
-                    cycle_1_last = tracker['cycle_1_last_amount']
-                    cycle_2_step1 = cycle_1_last * config['multiplier']
-                    amount = cycle_2_step1 * (config['multiplier'] ** (current_step - 1))
-                else:  # Cycle 3
-                    cycle_1_last = tracker['cycle_1_last_amount']
-                    cycle_2_step1 = cycle_1_last * config['multiplier']
-                    amount = cycle_2_step1 * (config['multiplier'] ** (current_step - 1))
-                
-                print(f"🔄 C{current_cycle}S{current_step}: ${amount:.2f} | {asset} {direction.upper()}")
-                
-                # Execute trade
-                won, profit = await self.execute_single_trade(asset, direction, amount, channel)
-                total_profit += profit
-                
-                if won:
-                    print(f"🎉 WIN C{current_cycle}S{current_step}! → Reset to C1S1")
-                    # Reset to Cycle 1, Step 1
-                    tracker['current_cycle'] = 1
-                    tracker['current_step'] = 1
-                    tracker['cycle_1_last_amount'] = config['base_amount'] * (config['multiplier'] ** 2)
-                    return True, total_profit
-                else:
-                    print(f"💔 LOSS C{current_cycle}S{current_step}")
-                    
-                    # Move to next step
-                    if current_step < 3:
-                        current_step += 1
-                        tracker['current_step'] = current_step
-                        # Small delay before next step
-                        await asyncio.sleep(0.01)
-                        continue
-                    else:
-                        # Completed all steps in cycle
-                        if current_cycle == 1:
-                            # Store Cycle 1 last amount and move to Cycle 2
-                            tracker['cycle_1_last_amount'] = amount
-                            tracker['current_cycle'] = 2
-                            tracker['current_step'] = 1
-                            print(f"🔄 Moving to Cycle 2, Step 1")
-                            break
-                        elif current_cycle == 2:
-                            # Move to Cycle 3
-                            tracker['current_cycle'] = 3
-                            tracker['current_step'] = 1
-                            print(f"🔄 Moving to Cycle 3, Step 1")
-                            break
-                        else:
-                            # Cycle 3 complete - stay in C3S1
-                            tracker['current_step'] = 1
-                            print(f"🔄 Cycle 3 complete - Staying in C3S1")
-                            return False, total_profit
-            
-            # Move to next cycle
-            current_cycle = tracker['current_cycle']
-            current_step = tracker['current_step']
-        
-        return False, total_profit
 
     async def start_4cycle_trading(self, base_amount: float, multiplier: float = 2.5, is_demo: bool = True):
         """Start 4-Cycle 2-Step Martingale trading: 4 cycles × 2 steps = up to 8 trades"""
@@ -4198,7 +4388,7 @@ class MultiAssetPreciseTrader:
         
         strategy = FourCycleMartingaleStrategy(base_amount, multiplier)
         session_trades = 0
-        processed_signals = set()  # Track processed signals to prevent infinite loops
+        processed_signals: Dict[Tuple, None] = {}  # Processed signals in insertion order (bounded, prevents infinite loops)
         
         try:
             # Show initial signal overview
@@ -4208,11 +4398,10 @@ class MultiAssetPreciseTrader:
                 print(f"✅ Found {len(initial_signals)} signals in CSV:")
                 current_time = get_user_time()
                 for i, signal in enumerate(initial_signals[:5]):  # Show first 5
-                    time_until = (signal['trade_datetime'] - current_time).total_seconds()
-                    wait_minutes = int(time_until // 60)
-                    wait_seconds = int(time_until % 60)
+                    time_until = signal.execute_ts - current_time.timestamp()  # Epoch seconds, no timedelta
+                    wait_minutes, wait_seconds = divmod(int(time_until), 60)
                     status = "Ready!" if time_until <= 5 else f"in {wait_minutes}m {wait_seconds}s"
-                    print(f"   {i+1}. {signal['asset']} {signal['direction'].upper()} at {signal['signal_time']} ({status})")
+                    print(f"   {i+1}. {signal.asset} {signal.direction.upper()} at {signal.signal_time} ({status})")
                 if len(initial_signals) > 5:
                     print(f"   ... and {len(initial_signals) - 5} more signals")
             else:
@@ -4223,6 +4412,8 @@ class MultiAssetPreciseTrader:
                 # Get current time
                 current_time = get_user_time()
                 current_time_str = current_time.strftime('%H:%M:%S')
+                current_date = current_time.strftime('%Y-%m-%d')  # Formatted once per tick, reused by the status lines
+                current_ts = int(current_time.timestamp())  # Signals match on epoch seconds
                 
                 # Check for stop loss or take profit
                 should_stop, stop_reason = self.should_stop_trading()
@@ -4235,44 +4426,40 @@ class MultiAssetPreciseTrader:
                 signals = self.get_signals_from_csv()
                 
                 if not signals:
-                    current_date = current_time.strftime('%Y-%m-%d')
-                    current_time_hms = current_time.strftime('%H:%M:%S')
-                    status_line = f"{current_date} | {current_time_hms} | No signals available"
+                    status_line = f"{current_date} | {current_time_str} | No signals available"
                     print(f"\r{status_line:<80}", end="", flush=True)
-                    await asyncio.sleep(0.01)  # Check every 10ms
+                    await self._wait_for_next_second()  # Wake on CSV change or at the next second
                     continue
                 
                 # Find next signal
                 for signal in signals:
-                    signal_time_str = signal['signal_datetime'].strftime('%H:%M:%S')
-                    signal_key = f"{signal['asset']}_{signal['direction']}_{signal_time_str}"
+                    signal_key = (signal.asset, signal.direction, signal.execute_ts)
                     
                     # Skip if already processed
                     if signal_key in processed_signals:
                         continue
                     
+                    signal_time_str = signal.signal_datetime.strftime('%H:%M:%S')  # Display only
+                    
                     # Show current time and signal time
                     # Show clean status line: date | current time | signal time | time remaining
-                    current_date = current_time.strftime('%Y-%m-%d')
-                    current_time_hms = current_time.strftime('%H:%M:%S')
-                    signal_time_hms = signal['signal_datetime'].strftime('%H:%M:%S')
-                    time_remaining = format_time_remaining(current_time, signal['signal_datetime'])
+                    time_remaining = format_time_remaining(current_time, signal.signal_datetime)
                     
                     # Clear line and show clean status
-                    status_line = f"{current_date} | {current_time_hms} | {signal_time_hms} | {time_remaining} | {signal['asset']} {signal['direction'].upper()}"
+                    status_line = f"{current_date} | {current_time_str} | {signal_time_str} | {time_remaining} | {signal.asset} {signal.direction.upper()}"
                     print(f"\r{status_line:<80}", end="", flush=True)
                     
                     # Execute when times match exactly
-                    if current_time_str == signal_time_str:
-                        print(f"\n🎯 EXECUTING: {signal['asset']} {signal['direction'].upper()} at {signal_time_str}")
+                    if current_ts == signal.execute_ts:
+                        print(f"\n🎯 EXECUTING: {signal.asset} {signal.direction.upper()} at {signal_time_str}")
                         
                         # Mark signal as processed
-                        processed_signals.add(signal_key)
+                        mark_processed(processed_signals, signal_key)
                         
                         # Execute trade using 4-cycle strategy
                         try:
                             won, profit, action = await self.execute_single_4cycle_trade(
-                                signal['asset'], signal['direction'], base_amount, strategy, signal.get('channel')
+                                signal.asset, signal.direction, base_amount, strategy, signal.channel
                             )
                             
                             # Update session profit
@@ -4281,18 +4468,18 @@ class MultiAssetPreciseTrader:
                             
                             # Show result
                             result_emoji = "✅" if won else "❌"
-                            print(f"{result_emoji} {signal['asset']} {'WIN' if won else 'LOSS'} - ${profit:+.2f}")
+                            print(f"{result_emoji} {signal.asset} {'WIN' if won else 'LOSS'} - ${profit:+.2f}")
                             
                             # Handle the action result
                             if action == 'continue':
                                 # Need to execute next step immediately
-                                print(f"⚡ CONTINUING TO NEXT STEP for {signal['asset']}")
+                                print(f"⚡ CONTINUING TO NEXT STEP for {signal.asset}")
                                 await asyncio.sleep(0.01)  # 10ms delay
                                 
                                 # Execute Step 2 immediately
                                 try:
                                     won2, profit2, action2 = await self.execute_single_4cycle_trade(
-                                        signal['asset'], signal['direction'], base_amount, strategy, signal.get('channel')
+                                        signal.asset, signal.direction, base_amount, strategy, signal.channel
                                     )
                                     
                                     # Update session profit
@@ -4301,10 +4488,10 @@ class MultiAssetPreciseTrader:
                                     
                                     # Show result
                                     result_emoji2 = "✅" if won2 else "❌"
-                                    print(f"{result_emoji2} {signal['asset']} Step 2 {'WIN' if won2 else 'LOSS'} - ${profit2:+.2f}")
+                                    print(f"{result_emoji2} {signal.asset} Step 2 {'WIN' if won2 else 'LOSS'} - ${profit2:+.2f}")
                                     
                                 except Exception as step2_error:
-                                    print(f"❌ Step 2 error for {signal['asset']}: {step2_error}")
+                                    print(f"❌ Step 2 error for {signal.asset}: {step2_error}")
                             
                             # Show session stats
                             print(f"📊 Session: {self.get_session_status()} | Trades: {session_trades}")
@@ -4317,16 +4504,11 @@ class MultiAssetPreciseTrader:
                                 return
                             
                         except Exception as trade_error:
-                            print(f"❌ Trade error for {signal['asset']}: {trade_error}")
+                            print(f"❌ Trade error for {signal.asset}: {trade_error}")
                         
                         break  # Exit signal loop after processing one signal
                 
-                await asyncio.sleep(0.01)  # Check every 10ms for precise timing
-                
-                # Clean up old processed signals every minute to prevent memory buildup
-                if len(processed_signals) > 100:
-                    processed_signals.clear()
-                    print(f"\n🧹 Cleaned processed signals cache")
+                await self._wait_for_next_second()  # Sleep to the next second boundary instead of polling every 10ms
                 
         except KeyboardInterrupt:
             print(f"\n🛑 TRADING STOPPED BY USER")
@@ -4335,8 +4517,8 @@ class MultiAssetPreciseTrader:
         
         # Final stats
         total_trades = len(self.trade_history)
-        total_wins = len([t for t in self.trade_history if t['result'] == 'win'])
-        total_losses = len([t for t in self.trade_history if t['result'] == 'loss'])
+        total_wins = self._wins
+        total_losses = self._losses
         
         print(f"\n📊 FINAL STATISTICS:")
         print(f"   💰 {self.get_session_status()}")
@@ -4374,7 +4556,7 @@ class MultiAssetPreciseTrader:
         
         strategy = FiveCycleMartingaleStrategy(base_amount, multiplier)
         session_trades = 0
-        processed_signals = set()  # Track processed signals to prevent infinite loops
+        processed_signals: Dict[Tuple, None] = {}  # Processed signals in insertion order (bounded, prevents infinite loops)
         
         try:
             # Show initial signal overview
@@ -4384,11 +4566,10 @@ class MultiAssetPreciseTrader:
                 print(f"✅ Found {len(initial_signals)} signals in CSV:")
                 current_time = get_user_time()
                 for i, signal in enumerate(initial_signals[:5]):  # Show first 5
-                    time_until = (signal['trade_datetime'] - current_time).total_seconds()
-                    wait_minutes = int(time_until // 60)
-                    wait_seconds = int(time_until % 60)
+                    time_until = signal.execute_ts - current_time.timestamp()  # Epoch seconds, no timedelta
+                    wait_minutes, wait_seconds = divmod(int(time_until), 60)
                     status = "Ready!" if time_until <= 5 else f"in {wait_minutes}m {wait_seconds}s"
-                    print(f"   {i+1}. {signal['asset']} {signal['direction'].upper()} at {signal['signal_time']} ({status})")
+                    print(f"   {i+1}. {signal.asset} {signal.direction.upper()} at {signal.signal_time} ({status})")
                 if len(initial_signals) > 5:
                     print(f"   ... and {len(initial_signals) - 5} more signals")
             else:
@@ -4399,6 +4580,8 @@ class MultiAssetPreciseTrader:
                 # Get current time
                 current_time = get_user_time()
                 current_time_str = current_time.strftime('%H:%M:%S')
+                current_date = current_time.strftime('%Y-%m-%d')  # Formatted once per tick, reused by the status lines
+                current_ts = int(current_time.timestamp())  # Signals match on epoch seconds
                 
                 # Check for stop loss or take profit
                 should_stop, stop_reason = self.should_stop_trading()
@@ -4411,44 +4594,40 @@ class MultiAssetPreciseTrader:
                 signals = self.get_signals_from_csv()
                 
                 if not signals:
-                    current_date = current_time.strftime('%Y-%m-%d')
-                    current_time_hms = current_time.strftime('%H:%M:%S')
-                    status_line = f"{current_date} | {current_time_hms} | No signals available"
+                    status_line = f"{current_date} | {current_time_str} | No signals available"
                     print(f"\r{status_line:<80}", end="", flush=True)
-                    await asyncio.sleep(0.01)  # Check every 10ms
+                    await self._wait_for_next_second()  # Wake on CSV change or at the next second
                     continue
                 
                 # Find next signal
                 for signal in signals:
-                    signal_time_str = signal['signal_datetime'].strftime('%H:%M:%S')
-                    signal_key = f"{signal['asset']}_{signal['direction']}_{signal_time_str}"
+                    signal_key = (signal.asset, signal.direction, signal.execute_ts)
                     
                     # Skip if already processed
                     if signal_key in processed_signals:
                         continue
                     
+                    signal_time_str = signal.signal_datetime.strftime('%H:%M:%S')  # Display only
+                    
                     # Show current time and signal time
                     # Show clean status line: date | current time | signal time | time remaining
-                    current_date = current_time.strftime('%Y-%m-%d')
-                    current_time_hms = current_time.strftime('%H:%M:%S')
-                    signal_time_hms = signal['signal_datetime'].strftime('%H:%M:%S')
-                    time_remaining = format_time_remaining(current_time, signal['signal_datetime'])
+                    time_remaining = format_time_remaining(current_time, signal.signal_datetime)
                     
                     # Clear line and show clean status
-                    status_line = f"{current_date} | {current_time_hms} | {signal_time_hms} | {time_remaining} | {signal['asset']} {signal['direction'].upper()}"
+                    status_line = f"{current_date} | {current_time_str} | {signal_time_str} | {time_remaining} | {signal.asset} {signal.direction.upper()}"
                     print(f"\r{status_line:<80}", end="", flush=True)
                     
                     # Execute when times match exactly
-                    if current_time_str == signal_time_str:
-                        print(f"\n🎯 EXECUTING: {signal['asset']} {signal['direction'].upper()} at {signal_time_str}")
+                    if current_ts == signal.execute_ts:
+                        print(f"\n🎯 EXECUTING: {signal.asset} {signal.direction.upper()} at {signal_time_str}")
                         
                         # Mark signal as processed
-                        processed_signals.add(signal_key)
+                        mark_processed(processed_signals, signal_key)
                         
                         # Execute trade using 5-cycle strategy
                         try:
                             won, profit, action = await self.execute_single_5cycle_trade(
-                                signal['asset'], signal['direction'], base_amount, strategy, signal.get('channel')
+                                signal.asset, signal.direction, base_amount, strategy, signal.channel
                             )
                             
                             # Update session profit
@@ -4457,18 +4636,18 @@ class MultiAssetPreciseTrader:
                             
                             # Show result
                             result_emoji = "✅" if won else "❌"
-                            print(f"{result_emoji} {signal['asset']} {'WIN' if won else 'LOSS'} - ${profit:+.2f}")
+                            print(f"{result_emoji} {signal.asset} {'WIN' if won else 'LOSS'} - ${profit:+.2f}")
                             
                             # Handle the action result
                             if action == 'continue':
                                 # Need to execute next step immediately
-                                print(f"⚡ CONTINUING TO NEXT STEP for {signal['asset']}")
+                                print(f"⚡ CONTINUING TO NEXT STEP for {signal.asset}")
                                 await asyncio.sleep(0.01)  # 10ms delay
                                 
                                 # Execute Step 2 immediately
                                 try:
                                     won2, profit2, action2 = await self.execute_single_5cycle_trade(
-                                        signal['asset'], signal['direction'], base_amount, strategy, signal.get('channel')
+                                        signal.asset, signal.direction, base_amount, strategy, signal.channel
                                     )
                                     
                                     # Update session profit
@@ -4477,10 +4656,10 @@ class MultiAssetPreciseTrader:
                                     
                                     # Show result
                                     result_emoji2 = "✅" if won2 else "❌"
-                                    print(f"{result_emoji2} {signal['asset']} Step 2 {'WIN' if won2 else 'LOSS'} - ${profit2:+.2f}")
+                                    print(f"{result_emoji2} {signal.asset} Step 2 {'WIN' if won2 else 'LOSS'} - ${profit2:+.2f}")
                                     
                                 except Exception as step2_error:
-                                    print(f"❌ Step 2 error for {signal['asset']}: {step2_error}")
+                                    print(f"❌ Step 2 error for {signal.asset}: {step2_error}")
                             
                             # Show session stats
                             print(f"📊 Session: {self.get_session_status()} | Trades: {session_trades}")
@@ -4493,16 +4672,11 @@ class MultiAssetPreciseTrader:
                                 return
                             
                         except Exception as trade_error:
-                            print(f"❌ Trade error for {signal['asset']}: {trade_error}")
+                            print(f"❌ Trade error for {signal.asset}: {trade_error}")
                         
                         break  # Exit signal loop after processing one signal
                 
-                await asyncio.sleep(0.01)  # Check every 10ms for precise timing
-                
-                # Clean up old processed signals every minute to prevent memory buildup
-                if len(processed_signals) > 100:
-                    processed_signals.clear()
-                    print(f"\n🧹 Cleaned processed signals cache")
+                await self._wait_for_next_second()  # Sleep to the next second boundary instead of polling every 10ms
                 
         except KeyboardInterrupt:
             print(f"\n🛑 TRADING STOPPED BY USER")
@@ -4511,8 +4685,8 @@ class MultiAssetPreciseTrader:
         
         # Final stats
         total_trades = len(self.trade_history)
-        total_wins = len([t for t in self.trade_history if t['result'] == 'win'])
-        total_losses = len([t for t in self.trade_history if t['result'] == 'loss'])
+        total_wins = self._wins
+        total_losses = self._losses
         
         print(f"\n📊 FINAL STATISTICS:")
         print(f"   💰 {self.get_session_status()}")
@@ -4520,6 +4694,89 @@ class MultiAssetPreciseTrader:
         print(f"   🏆 Results: {total_wins}W/{total_losses}L")
         print(f"   🎯 Assets Tracked: {len(strategy.get_all_active_assets())}")
 
+    async def _run_first_signal_loop(self, run_signal: Callable[[Signal], Awaitable[None]]):
+        """Shared per-second loop: show the first upcoming signal and hand it to run_signal at its exact second"""
+        # Show initial signal overview
+        initial_signals = self.get_signals_from_csv()
+        if initial_signals:
+            print(f"✅ Found {len(initial_signals)} signals in CSV:")
+            current_time = get_user_time()
+            for i, signal in enumerate(initial_signals[:5]):  # Show first 5
+                time_until = signal.execute_ts - current_time.timestamp()  # Epoch seconds, no timedelta
+                wait_minutes, wait_seconds = divmod(int(time_until), 60)
+                status = "Ready!" if time_until <= 5 else f"in {wait_minutes}m {wait_seconds}s"
+                print(f"   {i+1}. {signal.asset} {signal.direction.upper()} at {signal.signal_time} ({status})")
+            if len(initial_signals) > 5:
+                print(f"   ... and {len(initial_signals) - 5} more signals")
+        else:
+            print(f"❌ No signals found in CSV - add signals to the selected channel CSV file")
+        print("=" * 60)
+        
+        while True:
+            # Get current time
+            current_time = get_user_time()
+            current_time_str = current_time.strftime('%H:%M:%S')
+            current_date = current_time.strftime('%Y-%m-%d')  # Formatted once per tick, reused by the status lines
+            current_ts = int(current_time.timestamp())  # Signals match on epoch seconds
+            
+            # Check for stop loss or take profit
+            should_stop, stop_reason = self.should_stop_trading()
+            if should_stop:
+                print(f"\n{stop_reason}")
+                print("🛑 Trading stopped due to risk management limits")
+                break
+            
+            # Get fresh signals from CSV
+            signals = self.get_signals_from_csv()
+            
+            if not signals:
+                status_line = f"{current_date} | {current_time_str} | No signals available"
+                print(f"\r{status_line:<80}", end="", flush=True)
+                await self._wait_for_next_second()  # Wake on CSV change or at the next second
+                continue
+            
+            # Show only the first signal
+            signal = signals[0]
+            signal_time_str = signal.signal_datetime.strftime('%H:%M:%S')  # Display only
+            time_remaining = format_time_remaining(current_time, signal.signal_datetime)
+            status_line = f"{current_date} | {current_time_str} | {signal_time_str} | {time_remaining} | {signal.asset} {signal.direction.upper()}"
+            print(f"\r{status_line:<80}", end="", flush=True)
+            
+            # Execute when times match exactly
+            if current_ts == signal.execute_ts:
+                print(f"\n🎯 EXECUTING: {signal.asset} {signal.direction.upper()} at {signal_time_str}")
+                await run_signal(signal)
+            
+            await self._wait_for_next_second()  # Sleep to the next second boundary instead of polling every 10ms
+    
+    async def _run_step_chain(self, signal: Signal, execute_step: Callable[..., Awaitable[Tuple[bool, float, str]]],
+                              base_amount: float, strategy: Any, max_steps: int) -> int:
+        """Run a signal's martingale steps back to back (10ms apart) while the strategy says continue; returns trades executed"""
+        trades = 0
+        for step in range(1, max_steps + 1):
+            if step > 1:
+                print(f"⚡ CONTINUING TO {'NEXT STEP' if step == 2 else f'STEP {step}'} for {signal.asset}")
+                await asyncio.sleep(0.01)  # 10ms delay
+            
+            try:
+                won, profit, action = await execute_step(
+                    signal.asset, signal.direction, base_amount, strategy, signal.channel
+                )
+            except Exception as e:
+                print(f"❌ Error: {e}" if step == 1 else f"❌ Step {step} Error: {e}")
+                break
+            
+            self.update_session_profit(profit)
+            trades += 1
+            
+            result_emoji = "✅" if won else "❌"
+            step_label = "" if step == 1 else f"STEP {step} "
+            print(f"{result_emoji} {signal.asset} {step_label}{'WIN' if won else 'LOSS'} - ${profit:+.2f}")
+            
+            if action != 'continue':
+                break
+        return trades
+    
     async def start_2step_trading(self, base_amount: float, multiplier: float = 2.5, is_demo: bool = True):
         """Start 3-Cycle 2-Step Martingale trading: 3 cycles × 2 steps = up to 6 trades"""
         print(f"\n🚀 3-CYCLE 2-STEP MARTINGALE TRADING STARTED")
@@ -4550,119 +4807,18 @@ class MultiAssetPreciseTrader:
         strategy = TwoStepMartingaleStrategy(base_amount, multiplier)
         session_trades = 0
         
+        async def run_signal(signal: Signal):
+            nonlocal session_trades
+            session_trades += await self._run_step_chain(signal, self.execute_single_2step_trade, base_amount, strategy, 2)
+        
         try:
-            # Show initial signal overview
-            # Scanning for signals...
-            initial_signals = self.get_signals_from_csv()
-            if initial_signals:
-                print(f"✅ Found {len(initial_signals)} signals in CSV:")
-                current_time = get_user_time()
-                for i, signal in enumerate(initial_signals[:5]):  # Show first 5
-                    time_until = (signal['trade_datetime'] - current_time).total_seconds()
-                    wait_minutes = int(time_until // 60)
-                    wait_seconds = int(time_until % 60)
-                    status = "Ready!" if time_until <= 5 else f"in {wait_minutes}m {wait_seconds}s"
-                    print(f"   {i+1}. {signal['asset']} {signal['direction'].upper()} at {signal['signal_time']} ({status})")
-                if len(initial_signals) > 5:
-                    print(f"   ... and {len(initial_signals) - 5} more signals")
-            else:
-                print(f"❌ No signals found in CSV - add signals to the selected channel CSV file")
+            await self._run_first_signal_loop(run_signal)
+        except KeyboardInterrupt:
+            print(f"\n\n🛑 3-CYCLE 2-STEP MARTINGALE TRADING STOPPED")
             print("=" * 60)
-            
-            while True:
-                # Get current time
-                current_time = get_user_time()
-                current_time_str = current_time.strftime('%H:%M:%S')
-                
-                # Check for stop loss or take profit
-                should_stop, stop_reason = self.should_stop_trading()
-                if should_stop:
-                    print(f"\n{stop_reason}")
-                    print("🛑 Trading stopped due to risk management limits")
-                    break
-                
-                # Get fresh signals from CSV
-                signals = self.get_signals_from_csv()
-                
-                if not signals:
-                    current_date = current_time.strftime('%Y-%m-%d')
-                    current_time_hms = current_time.strftime('%H:%M:%S')
-                    status_line = f"{current_date} | {current_time_hms} | No signals available"
-                    print(f"\r{status_line:<80}", end="", flush=True)
-                    await asyncio.sleep(0.01)  # Check every 10ms
-                    continue
-                
-                # Find next signal
-                for signal in signals:
-                    signal_time_str = signal['signal_datetime'].strftime('%H:%M:%S')
-                    
-                    # Show current time and signal time
-                    # Show clean status line: date | current time | signal time | time remaining
-                    current_date = current_time.strftime('%Y-%m-%d')
-                    current_time_hms = current_time.strftime('%H:%M:%S')
-                    signal_time_hms = signal['signal_datetime'].strftime('%H:%M:%S')
-                    time_remaining = format_time_remaining(current_time, signal['signal_datetime'])
-                    
-                    # Clear line and show clean status
-                    status_line = f"{current_date} | {current_time_hms} | {signal_time_hms} | {time_remaining} | {signal['asset']} {signal['direction'].upper()}"
-                    print(f"\r{status_line:<80}", end="", flush=True)
-                    
-                    # Execute when times match exactly
-                    if current_time_str == signal_time_str:
-                        print(f"\n🎯 EXECUTING: {signal['asset']} {signal['direction'].upper()} at {signal_time_str}")
-                        
-                        # Execute trade
-                        try:
-                            won, profit, action = await self.execute_single_2step_trade(
-                                signal['asset'], signal['direction'], base_amount, strategy, signal.get('channel')
-                            )
-                            
-                            # Update session profit
-                            self.update_session_profit(profit)
-                            session_trades += 1
-                            
-                            # Show result
-                            result_emoji = "✅" if won else "❌"
-                            print(f"{result_emoji} {signal['asset']} {'WIN' if won else 'LOSS'} - ${profit:+.2f}")
-                            
-                            # Handle the action result
-                            if action == 'continue':
-                                # Need to execute next step immediately
-                                print(f"⚡ CONTINUING TO NEXT STEP for {signal['asset']}")
-                                await asyncio.sleep(0.01)  # 10ms delay
-                                
-                                # Execute next step immediately
-                                try:
-                                    won2, profit2, action2 = await self.execute_single_2step_trade(
-                                        signal['asset'], signal['direction'], base_amount, strategy, signal.get('channel')
-                                    )
-                                    
-                                    # Update session profit for step 2
-                                    self.update_session_profit(profit2)
-                                    session_trades += 1
-                                    
-                                    # Show step 2 result
-                                    result_emoji2 = "✅" if won2 else "❌"
-                                    print(f"{result_emoji2} {signal['asset']} STEP 2 {'WIN' if won2 else 'LOSS'} - ${profit2:+.2f}")
-                                    
-                                except Exception as e2:
-                                    print(f"❌ Step 2 Error: {e2}")
-                            
-                        except Exception as e:
-                            print(f"❌ Error: {e}")
-                        
-                        break
-                    
-                    break  # Show only first signal
-                
-                await asyncio.sleep(0.01)  # Check every 10ms
-                
-        except KeyboardInterrupt:
-            print(f"\n\n🛑 3-CYCLE 2-STEP MARTINGALE TRADING STOPPED")
-            print("=" * 60)
-            print(f"📊 SESSION SUMMARY:")
-            print(f"   🎯 Total Signals Processed: {session_trades}")
-            print(f"   💰 Final P&L: ${self.session_profit:+.2f}")
+            print(f"📊 SESSION SUMMARY:")
+            print(f"   🎯 Total Signals Processed: {session_trades}")
+            print(f"   💰 Final P&L: ${self.session_profit:+.2f}")
             
             # Show final strategy status
             strategy.show_strategy_status()
@@ -4701,136 +4857,12 @@ class MultiAssetPreciseTrader:
         strategy = ThreeStepMartingaleStrategy(base_amount, multiplier)
         session_trades = 0
         
+        async def run_signal(signal: Signal):
+            nonlocal session_trades
+            session_trades += await self._run_step_chain(signal, self.execute_single_3step_trade, base_amount, strategy, 3)
+        
         try:
-            # Show initial signal overview
-            # Scanning for signals...
-            initial_signals = self.get_signals_from_csv()
-            if initial_signals:
-                print(f"✅ Found {len(initial_signals)} signals in CSV:")
-                current_time = get_user_time()
-                for i, signal in enumerate(initial_signals[:5]):  # Show first 5
-                    time_until = (signal['trade_datetime'] - current_time).total_seconds()
-                    wait_minutes = int(time_until // 60)
-                    wait_seconds = int(time_until % 60)
-                    status = "Ready!" if time_until <= 5 else f"in {wait_minutes}m {wait_seconds}s"
-                    print(f"   {i+1}. {signal['asset']} {signal['direction'].upper()} at {signal['signal_time']} ({status})")
-                if len(initial_signals) > 5:
-                    print(f"   ... and {len(initial_signals) - 5} more signals")
-            else:
-                print(f"❌ No signals found in CSV - add signals to the selected channel CSV file")
-            print("=" * 60)
-            
-            while True:
-                # Get current time
-                current_time = get_user_time()
-                current_time_str = current_time.strftime('%H:%M:%S')
-                
-                # Check for stop loss or take profit
-                should_stop, stop_reason = self.should_stop_trading()
-                if should_stop:
-                    print(f"\n{stop_reason}")
-                    print("🛑 Trading stopped due to risk management limits")
-                    break
-                
-                # Get fresh signals from CSV
-                signals = self.get_signals_from_csv()
-                
-                if not signals:
-                    current_date = current_time.strftime('%Y-%m-%d')
-                    current_time_hms = current_time.strftime('%H:%M:%S')
-                    status_line = f"{current_date} | {current_time_hms} | No signals available"
-                    print(f"\r{status_line:<80}", end="", flush=True)
-                    await asyncio.sleep(0.01)  # Check every 10ms
-                    continue
-                
-                # Find next signal
-                for signal in signals:
-                    signal_time_str = signal['signal_datetime'].strftime('%H:%M:%S')
-                    
-                    # Show current time and signal time
-                    # Show clean status line: date | current time | signal time | time remaining
-                    current_date = current_time.strftime('%Y-%m-%d')
-                    current_time_hms = current_time.strftime('%H:%M:%S')
-                    signal_time_hms = signal['signal_datetime'].strftime('%H:%M:%S')
-                    time_remaining = format_time_remaining(current_time, signal['signal_datetime'])
-                    
-                    # Clear line and show clean status
-                    status_line = f"{current_date} | {current_time_hms} | {signal_time_hms} | {time_remaining} | {signal['asset']} {signal['direction'].upper()}"
-                    print(f"\r{status_line:<80}", end="", flush=True)
-                    
-                    # Execute when times match exactly
-                    if current_time_str == signal_time_str:
-                        print(f"\n🎯 EXECUTING: {signal['asset']} {signal['direction'].upper()} at {signal_time_str}")
-                        
-                        # Execute trade
-                        try:
-                            won, profit, action = await self.execute_single_3step_trade(
-                                signal['asset'], signal['direction'], base_amount, strategy, signal.get('channel')
-                            )
-                            
-                            # Update session profit
-                            self.update_session_profit(profit)
-                            session_trades += 1
-                            
-                            # Show result
-                            result_emoji = "✅" if won else "❌"
-                            print(f"{result_emoji} {signal['asset']} {'WIN' if won else 'LOSS'} - ${profit:+.2f}")
-                            
-                            # Handle the action result
-                            if action == 'continue':
-                                # Need to execute next step immediately
-                                print(f"⚡ CONTINUING TO NEXT STEP for {signal['asset']}")
-                                await asyncio.sleep(0.01)  # 10ms delay
-                                
-                                # Execute next step immediately
-                                try:
-                                    won2, profit2, action2 = await self.execute_single_3step_trade(
-                                        signal['asset'], signal['direction'], base_amount, strategy, signal.get('channel')
-                                    )
-                                    
-                                    # Update session profit for step 2
-                                    self.update_session_profit(profit2)
-                                    session_trades += 1
-                                    
-                                    # Show step 2 result
-                                    result_emoji2 = "✅" if won2 else "❌"
-                                    print(f"{result_emoji2} {signal['asset']} STEP 2 {'WIN' if won2 else 'LOSS'} - ${profit2:+.2f}")
-                                    
-                                    # Handle step 2 action result
-                                    if action2 == 'continue':
-                                        # Need to execute step 3 immediately
-                                        print(f"⚡ CONTINUING TO STEP 3 for {signal['asset']}")
-                                        await asyncio.sleep(0.01)  # 10ms delay
-                                        
-                                        # Execute step 3 immediately
-                                        try:
-                                            won3, profit3, action3 = await self.execute_single_3step_trade(
-                                                signal['asset'], signal['direction'], base_amount, strategy, signal.get('channel')
-                                            )
-                                            
-                                            # Update session profit for step 3
-                                            self.update_session_profit(profit3)
-                                            session_trades += 1
-                                            
-                                            # Show step 3 result
-                                            result_emoji3 = "✅" if won3 else "❌"
-                                            print(f"{result_emoji3} {signal['asset']} STEP 3 {'WIN' if won3 else 'LOSS'} - ${profit3:+.2f}")
-                                            
-                                        except Exception as e3:
-                                            print(f"❌ Step 3 Error: {e3}")
-                                    
-                                except Exception as e2:
-                                    print(f"❌ Step 2 Error: {e2}")
-                            
-                        except Exception as e:
-                            print(f"❌ Error: {e}")
-                        
-                        break
-                    
-                    break  # Show only first signal
-                
-                await asyncio.sleep(0.01)  # Check every 10ms
-                
+            await self._run_first_signal_loop(run_signal)
         except KeyboardInterrupt:
             print(f"\n\n🛑 3-CYCLE 3-STEP MARTINGALE TRADING STOPPED")
             print("=" * 60)
@@ -4874,111 +4906,12 @@ class MultiAssetPreciseTrader:
         strategy = TwoCycleTwoStepMartingaleStrategy(base_amount, multiplier)
         session_trades = 0
         
+        async def run_signal(signal: Signal):
+            nonlocal session_trades
+            session_trades += await self._run_step_chain(signal, self.execute_single_2cycle_2step_trade, base_amount, strategy, 2)
+        
         try:
-            # Show initial signal overview
-            initial_signals = self.get_signals_from_csv()
-            if initial_signals:
-                print(f"✅ Found {len(initial_signals)} signals in CSV:")
-                current_time = get_user_time()
-                for i, signal in enumerate(initial_signals[:5]):  # Show first 5
-                    time_until = (signal['trade_datetime'] - current_time).total_seconds()
-                    wait_minutes = int(time_until // 60)
-                    wait_seconds = int(time_until % 60)
-                    status = "Ready!" if time_until <= 5 else f"in {wait_minutes}m {wait_seconds}s"
-                    print(f"   {i+1}. {signal['asset']} {signal['direction'].upper()} at {signal['signal_time']} ({status})")
-                if len(initial_signals) > 5:
-                    print(f"   ... and {len(initial_signals) - 5} more signals")
-            else:
-                print(f"❌ No signals found in CSV - add signals to the selected channel CSV file")
-            print("=" * 60)
-            
-            while True:
-                # Get current time
-                current_time = get_user_time()
-                current_time_str = current_time.strftime('%H:%M:%S')
-                
-                # Check for stop loss or take profit
-                should_stop, stop_reason = self.should_stop_trading()
-                if should_stop:
-                    print(f"\n{stop_reason}")
-                    print("🛑 Trading stopped due to risk management limits")
-                    break
-                
-                # Get fresh signals from CSV
-                signals = self.get_signals_from_csv()
-                
-                if not signals:
-                    current_date = current_time.strftime('%Y-%m-%d')
-                    current_time_hms = current_time.strftime('%H:%M:%S')
-                    status_line = f"{current_date} | {current_time_hms} | No signals available"
-                    print(f"\r{status_line:<80}", end="", flush=True)
-                    await asyncio.sleep(0.01)  # Check every 10ms
-                    continue
-                
-                # Find next signal
-                for signal in signals:
-                    signal_time_str = signal['signal_datetime'].strftime('%H:%M:%S')
-                    
-                    # Show current time and signal time
-                    current_date = current_time.strftime('%Y-%m-%d')
-                    current_time_hms = current_time.strftime('%H:%M:%S')
-                    signal_time_hms = signal['signal_datetime'].strftime('%H:%M:%S')
-                    time_remaining = format_time_remaining(current_time, signal['signal_datetime'])
-                    
-                    # Clear line and show clean status
-                    status_line = f"{current_date} | {current_time_hms} | {signal_time_hms} | {time_remaining} | {signal['asset']} {signal['direction'].upper()}"
-                    print(f"\r{status_line:<80}", end="", flush=True)
-                    
-                    # Execute when times match exactly
-                    if current_time_str == signal_time_str:
-                        print(f"\n🎯 EXECUTING: {signal['asset']} {signal['direction'].upper()} at {signal_time_str}")
-                        
-                        # Execute trade using 2-cycle 2-step strategy
-                        try:
-                            won, profit, action = await self.execute_single_2cycle_2step_trade(
-                                signal['asset'], signal['direction'], base_amount, strategy, signal.get('channel')
-                            )
-                            
-                            # Update session profit
-                            self.update_session_profit(profit)
-                            session_trades += 1
-                            
-                            # Show result
-                            result_emoji = "✅" if won else "❌"
-                            print(f"{result_emoji} {signal['asset']} {'WIN' if won else 'LOSS'} - ${profit:+.2f}")
-                            
-                            # Handle the action result
-                            if action == 'continue':
-                                # Need to execute next step immediately
-                                print(f"⚡ CONTINUING TO NEXT STEP for {signal['asset']}")
-                                await asyncio.sleep(0.01)  # 10ms delay
-                                
-                                # Execute next step immediately
-                                try:
-                                    won2, profit2, action2 = await self.execute_single_2cycle_2step_trade(
-                                        signal['asset'], signal['direction'], base_amount, strategy, signal.get('channel')
-                                    )
-                                    
-                                    # Update session profit for step 2
-                                    self.update_session_profit(profit2)
-                                    session_trades += 1
-                                    
-                                    # Show step 2 result
-                                    result_emoji2 = "✅" if won2 else "❌"
-                                    print(f"{result_emoji2} {signal['asset']} STEP 2 {'WIN' if won2 else 'LOSS'} - ${profit2:+.2f}")
-                                    
-                                except Exception as e2:
-                                    print(f"❌ Step 2 Error: {e2}")
-                            
-                        except Exception as e:
-                            print(f"❌ Error: {e}")
-                        
-                        break
-                    
-                    break  # Show only first signal
-                
-                await asyncio.sleep(0.01)  # Check every 10ms
-                
+            await self._run_first_signal_loop(run_signal)
         except KeyboardInterrupt:
             print(f"\n\n🛑 2-CYCLE 2-STEP MARTINGALE TRADING STOPPED")
             print("=" * 60)
@@ -5030,21 +4963,22 @@ class MultiAssetPreciseTrader:
                 print(f"✅ Found {len(initial_signals)} signals in CSV:")
                 current_time = get_user_time()
                 for i, signal in enumerate(initial_signals[:5]):  # Show first 5
-                    time_until = (signal['trade_datetime'] - current_time).total_seconds()
-                    wait_minutes = int(time_until // 60)
-                    wait_seconds = int(time_until % 60)
+                    time_until = signal.execute_ts - current_time.timestamp()  # Epoch seconds, no timedelta
+                    wait_minutes, wait_seconds = divmod(int(time_until), 60)
                     status = "Ready!" if time_until <= 5 else f"in {wait_minutes}m {wait_seconds}s"
-                    print(f"   {i+1}. {signal['asset']} {signal['direction'].upper()} at {signal['signal_time']} ({status})")
+                    print(f"   {i+1}. {signal.asset} {signal.direction.upper()} at {signal.signal_time} ({status})")
                 if len(initial_signals) > 5:
                     print(f"   ... and {len(initial_signals) - 5} more signals")
             else:
                 print(f"❌ No signals found in CSV - add signals to the selected channel CSV file")
             print("=" * 60)
             
+            last_status_ts = None  # Status line is redrawn once per second, not every 10ms tick
+            
             while True:
                 # Get current time
                 current_time = get_user_time()
-                current_time_str = current_time.strftime('%H:%M:%S')
+                current_ts = int(current_time.timestamp())
                 
                 # Check for stop loss or take profit
                 should_stop, stop_reason = self.should_stop_trading()
@@ -5057,17 +4991,18 @@ class MultiAssetPreciseTrader:
                 signals = self.get_signals_from_csv()
                 
                 if not signals:
-                    current_date = current_time.strftime('%Y-%m-%d')
-                    current_time_hms = current_time.strftime('%H:%M:%S')
-                    status_line = f"{current_date} | {current_time_hms} | No signals available"
-                    print(f"\r{status_line:<100}", end="", flush=True)
-                    await asyncio.sleep(0.01)  # Check every 10ms
+                    if current_ts != last_status_ts:
+                        last_status_ts = current_ts
+                        current_date = current_time.strftime('%Y-%m-%d')
+                        current_time_hms = current_time.strftime('%H:%M:%S')
+                        status_line = f"{current_date} | {current_time_hms} | No signals available"
+                        print(f"\r{status_line:<100}", end="", flush=True)
+                    await self._wait_for_next_second()  # Wake on CSV change or at the next second
                     continue
                 
                 # Find next signal
                 for signal in signals:
-                    signal_time_str = signal['signal_datetime'].strftime('%H:%M:%S')
-                    asset = signal['asset']
+                    asset = signal.asset
                     
                     # Get payout for this asset
                     payout = self.get_asset_payout(asset)
@@ -5090,19 +5025,22 @@ class MultiAssetPreciseTrader:
                                 payout = self.asset_payouts[similar[0]]
                                 payout_display = f"{payout:.1f}%"
                     
-                    # Show current time and signal time with payout
-                    current_date = current_time.strftime('%Y-%m-%d')
-                    current_time_hms = current_time.strftime('%H:%M:%S')
-                    signal_time_hms = signal['signal_datetime'].strftime('%H:%M:%S')
-                    time_remaining = format_time_remaining(current_time, signal['signal_datetime'])
-                    
-                    # Clear line and show clean status with payout
-                    status_line = f"{current_date} | {current_time_hms} | {signal_time_hms} | {time_remaining} | {asset} {signal['direction'].upper()} | Payout: {payout_display}"
-                    print(f"\r{status_line:<100}", end="", flush=True)
+                    # Show current time and signal time with payout (once per second)
+                    if current_ts != last_status_ts:
+                        last_status_ts = current_ts
+                        current_date = current_time.strftime('%Y-%m-%d')
+                        current_time_hms = current_time.strftime('%H:%M:%S')
+                        signal_time_hms = signal.signal_datetime.strftime('%H:%M:%S')
+                        time_remaining = format_time_remaining(current_time, signal.signal_datetime)
+                        
+                        # Clear line and show clean status with payout
+                        status_line = f"{current_date} | {current_time_hms} | {signal_time_hms} | {time_remaining} | {asset} {signal.direction.upper()} | Payout: {payout_display}"
+                        print(f"\r{status_line:<100}", end="", flush=True)
                     
-                    # Execute when times match exactly
-                    if current_time_str == signal_time_str:
-                        print(f"\n🎯 EXECUTING: {signal['asset']} {signal['direction'].upper()} at {signal_time_str}")
+                    # Execute when times match exactly (same epoch second)
+                    if current_ts == signal.execute_ts:
+                        signal_time_str = signal.signal_datetime.strftime('%H:%M:%S')
+                        print(f"\n🎯 EXECUTING: {signal.asset} {signal.direction.upper()} at {signal_time_str}")
                         
                         # Execute trade using 2-cycle 3-step strategy
                         try:
@@ -5122,19 +5060,19 @@ class MultiAssetPreciseTrader:
                             
                             # Show result
                             result_emoji = "✅" if won else "❌"
-                            print(f"{result_emoji} {signal['asset']} {'WIN' if won else 'LOSS'} - ${profit:+.2f}")
+                            print(f"{result_emoji} {signal.asset} {'WIN' if won else 'LOSS'} - ${profit:+.2f}")
                             
                             # Handle the action result for 3-step progression
                             if action == 'continue':
                                 # Need to execute next step immediately
-                                current_step = strategy.get_asset_step(signal['asset'])
-                                print(f"⚡ CONTINUING TO STEP {current_step} for {signal['asset']}")
+                                current_step = strategy.get_asset_step(signal.asset)
+                                print(f"⚡ CONTINUING TO STEP {current_step} for {signal.asset}")
                                 await asyncio.sleep(0.01)  # 10ms delay
                                 
                                 # Execute next step immediately
                                 try:
                                     won2, profit2, action2 = await self.execute_single_2cycle_3step_trade(
-                                        signal['asset'], signal['direction'], base_amount, strategy, signal.get('channel')
+                                        signal.asset, signal.direction, base_amount, strategy, signal.channel
                                     )
                                     
                                     # Update session profit
@@ -5143,17 +5081,17 @@ class MultiAssetPreciseTrader:
                                     
                                     # Show result
                                     result_emoji2 = "✅" if won2 else "❌"
-                                    current_step2 = strategy.get_asset_step(signal['asset']) - 1  # Previous step
-                                    print(f"{result_emoji2} {signal['asset']} STEP {current_step2} {'WIN' if won2 else 'LOSS'} - ${profit2:+.2f}")
+                                    current_step2 = strategy.get_asset_step(signal.asset) - 1  # Previous step
+                                    print(f"{result_emoji2} {signal.asset} STEP {current_step2} {'WIN' if won2 else 'LOSS'} - ${profit2:+.2f}")
                                     
                                     # Check if we need to continue to step 3
                                     if action2 == 'continue':
-                                        print(f"⚡ CONTINUING TO STEP 3 for {signal['asset']}")
+                                        print(f"⚡ CONTINUING TO STEP 3 for {signal.asset}")
                                         await asyncio.sleep(0.01)  # 10ms delay
                                         
                                         try:
                                             won3, profit3, action3 = await self.execute_single_2cycle_3step_trade(
-                                                signal['asset'], signal['direction'], base_amount, strategy, signal.get('channel')
+                                                signal.asset, signal.direction, base_amount, strategy, signal.channel
                                             )
                                             
                                             # Update session profit
@@ -5162,7 +5100,7 @@ class MultiAssetPreciseTrader:
                                             
                                             # Show result
                                             result_emoji3 = "✅" if won3 else "❌"
-                                            print(f"{result_emoji3} {signal['asset']} STEP 3 {'WIN' if won3 else 'LOSS'} - ${profit3:+.2f}")
+                                            print(f"{result_emoji3} {signal.asset} STEP 3 {'WIN' if won3 else 'LOSS'} - ${profit3:+.2f}")
                                             
                                         except Exception as e3:
                                             print(f"❌ Step 3 Error: {e3}")
@@ -5177,7 +5115,7 @@ class MultiAssetPreciseTrader:
                     
                     break  # Show only first signal
                 
-                await asyncio.sleep(0.01)  # Check every 10ms
+                await self._wait_for_next_second()  # Sleep to the next second boundary instead of polling every 10ms
                 
         except KeyboardInterrupt:
             print(f"\n\n🛑 2-CYCLE 3-STEP MARTINGALE TRADING STOPPED")
@@ -5228,21 +5166,22 @@ class MultiAssetPreciseTrader:
                 print(f"✅ Found {len(initial_signals)} signals in CSV:")
                 current_time = get_user_time()
                 for i, signal in enumerate(initial_signals[:5]):  # Show first 5
-                    time_until = (signal['trade_datetime'] - current_time).total_seconds()
-                    wait_minutes = int(time_until // 60)
-                    wait_seconds = int(time_until % 60)
+                    time_until = signal.execute_ts - current_time.timestamp()  # Epoch seconds, no timedelta
+                    wait_minutes, wait_seconds = divmod(int(time_until), 60)
                     status = "Ready!" if time_until <= 5 else f"in {wait_minutes}m {wait_seconds}s"
-                    print(f"   {i+1}. {signal['asset']} {signal['direction'].upper()} at {signal['signal_time']} ({status})")
+                    print(f"   {i+1}. {signal.asset} {signal.direction.upper()} at {signal.signal_time} ({status})")
                 if len(initial_signals) > 5:
                     print(f"   ... and {len(initial_signals) - 5} more signals")
             else:
                 print(f"❌ No signals found in CSV - add signals to the selected channel CSV file")
             print("=" * 60)
             
+            last_status_ts = None  # Status line is redrawn once per second, not every 10ms tick
+            
             while True:
                 # Get current time
                 current_time = get_user_time()
-                current_time_str = current_time.strftime('%H:%M:%S')
+                current_ts = int(current_time.timestamp())
                 
                 # Check for stop loss or take profit
                 should_stop, stop_reason = self.should_stop_trading()
@@ -5255,17 +5194,18 @@ class MultiAssetPreciseTrader:
                 signals = self.get_signals_from_csv()
                 
                 if not signals:
-                    current_date = current_time.strftime('%Y-%m-%d')
-                    current_time_hms = current_time.strftime('%H:%M:%S')
-                    status_line = f"{current_date} | {current_time_hms} | No signals available"
-                    print(f"\r{status_line:<100}", end="", flush=True)
-                    await asyncio.sleep(0.01)  # Check every 10ms
+                    if current_ts != last_status_ts:
+                        last_status_ts = current_ts
+                        current_date = current_time.strftime('%Y-%m-%d')
+                        current_time_hms = current_time.strftime('%H:%M:%S')
+                        status_line = f"{current_date} | {current_time_hms} | No signals available"
+                        print(f"\r{status_line:<100}", end="", flush=True)
+                    await self._wait_for_next_second()  # Wake on CSV change or at the next second
                     continue
                 
                 # Find next signal
                 for signal in signals:
-                    signal_time_str = signal['signal_datetime'].strftime('%H:%M:%S')
-                    asset = signal['asset']
+                    asset = signal.asset
                     
                     # Get payout for this asset
                     payout = self.get_asset_payout(asset)
@@ -5288,24 +5228,27 @@ class MultiAssetPreciseTrader:
                                 payout = self.asset_payouts[similar[0]]
                                 payout_display = f"{payout:.1f}%"
                     
-                    # Show current time and signal time with payout
-                    current_date = current_time.strftime('%Y-%m-%d')
-                    current_time_hms = current_time.strftime('%H:%M:%S')
-                    signal_time_hms = signal['signal_datetime'].strftime('%H:%M:%S')
-                    time_remaining = format_time_remaining(current_time, signal['signal_datetime'])
-                    
-                    # Clear line and show clean status with payout
-                    status_line = f"{current_date} | {current_time_hms} | {signal_time_hms} | {time_remaining} | {asset} {signal['direction'].upper()} | Payout: {payout_display}"
-                    print(f"\r{status_line:<100}", end="", flush=True)
+                    # Show current time and signal time with payout (once per second)
+                    if current_ts != last_status_ts:
+                        last_status_ts = current_ts
+                        current_date = current_time.strftime('%Y-%m-%d')
+                        current_time_hms = current_time.strftime('%H:%M:%S')
+                        signal_time_hms = signal.signal_datetime.strftime('%H:%M:%S')
+                        time_remaining = format_time_remaining(current_time, signal.signal_datetime)
+                        
+                        # Clear line and show clean status with payout
+                        status_line = f"{current_date} | {current_time_hms} | {signal_time_hms} | {time_remaining} | {asset} {signal.direction.upper()} | Payout: {payout_display}"
+                        print(f"\r{status_line:<100}", end="", flush=True)
                     
-                    # Execute when times match exactly
-                    if current_time_str == signal_time_str:
-                        print(f"\n🎯 EXECUTING: {signal['asset']} {signal['direction'].upper()} at {signal_time_str}")
+                    # Execute when times match exactly (same epoch second)
+                    if current_ts == signal.execute_ts:
+                        signal_time_str = signal.signal_datetime.strftime('%H:%M:%S')
+                        print(f"\n🎯 EXECUTING: {signal.asset} {signal.direction.upper()} at {signal_time_str}")
                         
                         # Execute trade using 3-cycle 2-step strategy
                         try:
                             won, profit, action = await self.execute_single_3cycle_2step_trade(
-                                signal['asset'], signal['direction'], base_amount, strategy, signal.get('channel')
+                                signal.asset, signal.direction, base_amount, strategy, signal.channel
                             )
                             
                             # Handle skipped trades - don't update profit or count
@@ -5319,19 +5262,19 @@ class MultiAssetPreciseTrader:
                             
                             # Show result
                             result_emoji = "✅" if won else "❌"
-                            print(f"{result_emoji} {signal['asset']} {'WIN' if won else 'LOSS'} - ${profit:+.2f}")
+                            print(f"{result_emoji} {signal.asset} {'WIN' if won else 'LOSS'} - ${profit:+.2f}")
                             
                             # Handle the action result for 2-step progression
                             if action == 'continue':
                                 # Need to execute next step immediately
-                                current_step = strategy.get_asset_step(signal['asset'])
-                                print(f"⚡ CONTINUING TO STEP {current_step} for {signal['asset']}")
+                                current_step = strategy.get_asset_step(signal.asset)
+                                print(f"⚡ CONTINUING TO STEP {current_step} for {signal.asset}")
                                 await asyncio.sleep(0.01)  # 10ms delay
                                 
                                 # Execute next step immediately
                                 try:
                                     won2, profit2, action2 = await self.execute_single_3cycle_2step_trade(
-                                        signal['asset'], signal['direction'], base_amount, strategy, signal.get('channel')
+                                        signal.asset, signal.direction, base_amount, strategy, signal.channel
                                     )
                                     
                                     # Update session profit
@@ -5340,8 +5283,8 @@ class MultiAssetPreciseTrader:
                                     
                                     # Show result
                                     result_emoji2 = "✅" if won2 else "❌"
-                                    current_step2 = strategy.get_asset_step(signal['asset']) - 1  # Previous step
-                                    print(f"{result_emoji2} {signal['asset']} STEP {current_step2} {'WIN' if won2 else 'LOSS'} - ${profit2:+.2f}")
+                                    current_step2 = strategy.get_asset_step(signal.asset) - 1  # Previous step
+                                    print(f"{result_emoji2} {signal.asset} STEP {current_step2} {'WIN' if won2 else 'LOSS'} - ${profit2:+.2f}")
                                     
                                 except Exception as e2:
                                     print(f"❌ Step 2 Error: {e2}")
@@ -5353,7 +5296,7 @@ class MultiAssetPreciseTrader:
                     
                     break  # Show only first signal
                 
-                await asyncio.sleep(0.01)  # Check every 10ms
+                await self._wait_for_next_second()  # Sleep to the next second boundary instead of polling every 10ms
                 
         except KeyboardInterrupt:
             print(f"\n\n🛑 3-CYCLE 2-STEP MARTINGALE TRADING STOPPED")
@@ -5403,7 +5346,7 @@ class MultiAssetPreciseTrader:
             strategy = MultiAssetMartingaleStrategy(base_amount, multiplier)
         
         session_trades = 0
-        processed_signals = set()  # Track processed signals to avoid duplicates
+        processed_signals: Dict[Tuple, None] = {}  # Processed signals in insertion order (bounded, avoids duplicates)
         
         try:
             # Show initial signal overview for the target date
@@ -5412,7 +5355,7 @@ class MultiAssetPreciseTrader:
             if initial_signals:
                 print(f"✅ Found {len(initial_signals)} signals for {target_date}:")
                 for i, signal in enumerate(initial_signals[:10]):  # Show first 10
-                    print(f"   {i+1}. {signal['asset']} {signal['direction'].upper()} at {signal['signal_time']}")
+                    print(f"   {i+1}. {signal.asset} {signal.direction.upper()} at {signal.signal_time}")
                 if len(initial_signals) > 10:
                     print(f"   ... and {len(initial_signals) - 10} more signals")
             else:
@@ -5439,49 +5382,42 @@ class MultiAssetPreciseTrader:
                 # Check for exact time match with signals from target date
                 current_time = get_user_time()
                 current_time_str = current_time.strftime('%H:%M:%S')
+                current_ts = int(current_time.timestamp())
                 ready_signals = []
                 
                 print(f"⏰ CURRENT TIME: {current_time_str} | TARGET DATE: {target_date}")
                 
-                for signal in signals:
+                # Only this tick's bucket can match exactly
+                for signal in self.get_signals_due(current_ts):
                     # Create unique signal ID
-                    signal_id = f"{signal['asset']}_{signal['direction']}_{signal['signal_time']}_{target_date}"
+                    signal_id = (signal.asset, signal.direction, signal.signal_time, target_date)
                     
                     # Skip if already processed
                     if signal_id in processed_signals:
                         continue
                     
-                    signal_time_hms = signal['signal_datetime'].strftime('%H:%M:%S')
-                    
-                    # Check for EXACT time match
-                    if current_time_str == signal_time_hms:
-                        print(f"🎯 EXACT TIME MATCH: {signal['asset']} {signal['direction'].upper()} at {signal_time_hms}")
-                        ready_signals.append(signal)
-                        processed_signals.add(signal_id)
+                    print(f"🎯 EXACT TIME MATCH: {signal.asset} {signal.direction.upper()} at {current_time_str}")
+                    ready_signals.append(signal)
+                    mark_processed(processed_signals, signal_id)
                 
                 if not ready_signals:
                     # Show next upcoming signal
                     future_signals = []
                     for signal in signals:
-                        signal_id = f"{signal['asset']}_{signal['direction']}_{signal['signal_time']}_{target_date}"
+                        signal_id = (signal.asset, signal.direction, signal.signal_time, target_date)
                         if signal_id not in processed_signals:
-                            # Calculate time until signal (using current date but signal time)
-                            signal_today = current_time.replace(
-                                hour=signal['signal_datetime'].hour,
-                                minute=signal['signal_datetime'].minute,
-                                second=signal['signal_datetime'].second
-                            )
-                            time_until = (signal_today - current_time).total_seconds()
+                            # Whole seconds until the signal (signals are built for today's date)
+                            time_until = signal.execute_ts - current_ts
                             if time_until > 0:
                                 future_signals.append((signal, time_until))
                     
                     if future_signals:
-                        next_signal, next_wait = min(future_signals, key=lambda x: x[1])
-                        wait_minutes = int(next_wait // 60)
-                        wait_seconds = int(next_wait % 60)
-                        print(f"⏰ Next signal: {next_signal['asset']} {next_signal['direction'].upper()} at {next_signal['signal_time']} (in {wait_minutes}m {wait_seconds}s)")
-                    
-                    await asyncio.sleep(1)  # Check every second
+                        next_signal, next_wait = future_signals[0]  # Signals are scanned in execution order
+                        wait_minutes, wait_seconds = divmod(int(next_wait), 60)
+                        print(f"⏰ Next signal: {next_signal.asset} {next_signal.direction.upper()} at {next_signal.signal_time} (in {wait_minutes}m {wait_seconds}s)")
+                        await self._wait_for_next_signal(next_wait)
+                    else:
+                        await asyncio.sleep(1)  # Check every second
                     continue
                 
                 # Process ready signals
@@ -5490,11 +5426,11 @@ class MultiAssetPreciseTrader:
                     print("=" * 50)
                     
                     for signal in ready_signals:
-                        asset = signal['asset']
-                        direction = signal['direction']
+                        asset = signal.asset
+                        direction = signal.direction
                         
                         print(f"📊 {asset} {direction.upper()} - {strategy.get_status(asset) if hasattr(strategy, 'get_status') else 'Ready'}")
-                        print(f"⏰ Signal: {signal['signal_time']} | Date: {target_date}")
+                        print(f"⏰ Signal: {signal.signal_time} | Date: {target_date}")
                         
                         # Execute trade based on strategy type
                         try:
@@ -5502,19 +5438,19 @@ class MultiAssetPreciseTrader:
                                 # Execute single trade in sequence
                                 if strategy_type == "2step":
                                     won, profit, action = await self.execute_single_2step_trade(
-                                        asset, direction, base_amount, strategy, signal.get('channel')
+                                        asset, direction, base_amount, strategy, signal.channel
                                     )
                                 elif strategy_type == "3step":
                                     won, profit, action = await self.execute_single_3step_trade(
-                                        asset, direction, base_amount, strategy, signal.get('channel')
+                                        asset, direction, base_amount, strategy, signal.channel
                                     )
                                 elif strategy_type == "4cycle":
                                     won, profit, action = await self.execute_single_4cycle_trade(
-                                        asset, direction, base_amount, strategy, signal.get('channel')
+                                        asset, direction, base_amount, strategy, signal.channel
                                     )
                                 elif strategy_type == "5cycle":
                                     won, profit, action = await self.execute_single_5cycle_trade(
-                                        asset, direction, base_amount, strategy, signal.get('channel')
+                                        asset, direction, base_amount, strategy, signal.channel
                                     )
                                 
                                 # Update session profit
@@ -5534,19 +5470,19 @@ class MultiAssetPreciseTrader:
                                     try:
                                         if strategy_type == "2step":
                                             won2, profit2, action2 = await self.execute_single_2step_trade(
-                                                asset, direction, base_amount, strategy, signal.get('channel')
+                                                asset, direction, base_amount, strategy, signal.channel
                                             )
                                         elif strategy_type == "3step":
                                             won2, profit2, action2 = await self.execute_single_3step_trade(
-                                                asset, direction, base_amount, strategy, signal.get('channel')
+                                                asset, direction, base_amount, strategy, signal.channel
                                             )
                                         elif strategy_type == "4cycle":
                                             won2, profit2, action2 = await self.execute_single_4cycle_trade(
-                                                asset, direction, base_amount, strategy, signal.get('channel')
+                                                asset, direction, base_amount, strategy, signal.channel
                                             )
                                         elif strategy_type == "5cycle":
                                             won2, profit2, action2 = await self.execute_single_5cycle_trade(
-                                                asset, direction, base_amount, strategy, signal.get('channel')
+                                                asset, direction, base_amount, strategy, signal.channel
                                             )
                                         
                                         # Update session profit for next step
@@ -5563,7 +5499,7 @@ class MultiAssetPreciseTrader:
                                             await asyncio.sleep(0.01)  # 10ms delay
                                             
                                             won3, profit3, action3 = await self.execute_single_3step_trade(
-                                                asset, direction, base_amount, strategy, signal.get('channel')
+                                                asset, direction, base_amount, strategy, signal.channel
                                             )
                                             
                                             self.update_session_profit(profit3)
@@ -5577,7 +5513,7 @@ class MultiAssetPreciseTrader:
                             else:
                                 # Execute complete martingale sequence
                                 final_won, total_profit = await self.execute_complete_martingale_sequence(
-                                    asset, direction, base_amount, strategy, signal.get('channel')
+                                    asset, direction, base_amount, strategy, signal.channel
                                 )
                                 
                                 # Update session profit
@@ -5593,14 +5529,18 @@ class MultiAssetPreciseTrader:
                             print(f"❌ Trade error for {asset}: {trade_error}")
                         
                         # Show session stats
-                        wins = len([t for t in self.trade_history if t['result'] == 'win'])
-                        losses = len([t for t in self.trade_history if t['result'] == 'loss'])
+                        wins = self._wins
+                        losses = self._losses
                         
-                        print(f"\n📊 TRADING SESSION:")
-                        print(f"   💰 {self.get_session_status()}")
-                        print(f"   📈 Total Trades: {session_trades}")
-                        print(f"   🏆 Results: {wins}W/{losses}L")
-                        print(f"   📅 Target Date: {target_date}")
+                        if self.verbose:
+                            # One buffered write for the whole block instead of a print per line
+                            sys.stdout.write("\n".join((
+                                "\n📊 TRADING SESSION:",
+                                f"   💰 {self.get_session_status()}",
+                                f"   📈 Total Trades: {session_trades}",
+                                f"   🏆 Results: {wins}W/{losses}L",
+                                f"   📅 Target Date: {target_date}",
+                            )) + "\n")
                         
                         # Check stop conditions
                         should_stop, stop_reason = self.should_stop_trading()
@@ -5618,8 +5558,8 @@ class MultiAssetPreciseTrader:
         
         # Final stats
         total_trades = len(self.trade_history)
-        total_wins = len([t for t in self.trade_history if t['result'] == 'win'])
-        total_losses = len([t for t in self.trade_history if t['result'] == 'loss'])
+        total_wins = self._wins
+        total_losses = self._losses
         
         print(f"\n📊 FINAL STATISTICS:")
         print(f"   💰 {self.get_session_status()}")
@@ -5644,6 +5584,10 @@ class MultiAssetPreciseTrader:
                     remaining_profit = self.take_profit - self.session_profit
                     print(f"   🎯 Take Profit: ${remaining_profit:.2f} to go")
 
+# Finite decimal numbers accepted at the numeric prompts - signed ("+6", "-5.5") and exponent forms
+# as float() takes them (checked before float() so typos never raise)
+_NUMBER_RE = re.compile(r'[+-]?(?:\d+(?:\.\d*)?|\.\d+)(?:[eE][+-]?\d+)?')
+
 def get_timezone_from_user() -> float:
     """Get timezone offset from user input"""
     print("🌍 TIMEZONE CONFIGURATION")
@@ -5660,18 +5604,93 @@ def get_timezone_from_user() -> float:
     while True:
         try:
             timezone_input = input("Enter timezone offset (e.g., 6.0 for UTC+6): ").strip()
+            if not _NUMBER_RE.fullmatch(timezone_input):
+                print("❌ Invalid input. Please enter a number (e.g., 6.0)")
+                continue
             timezone_offset = float(timezone_input)
             
             if -12.0 <= timezone_offset <= 14.0:
                 return timezone_offset
             else:
                 print("❌ Invalid timezone offset. Please enter a value between -12.0 and +14.0")
-        except ValueError:
-            print("❌ Invalid input. Please enter a number (e.g., 6.0)")
         except KeyboardInterrupt:
             print("\n👋 Timezone configuration cancelled!")
             exit(0)
 
+def prompt_choice(message: str, options: Dict[str, Any], error: str) -> Any:
+    """Prompt until the input is one of the option keys; returns that option's value"""
+    while True:
+        choice = input(message).strip()
+        if choice in options:
+            return options[choice]
+        print(error)
+
+def prompt_yes(message: str) -> bool:
+    """(Y/n) prompt: yes unless the answer starts with n/N (blank means yes)"""
+    return input(message).lstrip()[:1] not in ('n', 'N')
+
+def prompt_float(message: str, too_small: str, minimum: float = 0.0, defaults: Dict[str, Any] = None) -> Any:
+    """Prompt until a number above minimum is entered; inputs listed in defaults return their mapped value"""
+    while True:
+        text = input(message).strip()
+        if defaults and text in defaults:
+            return defaults[text]
+        if not _NUMBER_RE.fullmatch(text):
+            print("   ❌ Please enter a valid number")
+            continue
+        value = float(text)
+        if value <= minimum:
+            print(f"   ❌ {too_small}")
+            continue
+        return value
+
+# Strategy menu shown on every pass of main()'s loop - written in one call instead of a print per line
+STRATEGY_MENU = """
+📋 TRADING STRATEGY MENU:
+========================================
+1️⃣  Option 1: 2-Cycle 3-Step Martingale
+    • 2 cycles × 3 steps = up to 6 trades
+    • Step 4 (C2S1) = sum of first 3 steps
+    • LOSS at final step → Next ASSET starts at next cycle
+    • WIN at any step → All assets reset to Cycle 1
+    • Cross-asset cycle progression
+
+2️⃣  Option 2: 3-Cycle 2-Step Martingale
+    • 3 cycles × 2 steps = up to 6 trades
+    • LOSS at Step 2 → Next ASSET starts at next cycle
+    • WIN at any step → All assets reset to Cycle 1
+    • Cross-asset cycle progression
+
+0️⃣  Exit
+========================================
+"""
+
+# Static setup/preview text, built once at import instead of on every pass of main()'s loop
+SETUP_HEADER = """
+📋 TRADING SETUP:
+========================================
+1. Channel Selection:
+   Available channels:
+   1) PO Advance Bot (1:00 trades)
+"""
+
+CYCLE_LOGIC_3STEP = (
+    "\n🔄 Cross-Asset Cycle Logic:",
+    "   • WIN at any step → All assets reset to C1S1",
+    "   • LOSS at Step 1 → Move to Step 2 (same asset)",
+    "   • LOSS at Step 2 → Move to Step 3 (same asset)",
+    "   • LOSS at Step 3 → NEXT asset starts at next cycle",
+    "   • Example: EURJPY loses C1S3 → GBPUSD starts at C2S1",
+)
+
+CYCLE_LOGIC_2STEP = (
+    "\n🔄 Cross-Asset Cycle Logic:",
+    "   • WIN at any step → All assets reset to C1S1",
+    "   • LOSS at Step 1 → Move to Step 2 (same asset)",
+    "   • LOSS at Step 2 → NEXT asset starts at next cycle",
+    "   • Example: EURJPY loses C1S2 → GBPUSD starts at C2S1",
+)
+
 async def main():
     """Main application with timezone configuration and trading strategy options"""
     print("=" * 80)
@@ -5688,23 +5707,7 @@ async def main():
     print("=" * 80)
     
     while True:
-        print("\n📋 TRADING STRATEGY MENU:")
-        print("=" * 40)
-        print("1️⃣  Option 1: 2-Cycle 3-Step Martingale")
-        print("    • 2 cycles × 3 steps = up to 6 trades")
-        print("    • Step 4 (C2S1) = sum of first 3 steps")
-        print("    • LOSS at final step → Next ASSET starts at next cycle")
-        print("    • WIN at any step → All assets reset to Cycle 1")
-        print("    • Cross-asset cycle progression")
-        print()
-        print("2️⃣  Option 2: 3-Cycle 2-Step Martingale")
-        print("    • 3 cycles × 2 steps = up to 6 trades")
-        print("    • LOSS at Step 2 → Next ASSET starts at next cycle")
-        print("    • WIN at any step → All assets reset to Cycle 1")
-        print("    • Cross-asset cycle progression")
-        print()
-        print("0️⃣  Exit")
-        print("=" * 40)
+        sys.stdout.write(STRATEGY_MENU)
         
         try:
             strategy_choice = input("\n🎯 Select strategy (1, 2, or 0 to exit): ").strip()
@@ -5734,180 +5737,107 @@ async def main():
             use_option4 = False
             use_option5 = False
             
-            print("\n📋 TRADING SETUP:")
-            print("=" * 40)
-            
             # Get channel selection
-            print("1. Channel Selection:")
-            print("   Available channels:")
-            print("   1) PO Advance Bot (1:00 trades)")
-            
-            while True:
-                try:
-                    channel_choice = input("   Select channel (1): ").strip()
-                    if channel_choice == '1':
-                        active_channel = "po_advance_bot"
-                        channel_display = "PO Advance Bot (1:00 trades)"
-                        break
-                    else:
-                        print("   ❌ Please enter 1")
-                except ValueError:
-                    print("   ❌ Please enter 1")
+            sys.stdout.write(SETUP_HEADER)
             
+            active_channel, channel_display = prompt_choice(
+                "   Select channel (1): ", {'1': ("po_advance_bot", "PO Advance Bot (1:00 trades)")}, "   ❌ Please enter 1"
+            )
             print(f"   ✅ Selected: {channel_display}")
             
             # Get account type
             print("\n2. Account Type:")
-            account_choice = input("   Use DEMO account? (Y/n): ").lower().strip()
-            is_demo = account_choice != 'n'
+            is_demo = prompt_yes("   Use DEMO account? (Y/n): ")
             print(f"   ✅ {'DEMO' if is_demo else 'REAL'} account selected")
             
             # Get base amount
             print("\n3. Base Amount:")
-            while True:
-                try:
-                    base_amount = float(input("   Enter base amount ($): $"))
-                    if base_amount <= 0:
-                        print("   ❌ Amount must be positive")
-                        continue
-                    print(f"   ✅ Base amount: ${base_amount}")
-                    break
-                except ValueError:
-                    print("   ❌ Please enter a valid number")
+            base_amount = prompt_float("   Enter base amount ($): $", "Amount must be positive")
+            print(f"   ✅ Base amount: ${base_amount}")
             
             # Get multiplier
             print("\n4. Multiplier:")
-            while True:
-                try:
-                    multiplier_input = input("   Enter multiplier (default 2.5): ").strip()
-                    if not multiplier_input:
-                        multiplier = 2.5
-                    else:
-                        multiplier = float(multiplier_input)
-                    
-                    if multiplier <= 1:
-                        print("   ❌ Multiplier must be greater than 1")
-                        continue
-                    print(f"   ✅ Multiplier: {multiplier}")
-                    break
-                except ValueError:
-                    print("   ❌ Please enter a valid number")
+            multiplier = prompt_float("   Enter multiplier (default 2.5): ", "Multiplier must be greater than 1",
+                                      minimum=1.0, defaults={'': 2.5})
+            print(f"   ✅ Multiplier: {multiplier}")
             
-            # Get stop loss
+            # Get stop loss (blank or 0 disables it)
             print(f"\n5. Stop Loss (Risk Management):")
-            while True:
-                try:
-                    stop_loss_input = input("   Enter stop loss in $ (0 to disable): $").strip()
-                    if not stop_loss_input or stop_loss_input == '0':
-                        stop_loss = None
-                        print("   ✅ Stop Loss: Disabled")
-                    else:
-                        stop_loss = float(stop_loss_input)
-                        if stop_loss <= 0:
-                            print("   ❌ Stop loss must be positive or 0 to disable")
-                            continue
-                        print(f"   ✅ Stop Loss: ${stop_loss:.2f}")
-                    break
-                except ValueError:
-                    print("   ❌ Please enter a valid number")
+            stop_loss = prompt_float("   Enter stop loss in $ (0 to disable): $", "Stop loss must be positive or 0 to disable",
+                                     defaults={'': None, '0': None})
+            print(f"   ✅ Stop Loss: ${stop_loss:.2f}" if stop_loss is not None else "   ✅ Stop Loss: Disabled")
             
-            # Get take profit
+            # Get take profit (blank or 0 disables it)
             print(f"\n6. Take Profit (Risk Management):")
-            while True:
-                try:
-                    take_profit_input = input("   Enter take profit in $ (0 to disable): $").strip()
-                    if not take_profit_input or take_profit_input == '0':
-                        take_profit = None
-                        print("   ✅ Take Profit: Disabled")
-                    else:
-                        take_profit = float(take_profit_input)
-                        if take_profit <= 0:
-                            print("   ❌ Take profit must be positive or 0 to disable")
-                            continue
-                        print(f"   ✅ Take Profit: ${take_profit:.2f}")
-                    break
-                except ValueError:
-                    print("   ❌ Please enter a valid number")
-            
-            # Show timing info with user's timezone
-            print(f"\n⏰ TIMING CONFIGURATION:")
-            print(f"   Timezone: {get_timezone_name()}")
-            print(f"   Current Time: {get_user_time_str()}")
-            print(f"   Precision: Millisecond-level timing")
-            print(f"   Execution Window: Within 10ms of signal time")
-            
-            # Show timing example based on selected channel
-            print(f"\n⏰ TIMING EXAMPLE ({channel_display}):")
-            example_signal = "00:38:00"
+            take_profit = prompt_float("   Enter take profit in $ (0 to disable): $", "Take profit must be positive or 0 to disable",
+                                       defaults={'': None, '0': None})
+            print(f"   ✅ Take Profit: ${take_profit:.2f}" if take_profit is not None else "   ✅ Take Profit: Disabled")
             
             if active_channel == "po_advance_bot":
                 duration_text = "1:00 duration"
             else:
                 duration_text = "1:00 duration"
+            example_signal = "00:38:00"
             
-            print(f"   Signal Time: {example_signal}:000 (exact second)")
-            print(f"   Execute: Within 0-10ms of {example_signal}:000")
-            print(f"   Duration: {duration_text}")
-            
-            
-            # Show strategy preview - Option 1: 2-Cycle 3-Step Martingale (formerly 3d)
-            c1s1 = base_amount
-            c1s2 = c1s1 * multiplier
-            c1s3 = c1s2 * multiplier
-            # Step 4 (C2S1) = sum of first 3 steps
-            c2s1 = c1s1 + c1s2 + c1s3
-            c2s2 = c2s1 * multiplier
-            c2s3 = c2s2 * multiplier
+            # Timing info, timing example, strategy preview and risk summary go out as one write
+            lines = [
+                # Show timing info with user's timezone
+                f"\n⏰ TIMING CONFIGURATION:",
+                f"   Timezone: {get_timezone_name()}",
+                f"   Current Time: {get_user_time_str()}",
+                f"   Precision: Millisecond-level timing",
+                f"   Execution Window: Within 10ms of signal time",
+                # Show timing example based on selected channel
+                f"\n⏰ TIMING EXAMPLE ({channel_display}):",
+                f"   Signal Time: {example_signal}:000 (exact second)",
+                f"   Execute: Within 0-10ms of {example_signal}:000",
+                f"   Duration: {duration_text}",
+            ]
             
             # Show strategy preview based on selected strategy
             if use_strategy == '2cycle_3step':
-                print(f"\n📊 STRATEGY PREVIEW (2-Cycle 3-Step Cross-Asset Martingale - {channel_display}):")
-                print(f"   Cycle 1: Step 1 ${c1s1:.2f} → Step 2 ${c1s2:.2f} → Step 3 ${c1s3:.2f}")
-                print(f"   Cycle 2: Step 1 ${c2s1:.2f} → Step 2 ${c2s2:.2f} → Step 3 ${c2s3:.2f}")
-                print(f"   Special Logic: Step 4 (C2S1) = Sum of first 3 steps (${c2s1:.2f})")
-                print(f"   Trade Duration: {duration_text}")
-                print(f"\n🔄 Cross-Asset Cycle Logic:")
-                print(f"   • WIN at any step → All assets reset to C1S1")
-                print(f"   • LOSS at Step 1 → Move to Step 2 (same asset)")
-                print(f"   • LOSS at Step 2 → Move to Step 3 (same asset)")
-                print(f"   • LOSS at Step 3 → NEXT asset starts at next cycle")
-                print(f"   • Example: EURJPY loses C1S3 → GBPUSD starts at C2S1")
+                # Option 1: 2-Cycle 3-Step Martingale (formerly 3d) - Step 4 (C2S1) = sum of first 3 steps
+                c1s1, c1s2, c1s3 = martingale_amounts(base_amount, multiplier, 3)
+                c2s1, c2s2, c2s3 = martingale_amounts(c1s1 + c1s2 + c1s3, multiplier, 3)
+                
+                lines += (
+                    f"\n📊 STRATEGY PREVIEW (2-Cycle 3-Step Cross-Asset Martingale - {channel_display}):",
+                    f"   Cycle 1: Step 1 ${c1s1:.2f} → Step 2 ${c1s2:.2f} → Step 3 ${c1s3:.2f}",
+                    f"   Cycle 2: Step 1 ${c2s1:.2f} → Step 2 ${c2s2:.2f} → Step 3 ${c2s3:.2f}",
+                    f"   Special Logic: Step 4 (C2S1) = Sum of first 3 steps (${c2s1:.2f})",
+                    f"   Trade Duration: {duration_text}",
+                    *CYCLE_LOGIC_3STEP,
+                )
             elif use_strategy == '3cycle_2step':
-                # Calculate 3-cycle 2-step amounts
-                c3_c1s1 = base_amount
-                c3_c1s2 = base_amount * multiplier
-                c3_c2s1 = base_amount * (multiplier ** 2)
-                c3_c2s2 = base_amount * (multiplier ** 3)
-                c3_c3s1 = base_amount * (multiplier ** 4)
-                c3_c3s2 = base_amount * (multiplier ** 5)
+                # Calculate 3-cycle 2-step amounts (one running product across all 6 steps)
+                c3_c1s1, c3_c1s2, c3_c2s1, c3_c2s2, c3_c3s1, c3_c3s2 = martingale_amounts(base_amount, multiplier, 6)
                 
-                print(f"\n📊 STRATEGY PREVIEW (3-Cycle 2-Step Cross-Asset Martingale - {channel_display}):")
-                print(f"   Cycle 1: Step 1 ${c3_c1s1:.2f} → Step 2 ${c3_c1s2:.2f}")
-                print(f"   Cycle 2: Step 1 ${c3_c2s1:.2f} → Step 2 ${c3_c2s2:.2f}")
-                print(f"   Cycle 3: Step 1 ${c3_c3s1:.2f} → Step 2 ${c3_c3s2:.2f}")
-                print(f"   Trade Duration: {duration_text}")
-                print(f"\n🔄 Cross-Asset Cycle Logic:")
-                print(f"   • WIN at any step → All assets reset to C1S1")
-                print(f"   • LOSS at Step 1 → Move to Step 2 (same asset)")
-                print(f"   • LOSS at Step 2 → NEXT asset starts at next cycle")
-                print(f"   • Example: EURJPY loses C1S2 → GBPUSD starts at C2S1")
+                lines += (
+                    f"\n📊 STRATEGY PREVIEW (3-Cycle 2-Step Cross-Asset Martingale - {channel_display}):",
+                    f"   Cycle 1: Step 1 ${c3_c1s1:.2f} → Step 2 ${c3_c1s2:.2f}",
+                    f"   Cycle 2: Step 1 ${c3_c2s1:.2f} → Step 2 ${c3_c2s2:.2f}",
+                    f"   Cycle 3: Step 1 ${c3_c3s1:.2f} → Step 2 ${c3_c3s2:.2f}",
+                    f"   Trade Duration: {duration_text}",
+                    *CYCLE_LOGIC_2STEP,
+                )
             
             # Show risk management summary
             if stop_loss is not None or take_profit is not None:
-                print(f"\n🛡️ RISK MANAGEMENT:")
+                lines.append(f"\n🛡️ RISK MANAGEMENT:")
                 if stop_loss is not None:
-                    print(f"   🛑 Stop Loss: ${stop_loss:.2f} (trading stops if loss reaches this)")
+                    lines.append(f"   🛑 Stop Loss: ${stop_loss:.2f} (trading stops if loss reaches this)")
                 if take_profit is not None:
-                    print(f"   🎯 Take Profit: ${take_profit:.2f} (trading stops if profit reaches this)")
+                    lines.append(f"   🎯 Take Profit: ${take_profit:.2f} (trading stops if profit reaches this)")
             
             # Confirm start
-            print(f"\n🚀 Ready to start trading!")
-            start = input("Start trading? (Y/n): ").lower().strip()
-            if start == 'n':
+            lines.append(f"\n🚀 Ready to start trading!")
+            sys.stdout.write("\n".join(lines) + "\n")
+            if not prompt_yes("Start trading? (Y/n): "):
                 continue
             
             # Initialize trader with stop loss, take profit, and active channel
-            trader = MultiAssetPreciseTrader(stop_loss=stop_loss, take_profit=take_profit)
+            trader = MultiAssetPreciseTrader(stop_loss=stop_loss, take_profit=take_profit,
+                                             verbose=os.getenv('VERBOSE', '1') != '0')
             trader.active_channel = active_channel  # Set the selected channel
             
             # Connect
@@ -5935,11 +5865,19 @@ async def main():
             continue
         
         # Ask if want to restart
-        restart = input("\nStart another trading session? (Y/n): ").lower().strip()
-        if restart == 'n':
+        if not prompt_yes("\nStart another trading session? (Y/n): "):
             break
     
     print("\n👋 Thank you for using PocketOption Automated Trader!")
 
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    # Use a libuv-based event loop when installed (optional): uvloop on Linux/macOS, winloop on Windows
+    try:
+        if sys.platform == 'win32':
+            import winloop as uvloop
+        else:
+            import uvloop
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    except ImportError:
+        pass
+    asyncio.run(main())
@@ -89,6 +89,7 @@ class AsyncPocketOptionClient:
         self._orders: Dict[str, OrderResult] = {}
         self._active_orders: Dict[str, OrderResult] = {}
         self._order_results: Dict[str, OrderResult] = {}
+        self._result_futures: Dict[str, asyncio.Future] = {}  # Awaiters for order results
         self._server_id_to_request_id: Dict[str, str] = {}  # Maps server deal IDs to client request IDs
         self._candles_cache: Dict[str, List[Candle]] = {}
         self._server_time: Optional[ServerTime] = None
@@ -574,6 +575,36 @@ class AsyncPocketOptionClient:
         # Not found
         return None
 
+    def register_result_future(self, order_id: str) -> asyncio.Future:
+        """
+        Get a future that resolves with the order's result once it completes
+
+        Args:
+            order_id: Order ID to wait for
+
+        Returns:
+            asyncio.Future: Resolves with the OrderResult (already resolved if the order has completed)
+        """
+        future = self._result_futures.get(order_id)
+        if future is None or future.done():
+            future = asyncio.get_running_loop().create_future()
+            if order_id in self._order_results:
+                future.set_result(self._order_results[order_id])
+            else:
+                self._result_futures[order_id] = future
+        return future
+
+    def discard_result_future(self, order_id: str) -> None:
+        """
+        Drop the pending result future for an order (e.g. after the caller stopped waiting)
+
+        Args:
+            order_id: Order ID whose future should be removed
+        """
+        future = self._result_futures.pop(order_id, None)
+        if future is not None and not future.done():
+            future.cancel()
+
     async def get_active_orders(self) -> List[OrderResult]:
         """
         Get all active orders
@@ -1319,6 +1350,11 @@ class AsyncPocketOptionClient:
                         self._order_results[active_order.order_id] = result
                         del self._active_orders[lookup_id]
                         
+                        # Wake anyone awaiting this order's result
+                        future = self._result_futures.pop(active_order.order_id, None)
+                        if future is not None and not future.done():
+                            future.set_result(result)
+                        
                         # Clean up the server ID mapping
                         if request_id and server_deal_id in self._server_id_to_request_id:
                             del self._server_id_to_request_id[server_deal_id]